@@ -1,111 +1,274 @@
 import sys
 import os
+import json
+import time
+import math
+import queue
+import threading
+import subprocess
 from datetime import datetime
 
+# 시작 단계별 소요 시간 출력 (--startup-timing 또는 SOLCUTTER_STARTUP_TIMING=1)
+STARTUP_T0 = time.perf_counter()
+STARTUP_TIMING = '--startup-timing' in sys.argv or os.environ.get('SOLCUTTER_STARTUP_TIMING') == '1'
+_startup_last = [STARTUP_T0]
+
+
+def startup_mark(phase):
+    if not STARTUP_TIMING:
+        return
+    now = time.perf_counter()
+    print(f"[startup] {phase:<20} +{(now - _startup_last[0]) * 1000:7.1f} ms"
+          f"  (누적 {(now - STARTUP_T0) * 1000:7.1f} ms)", file=sys.stderr, flush=True)
+    _startup_last[0] = now
+
 # ==========================================
 # [PyQt6 라이브러리]
 # ==========================================
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QFileDialog, 
-                             QSlider, QStyle, QMessageBox, QProgressBar, QFrame)
+                             QSlider, QStyle, QMessageBox, QProgressBar, QFrame, QComboBox,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QSpinBox,
+                             QListWidget, QCheckBox, QDialog, QDialogButtonBox, QFormLayout, QLineEdit)
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
-from PyQt6.QtCore import Qt, QUrl, QRect, QPoint, QSize, QThread, pyqtSignal, QSettings
-from PyQt6.QtGui import QPainter, QPen, QColor, QMouseEvent, QFontDatabase, QFont, QIcon
-
-# MoviePy 호환성 처리
-try:
-    from moviepy.editor import VideoFileClip
-except ImportError:
-    # MoviePy 2.0 이상 대응
-    try:
-        from moviepy import VideoFileClip
-    except ImportError:
-        # 린터 오류 방지용 더미 (실제 실행시엔 위에서 잡힘)
-        VideoFileClip = None 
-    
-from proglog import ProgressBarLogger
+from PyQt6.QtCore import (Qt, QUrl, QRect, QRectF, QPointF, QSize, QSizeF, QObject, QTimer,
+                          QElapsedTimer, QThread, pyqtSignal, QSettings)
+from PyQt6.QtGui import (QPainter, QPen, QColor, QMouseEvent, QFontDatabase, QFont, QIcon,
+                         QImage, QPixmap, QTransform, QShortcut, QKeySequence, QAction,
+                         QDragEnterEvent, QDropEvent)
+startup_mark("PyQt6 import")
+
+def engine():
+    """
+    내보내기 엔진은 처음 쓰는 시점에 import 한다 (창을 먼저 띄우기 위해).
+    창이 뜬 뒤에는 백그라운드 스레드에서 미리 불러 두므로 보통은 이미 로드되어 있다.
+    """
+    import solcutter_engine
+    return solcutter_engine
 
-# ==========================================
-# 1. 커스텀 로거
-# ==========================================
-class SolCutterLogger(ProgressBarLogger):
-    def __init__(self, update_callback):
-        super().__init__()
-        self.update_callback = update_callback
 
-    def bars_callback(self, bar, attr, value, old_value=None):
-        super().bars_callback(bar, attr, value, old_value)
-        if bar == 't' and attr == 'index':
-            if bar in self.bars:
-                total = self.bars[bar]['total']
-                if total > 0:
-                    percentage = int((value / total) * 100)
-                    self.update_callback(percentage)
+def prewarm_engine():
+    t0 = time.perf_counter()
+    engine()
+    if STARTUP_TIMING:
+        print(f"[startup] 엔진 import (백그라운드) {(time.perf_counter() - t0) * 1000:7.1f} ms",
+              file=sys.stderr, flush=True)
+
 
 # ==========================================
-# 2. 작업 처리 스레드
+# 1. 내보내기 대기열 (프로세스 풀 스케줄러)
 # ==========================================
-class ExportThread(QThread):
-    status_msg = pyqtSignal(str)
-    progress_val = pyqtSignal(int)
-    finished_signal = pyqtSignal()
+class ExportQueue(QObject):
+    """
+    작업을 순서대로 꺼내 최대 max_workers개의 워커 프로세스에서 동시에 실행한다.
+    작업 목록은 QSettings에 저장되어 프로그램을 다시 켜도 이어서 처리된다.
+    """
+    job_changed = pyqtSignal(int)   # 변경된 작업의 행 번호
+    jobs_reset = pyqtSignal()       # 행 추가/삭제로 목록 전체 갱신 필요
+    job_finished = pyqtSignal(dict)
 
-    def __init__(self, file_path, output_path, start_t, end_t, crop_rect, mode='video'):
-        super().__init__()
-        self.file_path = file_path
-        self.output_path = output_path
-        self.start_t = start_t
-        self.end_t = end_t
-        self.crop_rect = crop_rect 
-        self.mode = mode 
+    CANCEL_GRACE_SEC = 3.0
 
-    def run(self):
+    def __init__(self, settings, parent=None):
+        super().__init__(parent)
+        self.settings = settings
+        self.events = queue.Queue()  # 워커 출력을 읽는 스레드들이 (job_id, 종류, 값)을 넣음
+        self.running = {}  # job_id -> (process, 출력 읽는 스레드, 강제 종료 시각)
+        self.max_workers = int(self.settings.value("queue_workers", 2))
+        self.jobs = self.load_jobs()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(200)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start()
+
+    def load_jobs(self):
         try:
-            self.status_msg.emit("데이터 준비 중...")
-            if VideoFileClip is None:
-                raise ImportError("MoviePy 라이브러리가 설치되지 않았습니다.")
-                
-            clip = VideoFileClip(self.file_path)
-
-            end = self.end_t if self.end_t > 0 else clip.duration
-            end = min(end, clip.duration)
-            
-            subclip = clip.subclip(self.start_t, end)
-            my_logger = SolCutterLogger(self.progress_val.emit)
-
-            if self.mode == 'audio':
-                self.status_msg.emit("오디오 추출 중...")
-                if subclip.audio:
-                    subclip.audio.write_audiofile(self.output_path, logger=my_logger)
-            
-            elif self.mode == 'video':
-                if self.crop_rect:
-                    rx, ry, rw, rh = self.crop_rect
-                    w, h = subclip.size
-                    x1 = int(rx * w)
-                    y1 = int(ry * h)
-                    x2 = int((rx + rw) * w)
-                    y2 = int((ry + rh) * h)
-                    self.status_msg.emit("크롭 적용 중...")
-                    subclip = subclip.crop(x1=x1, y1=y1, x2=x2, y2=y2)
-
-                self.status_msg.emit("렌더링 시작...")
-                subclip.write_videofile(self.output_path, codec='libx264', audio_codec='aac', logger=my_logger)
-            
-            clip.close()
-            self.progress_val.emit(100)
-            self.status_msg.emit("완료!")
-            self.finished_signal.emit()
-            
-        except Exception as e:
-            self.status_msg.emit(f"에러: {str(e)}")
-            self.finished_signal.emit()
+            jobs = json.loads(self.settings.value("export_queue", "[]"))
+        except (TypeError, ValueError):
+            return []
+        for job in jobs:
+            # 지난 실행에서 끝나지 못한 작업은 다시 대기열로 (분할 인코딩이면 끝난 조각부터 이어서)
+            if job['state'] == 'running':
+                job['state'], job['progress'] = 'pending', 0
+        return jobs
+
+    def save_jobs(self):
+        self.settings.setValue("export_queue", json.dumps(self.jobs, ensure_ascii=False))
+
+    def set_max_workers(self, count):
+        self.max_workers = max(1, count)
+        self.settings.setValue("queue_workers", self.max_workers)
+
+    def add_job(self, job):
+        self.jobs.append(job)
+        self.save_jobs()
+        self.jobs_reset.emit()
+
+    def row_of(self, job_id):
+        return next((i for i, j in enumerate(self.jobs) if j['id'] == job_id), -1)
+
+    def has_active_jobs(self):
+        return any(j['state'] in ('pending', 'running') for j in self.jobs)
+
+    def cancel(self, row):
+        job = self.jobs[row]
+        if job['state'] == 'pending':
+            self._set_state(row, 'canceled', "취소됨")
+        elif job['state'] == 'running' and job['id'] in self.running:
+            process, reader, _ = self.running[job['id']]
+            self._send_cancel(process)
+            self.running[job['id']] = (process, reader, time.monotonic() + self.CANCEL_GRACE_SEC)
+            job['message'] = "취소 중..."
+            self.job_changed.emit(row)
+
+    def retry(self, row):
+        if self.jobs[row]['state'] in ('error', 'canceled', 'done'):
+            self.jobs[row]['progress'] = 0
+            self.jobs[row].pop('stats', None)
+            self._set_state(row, 'pending', "")
+
+    def clear_finished(self):
+        self.jobs = [j for j in self.jobs if j['state'] in ('pending', 'running')]
+        self.save_jobs()
+        self.jobs_reset.emit()
+
+    def _set_state(self, row, state, message=None):
+        job = self.jobs[row]
+        job['state'] = state
+        if message is not None:
+            job['message'] = message
+        self.save_jobs()
+        self.job_changed.emit(row)
+        if state in ('done', 'error', 'canceled'):
+            self.job_finished.emit(job)
+
+    def poll(self):
+        # 출력을 끝까지 읽은 (= 종료된) 워커를 먼저 확인하고 큐를 비워야 마지막 이벤트를 놓치지 않음
+        exited = [job_id for job_id, (_, reader, _) in self.running.items() if not reader.is_alive()]
+        self._drain_events()
+
+        for job_id in exited:
+            process, _, _ = self.running.pop(job_id)
+            process.wait()
+            row = self.row_of(job_id)
+            if row >= 0 and self.jobs[row]['state'] == 'running':
+                self._set_state(row, 'error', f"워커 프로세스가 비정상 종료되었습니다 (코드 {process.returncode})")
+
+        now = time.monotonic()
+        for job_id, (process, reader, deadline) in list(self.running.items()):
+            if deadline is not None and now > deadline and process.poll() is None:
+                process.terminate()
+                row = self.row_of(job_id)
+                if row >= 0:
+                    # 워커가 정리하지 못했으므로 만들다 만 임시 파일은 여기서 삭제
+                    try:
+                        process.wait(1.0)
+                    except subprocess.TimeoutExpired:
+                        pass
+                    engine().remove_partial_outputs(self.jobs[row])
+                    self._set_state(row, 'canceled', "취소됨")
+
+        self._schedule()
+
+    def _drain_events(self):
+        while True:
+            try:
+                job_id, kind, value = self.events.get_nowait()
+            except queue.Empty:
+                return
+            row = self.row_of(job_id)
+            # 강제 종료로 이미 정리된 작업이 뒤늦게 보낸 이벤트는 무시
+            if row < 0 or self.jobs[row]['state'] != 'running':
+                continue
+            job = self.jobs[row]
+            if kind == 'progress':
+                job['progress'] = value
+                self.job_changed.emit(row)
+            elif kind == 'stats':
+                job['stats'] = value
+                self.job_changed.emit(row)
+            elif kind == 'status':
+                job['message'] = value
+                self.job_changed.emit(row)
+            elif kind == 'done':
+                job['progress'] = 100
+                self._set_state(row, 'done', "완료!")
+            elif kind == 'canceled':
+                self._set_state(row, 'canceled', "취소됨")
+            elif kind == 'error':
+                self._set_state(row, 'error', f"에러: {value}")
+
+    def _schedule(self):
+        for row, job in enumerate(self.jobs):
+            if len(self.running) >= self.max_workers:
+                break
+            if job['state'] != 'pending':
+                continue
+            try:
+                process = self._start_worker(job)
+            except OSError as e:
+                self._set_state(row, 'error', f"워커 프로세스를 시작할 수 없습니다: {e}")
+                continue
+            reader = threading.Thread(target=self._read_events, args=(process.stdout,), daemon=True)
+            reader.start()
+            self.running[job['id']] = (process, reader, None)
+            self._set_state(row, 'running', "시작 대기...")
+
+    def _start_worker(self, job):
+        """엔진 워커를 띄운다. 작업은 표준 입력 첫 줄로 넘기고, 취소는 같은 파이프에 cancel 줄을 보낸다."""
+        flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        process = subprocess.Popen(engine().export_worker_command(), stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE, creationflags=flags)
+        process.stdin.write((json.dumps(job) + "\n").encode('utf-8'))
+        process.stdin.flush()
+        return process
+
+    def _read_events(self, stream):
+        for line in stream:
+            try:
+                self.events.put(tuple(json.loads(line)))
+            except ValueError:
+                continue
+        stream.close()
+
+    @staticmethod
+    def _send_cancel(process):
+        try:
+            process.stdin.write(b"cancel\n")
+            process.stdin.flush()
+        except OSError:
+            pass  # 이미 끝난 워커
+
+    def shutdown(self):
+        """창을 닫을 때 호출. 실행 중이던 작업은 다음 실행 때 다시 시작된다."""
+        self.timer.stop()
+        for process, _, _ in self.running.values():
+            self._send_cancel(process)
+        deadline = time.monotonic() + self.CANCEL_GRACE_SEC
+        for process, _, _ in self.running.values():
+            try:
+                process.wait(max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.terminate()
+        self.running.clear()
+        self.save_jobs()
 
 # ==========================================
-# 3. 비디오 & 오버레이 시스템 (수정됨)
+# 2. 비디오 & 오버레이 시스템 (수정됨)
 # ==========================================
 class CropOverlay(QWidget):
+    """
+    크롭 영역은 위젯 좌표가 아니라 '실제 영상' 기준 비율(0~1)로 보관한다.
+    QVideoWidget은 비율을 유지하며 레터박스를 넣으므로, 영상 해상도를 알면
+    위젯 안에서 영상이 실제로 그려지는 사각형을 계산해서 그 기준으로 변환한다.
+    """
+    rect_changed = pyqtSignal()
+
+    # 비율 고정 옵션: (표시 이름, 가로/세로 비율 또는 None)
+    ASPECT_RATIOS = (("자유", None), ("16:9", 16 / 9), ("9:16", 9 / 16), ("1:1", 1.0))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # 마우스 이벤트를 받기 위해 투명하지만 윈도우처럼 동작하게 설정
@@ -114,28 +277,125 @@ class CropOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False) 
         self.setStyleSheet("background: transparent;")
         
-        self.origin = QPoint()
-        self.rect_geometry: QRect | None = None
+        self.origin = QPointF()
+        self.norm_rect: QRectF | None = None
         self.drawing = False
         self.crop_enabled = False
+        self.video_size = QSize()   # 회전까지 반영된 원본 해상도 (모르면 빈 값)
+        self.aspect_ratio = None
+        self.snap_even = True
+
+    def set_video_size(self, size: QSize):
+        if size != self.video_size:
+            self.video_size = size
+            self.update()
+
+    def set_aspect_ratio(self, ratio):
+        self.aspect_ratio = ratio
+        if self.norm_rect is not None:
+            self.norm_rect = self.fit_aspect(self.norm_rect)
+            self.finish_rect()
+
+    def set_snap_even(self, enabled):
+        self.snap_even = enabled
+        if self.norm_rect is not None:
+            self.finish_rect()
 
     def set_mode(self, enabled):
         self.crop_enabled = enabled
         if enabled:
             # 활성화 시 중앙에 힌트 박스 표시 (사용자가 인식하기 쉽게)
-            w, h = self.width(), self.height()
-            if w > 0 and h > 0:
-                self.rect_geometry = QRect(int(w*0.3), int(h*0.3), int(w*0.4), int(h*0.4))
+            self.norm_rect = self.fit_aspect(QRectF(0.3, 0.3, 0.4, 0.4))
+            self.finish_rect()
+        else:
+            self.norm_rect = None
+            self.rect_changed.emit()
+        self.update()
+
+    # ----- 좌표 변환 -----
+    def video_rect(self) -> QRectF:
+        """위젯 안에서 영상이 실제로 그려지는 영역 (레터박스 제외)"""
+        w, h = self.width(), self.height()
+        if self.video_size.isEmpty() or w == 0 or h == 0:
+            return QRectF(0, 0, w, h)
+        vw, vh = self.video_size.width(), self.video_size.height()
+        scale = min(w / vw, h / vh)
+        dw, dh = vw * scale, vh * scale
+        return QRectF((w - dw) / 2, (h - dh) / 2, dw, dh)
+
+    def to_norm(self, pos: QPointF) -> QPointF:
+        vr = self.video_rect()
+        if vr.width() <= 0 or vr.height() <= 0:
+            return QPointF()
+        x = min(max((pos.x() - vr.x()) / vr.width(), 0.0), 1.0)
+        y = min(max((pos.y() - vr.y()) / vr.height(), 0.0), 1.0)
+        return QPointF(x, y)
+
+    def to_widget(self, rect: QRectF) -> QRectF:
+        vr = self.video_rect()
+        return QRectF(vr.x() + rect.x() * vr.width(), vr.y() + rect.y() * vr.height(),
+                      rect.width() * vr.width(), rect.height() * vr.height())
+
+    def pixel_aspect(self):
+        """정규화 좌표에서 가로 1.0이 세로 몇 배의 픽셀인지"""
+        if self.video_size.isEmpty():
+            return self.width() / self.height() if self.height() else 1.0
+        return self.video_size.width() / self.video_size.height()
+
+    def fit_aspect(self, rect: QRectF) -> QRectF:
+        """비율 고정이 켜져 있으면 같은 중심에서 비율에 맞게 줄인다"""
+        if self.aspect_ratio is None:
+            return rect
+        px = self.pixel_aspect()
+        w, h = rect.width(), rect.height()
+        if w * px / max(h, 1e-9) > self.aspect_ratio:
+            w = h * self.aspect_ratio / px
         else:
-            self.rect_geometry = None
+            h = w * px / self.aspect_ratio
+        c = rect.center()
+        return QRectF(c.x() - w / 2, c.y() - h / 2, w, h)
+
+    def rect_from_drag(self, origin: QPointF, current: QPointF) -> QRectF:
+        dx, dy = current.x() - origin.x(), current.y() - origin.y()
+        if self.aspect_ratio is not None:
+            px = self.pixel_aspect()
+            # 끌어온 방향으로 비율을 유지하되 영상 밖으로는 나가지 않게
+            max_w = origin.x() if dx < 0 else 1.0 - origin.x()
+            max_h = origin.y() if dy < 0 else 1.0 - origin.y()
+            w, h = abs(dx), abs(dy)
+            if w * px > h * self.aspect_ratio:
+                h = w * px / self.aspect_ratio
+            else:
+                w = h * self.aspect_ratio / px
+            shrink = min(1.0, max_w / w if w else 1.0, max_h / h if h else 1.0)
+            dx = w * shrink * (1 if dx >= 0 else -1)
+            dy = h * shrink * (1 if dy >= 0 else -1)
+        return QRectF(origin, QPointF(origin.x() + dx, origin.y() + dy)).normalized()
+
+    def snapped(self, rect: QRectF) -> QRectF:
+        """원본 픽셀 기준 짝수 좌표/크기로 맞춤 (내보내기 결과와 화면이 정확히 일치)"""
+        if not self.snap_even or self.video_size.isEmpty():
+            return rect
+        vw, vh = self.video_size.width(), self.video_size.height()
+        x = int(rect.x() * vw) & ~1
+        y = int(rect.y() * vh) & ~1
+        w = max(2, min(int(rect.width() * vw), vw - x) & ~1)
+        h = max(2, min(int(rect.height() * vh), vh - y) & ~1)
+        return QRectF(x / vw, y / vh, w / vw, h / vh)
+
+    def finish_rect(self):
+        if self.norm_rect is not None:
+            self.norm_rect = self.snapped(self.norm_rect.intersected(QRectF(0, 0, 1, 1)))
         self.update()
+        self.rect_changed.emit()
 
+    # ----- 마우스 -----
     def mousePressEvent(self, event: QMouseEvent):
         if not self.crop_enabled: return 
         
         if event.button() == Qt.MouseButton.LeftButton:
-            self.origin = event.position().toPoint()
-            self.rect_geometry = QRect(self.origin, QSize())
+            self.origin = self.to_norm(event.position())
+            self.norm_rect = QRectF(self.origin, QSizeF())
             self.drawing = True
             self.update()
 
@@ -143,44 +403,61 @@ class CropOverlay(QWidget):
         if not self.crop_enabled: return
 
         if self.drawing:
-            # 현재 마우스 위치까지 사각형 갱신
-            current_pos = event.position().toPoint()
-            self.rect_geometry = QRect(self.origin, current_pos).normalized()
+            # 현재 마우스 위치까지 사각형 갱신 (영상 영역 밖은 잘라냄)
+            self.norm_rect = self.rect_from_drag(self.origin, self.to_norm(event.position()))
             self.update()
+            self.rect_changed.emit()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         if not self.crop_enabled: return
 
         if event.button() == Qt.MouseButton.LeftButton:
             self.drawing = False
-            if self.rect_geometry is not None:
+            if self.norm_rect is not None:
                 # 너무 작은 사각형은 취소 (오클릭 방지)
-                if self.rect_geometry.width() < 10 or self.rect_geometry.height() < 10:
-                    self.rect_geometry = None
-            self.update()
+                r = self.to_widget(self.norm_rect)
+                if r.width() < 10 or r.height() < 10:
+                    self.norm_rect = None
+            self.finish_rect()
 
     def paintEvent(self, event):
         # 모드가 켜져있고 사각형이 있을 때만 그림
-        if self.crop_enabled and self.rect_geometry is not None:
+        if self.crop_enabled and self.norm_rect is not None:
             painter = QPainter(self)
             # 펜: 빨간색 실선, 두께 3
             pen = QPen(Qt.GlobalColor.red, 3, Qt.PenStyle.SolidLine)
             painter.setPen(pen)
             # 브러시: 빨간색인데 투명도 30% (내부가 살짝 비침)
             painter.setBrush(QColor(255, 0, 0, 50))
-            painter.drawRect(self.rect_geometry)
+            painter.drawRect(self.to_widget(self.norm_rect))
+
+    def set_normalized_rect(self, rect):
+        """실행 취소/프로젝트 열기로 저장해 둔 영역을 그대로 복원 (비율/짝수 맞춤 없이)"""
+        self.norm_rect = QRectF(*rect) if rect else None
+        self.update()
+        self.rect_changed.emit()
 
     def get_normalized_rect(self):
-        if not self.crop_enabled or self.rect_geometry is None: return None
-        w, h = self.width(), self.height()
-        if w == 0 or h == 0: return None
-        r = self.rect_geometry
-        # 전체 해상도 대비 비율로 반환 (0.0 ~ 1.0)
-        return (r.x() / w, r.y() / h, r.width() / w, r.height() / h)
+        if not self.crop_enabled or self.norm_rect is None or self.norm_rect.isEmpty(): return None
+        r = self.norm_rect
+        # 원본 영상 해상도 대비 비율로 반환 (0.0 ~ 1.0)
+        return (r.x(), r.y(), r.width(), r.height())
+
+    def pixel_size(self):
+        r = self.norm_rect
+        if r is None or self.video_size.isEmpty():
+            return None
+        return (max(2, int(r.width() * self.video_size.width()) & ~1),
+                max(2, int(r.height() * self.video_size.height()) & ~1))
 
 
 class VideoContainer(QWidget):
     """QVideoWidget 위에 CropOverlay를 자식으로 붙여서 항상 위에 표시되게 함"""
+    preview_changed = pyqtSignal(QPixmap)
+
+    PREVIEW_MAX_WIDTH = 480         # 미리보기용으로 보관하는 프레임 폭
+    PREVIEW_INTERVAL_MS = 250       # 재생 중에는 이 간격으로만 프레임을 변환
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -192,6 +469,14 @@ class VideoContainer(QWidget):
         # [중요 변경점] 오버레이의 부모를 'video_widget'으로 설정하여 비디오 위에 붙어다니게 함
         self.overlay = CropOverlay(self.video_widget)
         self.overlay.raise_() # 맨 앞으로 가져오기
+        self.overlay.rect_changed.connect(self.update_preview)
+
+        # 3. 작게 줄인 최근 프레임 (크롭 미리보기용 캐시)
+        self.preview_image = QImage()
+        # 프록시를 재생할 때는 크롭 좌표/픽셀 크기를 원본 해상도 기준으로 유지
+        self.source_size = None
+        self.preview_clock = QElapsedTimer()
+        self.video_widget.videoSink().videoFrameChanged.connect(self.on_video_frame)
 
     def resizeEvent(self, event):
         # 컨테이너 크기가 변하면 비디오 위젯 크기 조절
@@ -202,11 +487,62 @@ class VideoContainer(QWidget):
         self.overlay.resize(self.video_widget.size())
         super().resizeEvent(event)
 
+    @staticmethod
+    def frame_rotation(frame):
+        # Qt 6.7+ 에서만 QVideoFrame.rotation()이 있음
+        try:
+            rotation = frame.rotation()
+            return int(getattr(rotation, 'value', rotation)) % 360
+        except AttributeError:
+            return 0
+
+    def on_video_frame(self, frame):
+        if not frame.isValid():
+            return
+        rotation = self.frame_rotation(frame)
+        size = frame.size()
+        if rotation in (90, 270):
+            size = size.transposed()
+        self.overlay.set_video_size(self.source_size or size)
+
+        # 크롭 모드일 때만, 그리고 너무 자주 하지 않도록 프레임을 이미지로 변환
+        if not self.overlay.crop_enabled:
+            return
+        if self.preview_clock.isValid() and self.preview_clock.elapsed() < self.PREVIEW_INTERVAL_MS:
+            return
+        self.preview_clock.restart()
+        image = frame.toImage()
+        if image.isNull():
+            return
+        # toImage()가 회전을 반영하지 않은 버전이면 직접 돌림
+        if (image.width() > image.height()) != (size.width() > size.height()):
+            image = image.transformed(QTransform().rotate(rotation))
+        self.preview_image = image.scaledToWidth(min(self.PREVIEW_MAX_WIDTH, image.width()),
+                                                 Qt.TransformationMode.FastTransformation)
+        self.update_preview()
+
+    def update_preview(self):
+        rect = self.overlay.get_normalized_rect()
+        if rect is None or self.preview_image.isNull():
+            self.preview_changed.emit(QPixmap())
+            return
+        iw, ih = self.preview_image.width(), self.preview_image.height()
+        x, y, w, h = rect
+        region = QRect(int(x * iw), int(y * ih), max(1, int(w * iw)), max(1, int(h * ih)))
+        self.preview_changed.emit(QPixmap.fromImage(self.preview_image.copy(region)))
+
     def get_video_output(self):
         return self.video_widget
 
+    def set_source_size(self, size):
+        self.source_size = size
+        if size is not None:
+            self.overlay.set_video_size(size)
+
     def set_crop_mode(self, enabled):
         self.overlay.set_mode(enabled)
+        if enabled:
+            self.preview_clock.invalidate()
         # 모드 변경 시 오버레이 강제 갱신
         self.overlay.raise_()
         self.overlay.update()
@@ -214,8 +550,402 @@ class VideoContainer(QWidget):
     def get_crop_rect(self):
         return self.overlay.get_normalized_rect()
 
+    def set_crop_rect(self, rect):
+        self.overlay.set_normalized_rect(rect)
+
+# ==========================================
+# 3. 타임라인 (썸네일 필름스트립 / 파형)
+# ==========================================
+class ProbeWorker(QThread):
+    """
+    파일 정보(길이, 해상도, 코덱, 회전, 오디오 유무) 확인. 네트워크 드라이브처럼 느린 곳의 파일도
+    창이 멈추지 않도록 백그라운드에서 하고, 결과는 엔진이 디스크에 캐시해서 내보내기 때 다시 probe하지 않는다.
+    """
+    info_ready = pyqtSignal(str, dict)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            info = engine().media_info(self.file_path)
+        except Exception as e:
+            self.failed.emit(self.file_path, str(e))
+            return
+        self.info_ready.emit(self.file_path, info)
+
+
+class TimelineWorker(QThread):
+    """프레임 인덱스, 썸네일, 파형을 백그라운드에서 만든다 (엔진이 디스크 캐시를 먼저 확인)"""
+    index_ready = pyqtSignal(dict)
+    thumbnail_ready = pyqtSignal(int, float, QImage)
+    waveform_ready = pyqtSignal(list)
+
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            # 프레임 단위 이동/타임코드가 먼저 쓰이므로 인덱스부터
+            self.index_ready.emit(engine().frame_index(self.file_path))
+        except Exception:
+            pass
+        if self.isInterruptionRequested():
+            return
+        try:
+            engine().thumbnail_strip(self.file_path,
+                            on_thumb=lambda i, t, jpeg: self.thumbnail_ready.emit(i, t, QImage.fromData(jpeg)),
+                            should_stop=self.isInterruptionRequested)
+            if not self.isInterruptionRequested():
+                engine().waveform_peaks(self.file_path, on_progress=lambda peaks: self.waveform_ready.emit(list(peaks)),
+                               should_stop=self.isInterruptionRequested)
+        except Exception:
+            # 타임라인은 보조 정보라서 실패해도 편집에는 지장 없음
+            pass
+
+
+class AnalysisWorker(QThread):
+    """장면 전환/무음 분석. 찾는 대로 하나씩 보내서 타임라인에 바로 표시한다."""
+    scene_found = pyqtSignal(float)
+    silence_found = pyqtSignal(float, float)
+    progress = pyqtSignal(int)
+    analysis_ready = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            result = engine().analyze_media(self.file_path, on_scene=self.scene_found.emit,
+                                   on_silence=self.silence_found.emit, on_progress=self.progress.emit,
+                                   should_stop=self.isInterruptionRequested)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        if result is not None:
+            self.analysis_ready.emit(result)
+
+
+class ProxyWorker(QThread):
+    """무거운 원본이면 미리보기용 프록시를 찾거나 만든다. 내보내기는 항상 원본을 읽는다."""
+    progress = pyqtSignal(int)
+    ready = pyqtSignal(str, int, int)  # 프록시 경로, 원본 화면 크기(가로, 세로)
+    info_ready = pyqtSignal(dict)      # 정보 없이 시작한 경우에만 (프로젝트에 저장용)
+
+    def __init__(self, file_path, max_cache_bytes, info=None, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.max_cache_bytes = max_cache_bytes
+        self.info = info
+
+    def on_progress(self, value, stats=None):
+        if self.isInterruptionRequested():
+            raise engine().ExportCanceled()
+        self.progress.emit(value)
+
+    def run(self):
+        try:
+            info = self.info
+            if info is None:
+                # 아직 probe 중에 프록시를 켠 경우: 캐시를 거쳐서 다시 probe하지 않게
+                info = engine().media_info(self.file_path)
+                self.info_ready.emit(info)
+            proxy = engine().find_proxy(self.file_path)
+            if proxy is None:
+                if not engine().needs_proxy(info):
+                    return
+                proxy = engine().build_proxy(self.file_path, info, self.on_progress,
+                                    max_cache_bytes=self.max_cache_bytes)
+            self.ready.emit(proxy, *engine().display_size(info))
+        except Exception:
+            # 프록시 실패 시 원본으로 계속 미리보기
+            pass
+
+
+class TimelineWidget(QWidget):
+    """슬라이더 아래의 필름스트립 + 파형. 클릭/드래그로 탐색"""
+    seek_requested = pyqtSignal(int)
+
+    STRIP_HEIGHT = 54
+    WAVE_HEIGHT = 36
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(self.STRIP_HEIGHT + self.WAVE_HEIGHT)
+        self.clear()
+
+    def clear(self):
+        self.duration_ms = 0
+        self.position_ms = 0
+        self.thumbs = {}
+        self.peaks = []
+        self.trim = (0.0, 0.0)
+        self.segments = []
+        self.scenes = []
+        self.silences = []
+        self.update()
+
+    def set_duration(self, ms):
+        self.duration_ms = ms
+        self.update()
+
+    def set_position(self, ms):
+        self.position_ms = ms
+        self.update()
+
+    def set_trim(self, start, end):
+        self.trim = (start, end)
+        self.update()
+
+    def set_segments(self, segments):
+        self.segments = [(seg['start'], seg['end']) for seg in segments]
+        self.update()
+
+    def add_scene(self, t):
+        self.scenes.append(t)
+        self.update()
+
+    def add_silence(self, start, end):
+        self.silences.append((start, end))
+        self.update()
+
+    def set_analysis(self, result):
+        self.scenes = list(result['scenes'])
+        self.silences = [tuple(s) for s in result['silences']]
+        self.update()
+
+    def add_thumbnail(self, index, t, image):
+        self.thumbs[index] = (t, image)
+        self.update()
+
+    def set_peaks(self, peaks):
+        self.peaks = peaks
+        self.update()
+
+    def x_for(self, seconds):
+        if self.duration_ms <= 0:
+            return 0
+        return int(seconds * 1000 / self.duration_ms * self.width())
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        w = self.width()
+        painter.fillRect(self.rect(), QColor(32, 32, 32))
+        if self.duration_ms <= 0:
+            return
+
+        # 1. 필름스트립: 썸네일을 시각 위치에 순서대로 깔기
+        for t, image in sorted(self.thumbs.values(), key=lambda item: item[0]):
+            painter.drawImage(self.x_for(t), 0, image)
+
+        # 2. 파형: 픽셀 열마다 해당 구간의 최대값
+        top = self.STRIP_HEIGHT
+        mid = top + self.WAVE_HEIGHT / 2
+        if self.peaks:
+            painter.setPen(QColor(90, 200, 120))
+            total = len(self.peaks)
+            # 생성 중에는 아직 안 만든 뒷부분을 비워 두고 그림
+            expected = max(total, engine().WAVEFORM_BUCKETS)
+            for x in range(w):
+                a = x * expected // w
+                b = max(a + 1, (x + 1) * expected // w)
+                if a >= total:
+                    break
+                amp = max(self.peaks[a:b]) * self.WAVE_HEIGHT / 2
+                painter.drawLine(QPointF(x, mid - amp), QPointF(x, mid + amp))
+
+        # 3. 분석 마커: 무음은 파형 위에 붉게, 장면 전환은 세로선
+        for start, end in self.silences:
+            painter.fillRect(QRect(self.x_for(start), top, max(1, self.x_for(end) - self.x_for(start)),
+                                   self.WAVE_HEIGHT), QColor(220, 60, 60, 90))
+        painter.setPen(QPen(QColor(255, 255, 255, 200), 1))
+        for t in self.scenes:
+            x = self.x_for(t)
+            painter.drawLine(x, 0, x, self.STRIP_HEIGHT)
+
+        # 4. 구간 목록 / 현재 트림 / 재생 위치
+        for start, end in self.segments:
+            painter.fillRect(QRect(self.x_for(start), 0, max(2, self.x_for(end) - self.x_for(start)),
+                                   self.height()), QColor(255, 200, 0, 60))
+        start, end = self.trim
+        end = end if end > 0 else self.duration_ms / 1000
+        painter.setPen(QPen(QColor(5, 184, 204), 2))
+        painter.drawRect(QRect(self.x_for(start), 1, self.x_for(end) - self.x_for(start), self.height() - 2))
+        painter.setPen(QPen(Qt.GlobalColor.red, 2))
+        x = self.x_for(self.position_ms / 1000)
+        painter.drawLine(x, 0, x, self.height())
+
+    def mousePressEvent(self, event: QMouseEvent):
+        self.seek_to(event.position().x())
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            self.seek_to(event.position().x())
+
+    def seek_to(self, x):
+        if self.duration_ms > 0 and self.width() > 0:
+            ratio = min(max(x / self.width(), 0.0), 1.0)
+            self.seek_requested.emit(int(ratio * self.duration_ms))
+
+# ==========================================
+# 4. 인코딩 설정
+# ==========================================
+class EncoderSettingsDialog(QDialog):
+    """사용자 프로필 편집. 값은 engine.encoder_settings()와 같은 dict 형태"""
+    AUDIO_BITRATES = ('96k', '128k', '160k', '192k', '256k', '320k')
+    MAX_HEIGHTS = ((0, "원본"), (2160, "2160p"), (1440, "1440p"), (1080, "1080p"), (720, "720p"), (540, "540p"))
+
+    def __init__(self, values, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("인코딩 설정")
+        form = QFormLayout(self)
+
+        self.combo_vcodec = QComboBox()
+        self.combo_vcodec.addItems(engine().VIDEO_ENCODERS)
+        self.combo_preset = QComboBox()
+        self.combo_preset.addItems(engine().X264_PRESETS)
+        self.combo_preset.setToolTip("x264 기준 이름. 다른 인코더는 비슷한 속도 단계로 바뀝니다.")
+        self.combo_rate_mode = QComboBox()
+        self.combo_rate_mode.addItem("고정 화질 (CRF)", 'crf')
+        self.combo_rate_mode.addItem("비트레이트", 'bitrate')
+        self.spin_crf = QSpinBox()
+        self.spin_crf.setRange(0, 63)
+        self.spin_crf.setToolTip("낮을수록 고화질. x264/x265는 0~51, VP9/AV1은 0~63")
+        self.edit_bitrate = QLineEdit()
+        self.edit_bitrate.setPlaceholderText("예: 8M, 2500k")
+        self.spin_threads = QSpinBox()
+        self.spin_threads.setRange(0, max(1, os.cpu_count() or 1) * 2)
+        self.spin_threads.setSpecialValueText("자동")
+        self.combo_tune = QComboBox()
+        for tune in engine().X264_TUNES:
+            self.combo_tune.addItem(tune or "없음", tune)
+        self.combo_audio_bitrate = QComboBox()
+        self.combo_audio_bitrate.addItems(self.AUDIO_BITRATES)
+        self.combo_max_height = QComboBox()
+        for value, label in self.MAX_HEIGHTS:
+            self.combo_max_height.addItem(label, value)
+
+        form.addRow("비디오 코덱", self.combo_vcodec)
+        form.addRow("프리셋", self.combo_preset)
+        form.addRow("품질 방식", self.combo_rate_mode)
+        form.addRow("CRF", self.spin_crf)
+        form.addRow("비트레이트", self.edit_bitrate)
+        form.addRow("스레드", self.spin_threads)
+        form.addRow("튠 (x264/x265)", self.combo_tune)
+        form.addRow("오디오 비트레이트", self.combo_audio_bitrate)
+        form.addRow("최대 해상도", self.combo_max_height)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+        self.combo_rate_mode.currentIndexChanged.connect(self.update_enabled)
+        self.set_values(values)
+
+    def set_values(self, values):
+        self.combo_vcodec.setCurrentText(values['vcodec'])
+        self.combo_preset.setCurrentText(values['preset'])
+        self.combo_rate_mode.setCurrentIndex(max(0, self.combo_rate_mode.findData(values['rate_mode'])))
+        self.spin_crf.setValue(int(values['crf']))
+        self.edit_bitrate.setText(str(values['bitrate']))
+        self.spin_threads.setValue(int(values['threads']))
+        self.combo_tune.setCurrentIndex(max(0, self.combo_tune.findData(values['tune'])))
+        self.combo_audio_bitrate.setCurrentText(values['audio_bitrate'])
+        self.combo_max_height.setCurrentIndex(max(0, self.combo_max_height.findData(values['max_height'])))
+        self.update_enabled()
+
+    def update_enabled(self):
+        crf_mode = self.combo_rate_mode.currentData() == 'crf'
+        self.spin_crf.setEnabled(crf_mode)
+        self.edit_bitrate.setEnabled(not crf_mode)
+
+    def values(self):
+        return engine().encoder_settings(
+            vcodec=self.combo_vcodec.currentText(),
+            preset=self.combo_preset.currentText(),
+            rate_mode=self.combo_rate_mode.currentData(),
+            crf=self.spin_crf.value(),
+            bitrate=self.edit_bitrate.text().strip() or engine().ENCODER_PROFILES['standard']['bitrate'],
+            threads=self.spin_threads.value(),
+            tune=self.combo_tune.currentData(),
+            audio_bitrate=self.combo_audio_bitrate.currentText(),
+            max_height=self.combo_max_height.currentData(),
+        )
+
+# ==========================================
+# 5. 편집 기록 (실행 취소 / 다시 실행)
+# ==========================================
+class EditHistory:
+    """
+    편집 상태(구간, 크롭, 구간 목록) 스냅샷 목록. 편집할 때마다 바뀐 뒤 상태를 record()하고,
+    undo()/redo()는 되돌아갈 상태를 돌려준다. 상태는 JSON으로 복사해 두므로 이후 변경과 섞이지 않는다.
+    """
+    LIMIT = 200
+
+    def __init__(self):
+        self.reset(None)
+
+    def reset(self, state):
+        self.entries = [("", self._copy(state))]
+        self.pos = 0
+        self.saved_pos = 0
+
+    @staticmethod
+    def _copy(state):
+        return json.loads(json.dumps(state))
+
+    def record(self, state, label):
+        """상태가 실제로 바뀌었으면 True. 되돌린 뒤 새로 편집하면 다시 실행할 기록은 버린다."""
+        state = self._copy(state)
+        if state == self.entries[self.pos][1]:
+            return False
+        del self.entries[self.pos + 1:]
+        if self.saved_pos > self.pos:
+            self.saved_pos = -1
+        self.entries.append((label, state))
+        if len(self.entries) > self.LIMIT:
+            del self.entries[0]
+            self.saved_pos -= 1
+        self.pos = len(self.entries) - 1
+        return True
+
+    def can_undo(self):
+        return self.pos > 0
+
+    def can_redo(self):
+        return self.pos + 1 < len(self.entries)
+
+    def undo_label(self):
+        return self.entries[self.pos][0] if self.can_undo() else ""
+
+    def redo_label(self):
+        return self.entries[self.pos + 1][0] if self.can_redo() else ""
+
+    def undo(self):
+        if not self.can_undo():
+            return None
+        self.pos -= 1
+        return self._copy(self.entries[self.pos][1])
+
+    def redo(self):
+        if not self.can_redo():
+            return None
+        self.pos += 1
+        return self._copy(self.entries[self.pos][1])
+
+    def mark_saved(self):
+        self.saved_pos = self.pos
+
+    def is_modified(self):
+        return self.pos != self.saved_pos
+
 # ==========================================
-# 4. 메인 윈도우
+# 6. 메인 윈도우
 # ==========================================
 class SolCutter(QMainWindow):
     def __init__(self):
@@ -229,9 +959,24 @@ class SolCutter(QMainWindow):
         self.duration = 0
         self.start_trim = 0.0
         self.end_trim = 0.0
+        self.segments = []
+        self.media_info = None      # probe 결과 (프로젝트에 저장해서 다시 열 때 재사용)
+        self.project_path = None
+        self.history = EditHistory()
+        self.restoring = False      # 실행 취소/불러오기 중에는 편집 기록을 남기지 않음
+        # 클립 목록: [{'file', 'info', 'edit'}] 순서대로 이어붙여 내보낼 수 있음. 편집 중인 파일은 clip_row 번째
+        self.clips = []
+        self.clip_row = -1
+        self.clip_probes = {}       # 경로 -> 목록 표시용 ProbeWorker
+        self.bin_modified = False   # 클립 추가/삭제/순서 변경 (편집 기록과 별도)
+
+        self.export_queue = ExportQueue(self.settings, self)
 
         self.init_ui()
+        self.init_menu()
         self.init_player()
+        self.init_queue()
+        self.setAcceptDrops(True)
 
     def load_window_settings(self):
         geometry = self.settings.value("geometry")
@@ -241,6 +986,23 @@ class SolCutter(QMainWindow):
             self.resize(1000, 800)
 
     def closeEvent(self, event):
+        if not self.maybe_save():
+            event.ignore()
+            return
+        if self.export_queue.running:
+            answer = QMessageBox.question(
+                self, "종료", "진행 중인 내보내기 작업이 있습니다.\n"
+                "종료하면 중단되고 다음 실행 때 다시 진행됩니다 (분할 인코딩은 끝난 조각부터 이어서). 종료할까요?")
+            if answer != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        self.export_queue.shutdown()
+        self.stop_probe(wait=True)
+        for worker in list(self.clip_probes.values()):
+            worker.wait()
+        self.stop_timeline()
+        self.stop_proxy()
+        self.stop_analysis()
         self.settings.setValue("geometry", self.saveGeometry())
         super().closeEvent(event)
     
@@ -266,6 +1028,29 @@ class SolCutter(QMainWindow):
         top_layout.addWidget(self.lbl_status)
         top_layout.addStretch()
 
+        # 1-1. 클립 목록 (파일을 끌어다 놓아 추가, 순서대로 이어붙여 저장)
+        clip_layout = QHBoxLayout()
+        self.clip_list = QListWidget()
+        self.clip_list.setMaximumHeight(110)
+        self.clip_list.setToolTip("영상 파일을 창에 끌어다 놓으면 목록에 추가됩니다. 선택하면 그 클립을 편집합니다.")
+        self.clip_list.currentRowChanged.connect(self.select_clip)
+        clip_btns = QVBoxLayout()
+        self.btn_clip_add = QPushButton("클립 추가...")
+        self.btn_clip_add.clicked.connect(self.choose_clips)
+        self.btn_clip_remove = QPushButton("삭제")
+        self.btn_clip_remove.clicked.connect(self.remove_clip)
+        self.btn_clip_up = QPushButton("▲")
+        self.btn_clip_up.clicked.connect(lambda: self.move_clip(-1))
+        self.btn_clip_down = QPushButton("▼")
+        self.btn_clip_down.clicked.connect(lambda: self.move_clip(1))
+        self.btn_concat = QPushButton("이어붙여 저장")
+        self.btn_concat.clicked.connect(self.export_clips)
+        for w in (self.btn_clip_add, self.btn_clip_remove, self.btn_clip_up, self.btn_clip_down, self.btn_concat):
+            clip_btns.addWidget(w)
+        clip_btns.addStretch()
+        clip_layout.addWidget(self.clip_list, stretch=1)
+        clip_layout.addLayout(clip_btns)
+
         # 2. 비디오 컨테이너
         self.video_container = VideoContainer()
         
@@ -279,8 +1064,31 @@ class SolCutter(QMainWindow):
             QPushButton { background-color: #f0f0f0; padding: 5px; }
             QPushButton:checked { background-color: #ffcccc; border: 2px solid red; font-weight: bold; }
         """)
+        self.combo_aspect = QComboBox()
+        for label, ratio in CropOverlay.ASPECT_RATIOS:
+            self.combo_aspect.addItem(label, ratio)
+        self.combo_aspect.currentIndexChanged.connect(
+            lambda: self.video_container.overlay.set_aspect_ratio(self.combo_aspect.currentData()))
+        self.chk_snap_even = QCheckBox("짝수 픽셀 맞춤")
+        self.chk_snap_even.setChecked(True)
+        self.chk_snap_even.toggled.connect(self.video_container.overlay.set_snap_even)
+        self.lbl_crop_size = QLabel("")
+        self.lbl_crop_preview = QLabel()
+        self.lbl_crop_preview.setFixedSize(160, 90)
+        self.lbl_crop_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_crop_preview.setStyleSheet("background-color: #202020;")
+        self.lbl_crop_preview.setToolTip("크롭 결과 미리보기")
+        self.video_container.preview_changed.connect(self.show_crop_preview)
+        self.video_container.overlay.rect_changed.connect(self.update_crop_size_label)
+        self.video_container.overlay.rect_changed.connect(self.crop_edited)
+
         crop_control_layout.addWidget(self.btn_crop_toggle)
+        crop_control_layout.addWidget(QLabel("비율:"))
+        crop_control_layout.addWidget(self.combo_aspect)
+        crop_control_layout.addWidget(self.chk_snap_even)
+        crop_control_layout.addWidget(self.lbl_crop_size)
         crop_control_layout.addStretch()
+        crop_control_layout.addWidget(self.lbl_crop_preview)
 
         # 3. 재생 컨트롤
         control_layout = QHBoxLayout()
@@ -296,10 +1104,45 @@ class SolCutter(QMainWindow):
         self.lbl_current_time = QLabel("00:00")
         self.lbl_total_time = QLabel("00:00")
         control_layout.addWidget(self.btn_play)
+
+        # 프레임/키프레임 단위 이동 (←/→ = 1프레임, Ctrl+←/→ = 키프레임)
+        self.frame_index = None
+        self.step_buttons = []
+        for text, tip, keys, frames, keyframe in (("◀◀", "이전 키프레임 (Ctrl+←)", "Ctrl+Left", -1, True),
+                                                   ("◀", "이전 프레임 (←)", "Left", -1, False),
+                                                   ("▶", "다음 프레임 (→)", "Right", 1, False),
+                                                   ("▶▶", "다음 키프레임 (Ctrl+→)", "Ctrl+Right", 1, True)):
+            btn = QPushButton(text)
+            btn.setToolTip(tip)
+            btn.setFixedWidth(36)
+            btn.setEnabled(False)
+            step = (lambda checked=False, d=frames, k=keyframe: self.step(d, k))
+            btn.clicked.connect(step)
+            QShortcut(QKeySequence(keys), self).activated.connect(step)
+            control_layout.addWidget(btn)
+            self.step_buttons.append(btn)
+
         control_layout.addWidget(self.lbl_current_time)
         control_layout.addWidget(self.slider)
         control_layout.addWidget(self.lbl_total_time)
 
+        # 4K/HEVC 같은 무거운 원본은 저해상도 프록시로 미리보기
+        self.chk_proxy = QCheckBox("프록시")
+        self.chk_proxy.setToolTip("무거운 원본(4K, HEVC 등)은 저해상도 사본을 만들어 미리보기에 사용합니다.\n"
+                                  "내보내기는 항상 원본으로 합니다.")
+        self.chk_proxy.setChecked(self.settings.value("use_proxy", True, type=bool))
+        self.chk_proxy.toggled.connect(self.toggle_proxy)
+        control_layout.addWidget(self.chk_proxy)
+        self.proxy_worker = None
+        self.proxy_path = None
+        self.pending_seek = None
+        self.probe_worker = None
+        self.old_probe_workers = []
+
+        self.timeline = TimelineWidget()
+        self.timeline.seek_requested.connect(self.set_position)
+        self.timeline_worker = None
+
         # 4. Trim
         trim_layout = QHBoxLayout()
         self.btn_set_start = QPushButton("시작점 설정")
@@ -316,6 +1159,42 @@ class SolCutter(QMainWindow):
         trim_layout.addWidget(self.btn_reset_trim)
         trim_layout.addStretch()
 
+        # 장면 전환/무음 분석으로 자를 위치 제안
+        self.btn_analyze = QPushButton("장면/무음 분석")
+        self.btn_analyze.clicked.connect(self.start_analysis)
+        self.btn_scene_segments = QPushButton("장면 → 구간")
+        self.btn_scene_segments.setToolTip("현재 구간(없으면 전체)을 장면 전환 위치마다 나눠 구간 목록으로 만듭니다.")
+        self.btn_scene_segments.clicked.connect(self.scenes_to_segments)
+        self.btn_remove_silence = QPushButton("무음 제거")
+        self.btn_remove_silence.setToolTip("현재 구간(없으면 전체)에서 무음 부분을 뺀 구간들을 하나로 합치도록 설정합니다.")
+        self.btn_remove_silence.clicked.connect(self.remove_silences)
+        for w in (self.btn_analyze, self.btn_scene_segments, self.btn_remove_silence):
+            w.setEnabled(False)
+            trim_layout.addWidget(w)
+        self.analysis_worker = None
+
+        # 4-1. 구간 목록 (여러 구간을 한 번에 내보내기)
+        segment_layout = QHBoxLayout()
+        self.segment_list = QListWidget()
+        self.segment_list.setMaximumHeight(110)
+        segment_btns = QVBoxLayout()
+        self.btn_seg_add = QPushButton("현재 구간 추가")
+        self.btn_seg_add.clicked.connect(self.add_segment)
+        self.btn_seg_remove = QPushButton("삭제")
+        self.btn_seg_remove.clicked.connect(self.remove_segment)
+        self.btn_seg_up = QPushButton("▲")
+        self.btn_seg_up.clicked.connect(lambda: self.move_segment(-1))
+        self.btn_seg_down = QPushButton("▼")
+        self.btn_seg_down.clicked.connect(lambda: self.move_segment(1))
+        self.chk_seg_combine = QCheckBox("하나로 합치기")
+        self.chk_seg_combine.setToolTip("체크하면 구간들을 순서대로 이어붙여 파일 하나로 저장합니다.")
+        self.chk_seg_combine.toggled.connect(lambda: self.record_edit("하나로 합치기"))
+        for w in (self.btn_seg_add, self.btn_seg_remove, self.btn_seg_up, self.btn_seg_down, self.chk_seg_combine):
+            segment_btns.addWidget(w)
+        segment_btns.addStretch()
+        segment_layout.addWidget(self.segment_list, stretch=1)
+        segment_layout.addLayout(segment_btns)
+
         # 5. Export
         export_layout = QVBoxLayout()
         btn_layout = QHBoxLayout()
@@ -324,13 +1203,55 @@ class SolCutter(QMainWindow):
         self.btn_save_video.setEnabled(False)
         self.btn_save_video.setStyleSheet("background-color: #d1e7dd; height: 35px; font-weight: bold;")
         
-        self.btn_save_audio = QPushButton("오디오 추출 (mp3)")
+        self.btn_save_audio = QPushButton("오디오 추출")
         self.btn_save_audio.clicked.connect(lambda: self.export_media('audio'))
         self.btn_save_audio.setEnabled(False)
         self.btn_save_audio.setStyleSheet("height: 35px;")
 
+        # 크롭이 없을 때 재인코딩 없이 자르는 방식
+        self.combo_fast_trim = QComboBox()
+        self.combo_fast_trim.addItem("재인코딩", 'off')
+        self.combo_fast_trim.addItem("무손실 (키프레임 스냅)", 'keyframe')
+        self.combo_fast_trim.addItem("무손실 (스마트 컷)", 'smart')
+        self.combo_fast_trim.setToolTip("크롭 없이 구간만 자를 때 원본 스트림을 그대로 복사합니다.\n"
+                                        "오디오 추출도 원본 코덱과 맞는 형식(예: AAC → m4a)이면 복사합니다.")
+        idx = self.combo_fast_trim.findData(self.settings.value("fast_trim", "keyframe"))
+        self.combo_fast_trim.setCurrentIndex(max(0, idx))
+        self.combo_fast_trim.currentIndexChanged.connect(
+            lambda: self.settings.setValue("fast_trim", self.combo_fast_trim.currentData()))
+        self.combo_fast_trim.currentIndexChanged.connect(self.refresh_clip_list)
+
         btn_layout.addWidget(self.btn_save_video)
         btn_layout.addWidget(self.btn_save_audio)
+        btn_layout.addWidget(QLabel("자르기 방식:"))
+        btn_layout.addWidget(self.combo_fast_trim)
+
+        # 인코딩 프로필 (재인코딩할 때 적용)
+        self.combo_profile = QComboBox()
+        self.combo_profile.addItem("표준", 'standard')
+        self.combo_profile.addItem("빠른 초안", 'draft')
+        self.combo_profile.addItem("사용자 설정", 'custom')
+        self.combo_profile.setToolTip("빠른 초안: ultrafast + 540p, 확인용 미리보기에 사용")
+        idx = self.combo_profile.findData(self.settings.value("encoder_profile", "standard"))
+        self.combo_profile.setCurrentIndex(max(0, idx))
+        self.combo_profile.currentIndexChanged.connect(
+            lambda: self.settings.setValue("encoder_profile", self.combo_profile.currentData()))
+        self.btn_encoder_settings = QPushButton("설정...")
+        self.btn_encoder_settings.clicked.connect(self.edit_encoder_settings)
+        btn_layout.addWidget(QLabel("인코딩:"))
+        btn_layout.addWidget(self.combo_profile)
+        btn_layout.addWidget(self.btn_encoder_settings)
+
+        # 분할 인코딩: 키프레임 조각을 동시에 인코딩하고, 중간에 꺼져도 다시 실행하면 이어서
+        self.spin_chunks = QSpinBox()
+        self.spin_chunks.setRange(0, max(1, os.cpu_count() or 1))
+        self.spin_chunks.setSpecialValueText("끔")
+        self.spin_chunks.setToolTip("재인코딩을 조각으로 나눠 이 수만큼 동시에 인코딩합니다.\n"
+                                    "프로그램이 꺼지거나 취소해도 재시도하면 끝난 조각부터 이어서 합니다.")
+        self.spin_chunks.setValue(int(self.settings.value("chunk_workers", 0)))
+        self.spin_chunks.valueChanged.connect(lambda value: self.settings.setValue("chunk_workers", value))
+        btn_layout.addWidget(QLabel("분할:"))
+        btn_layout.addWidget(self.spin_chunks)
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
@@ -338,17 +1259,83 @@ class SolCutter(QMainWindow):
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setStyleSheet("QProgressBar { text-align: center; } QProgressBar::chunk { background-color: #05B8CC; }")
 
+        # 6. 내보내기 대기열
+        self.queue_table = QTableWidget(0, 4)
+        self.queue_table.setHorizontalHeaderLabels(["파일", "구간", "상태", "메시지"])
+        self.queue_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.queue_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.queue_table.verticalHeader().setVisible(False)
+        self.queue_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.queue_table.setMaximumHeight(160)
+
+        queue_btn_layout = QHBoxLayout()
+        self.btn_queue_cancel = QPushButton("선택 취소")
+        self.btn_queue_cancel.clicked.connect(self.cancel_selected_jobs)
+        self.btn_queue_retry = QPushButton("선택 재시도")
+        self.btn_queue_retry.clicked.connect(self.retry_selected_jobs)
+        self.btn_queue_clear = QPushButton("끝난 작업 정리")
+        self.btn_queue_clear.clicked.connect(self.export_queue.clear_finished)
+        self.spin_workers = QSpinBox()
+        self.spin_workers.setRange(1, max(1, os.cpu_count() or 1))
+        self.spin_workers.setValue(self.export_queue.max_workers)
+        self.spin_workers.valueChanged.connect(self.export_queue.set_max_workers)
+        queue_btn_layout.addWidget(self.btn_queue_cancel)
+        queue_btn_layout.addWidget(self.btn_queue_retry)
+        queue_btn_layout.addWidget(self.btn_queue_clear)
+        queue_btn_layout.addStretch()
+        queue_btn_layout.addWidget(QLabel("동시 작업 수:"))
+        queue_btn_layout.addWidget(self.spin_workers)
+
+        export_layout.addLayout(btn_layout)
+        export_layout.addWidget(self.progress_bar)
+        export_layout.addWidget(self.queue_table)
+        export_layout.addLayout(queue_btn_layout)
+
         main_layout.addLayout(top_layout)
+        main_layout.addLayout(clip_layout)
         main_layout.addWidget(self.video_container, stretch=1)
         main_layout.addLayout(crop_control_layout)
         main_layout.addLayout(control_layout)
+        main_layout.addWidget(self.timeline)
         main_layout.addLayout(trim_layout)
+        main_layout.addLayout(segment_layout)
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
         main_layout.addWidget(line)
         main_layout.addLayout(export_layout)
 
+    def init_menu(self):
+        def action(menu, text, slot, *keys):
+            act = QAction(text, self)
+            act.setShortcuts([QKeySequence(k) for k in keys])
+            act.triggered.connect(slot)
+            menu.addAction(act)
+            return act
+
+        file_menu = self.menuBar().addMenu("파일")
+        action(file_menu, "영상 열기...", self.open_file, "Ctrl+O")
+        action(file_menu, "클립 추가...", self.choose_clips, "Ctrl+I")
+        action(file_menu, "프로젝트 열기...", lambda: self.open_project(), "Ctrl+Shift+O")
+        self.recent_menu = file_menu.addMenu("최근 프로젝트")
+        self.recent_menu.aboutToShow.connect(self.refresh_recent_menu)
+        file_menu.addSeparator()
+        self.act_save = action(file_menu, "프로젝트 저장", lambda: self.save_project(), "Ctrl+S")
+        self.act_save_as = action(file_menu, "다른 이름으로 저장...", lambda: self.save_project(save_as=True),
+                                  "Ctrl+Shift+S")
+
+        edit_menu = self.menuBar().addMenu("편집")
+        self.act_undo = action(edit_menu, "실행 취소", self.undo_edit, "Ctrl+Z")
+        self.act_redo = action(edit_menu, "다시 실행", self.redo_edit, "Ctrl+Y", "Ctrl+Shift+Z")
+        self.update_edit_actions()
+        self.refresh_clip_list()
+
+    def init_queue(self):
+        self.export_queue.jobs_reset.connect(self.refresh_queue_table)
+        self.export_queue.job_changed.connect(self.update_queue_row)
+        self.export_queue.job_finished.connect(self.export_finished)
+        self.refresh_queue_table()
+
     def init_player(self):
         self.media_player = QMediaPlayer()
         self.audio_output = QAudioOutput()
@@ -358,29 +1345,483 @@ class SolCutter(QMainWindow):
         self.media_player.playbackStateChanged.connect(self.media_state_changed)
         self.media_player.positionChanged.connect(self.position_changed)
         self.media_player.durationChanged.connect(self.duration_changed)
+        self.media_player.mediaStatusChanged.connect(self.media_status_changed)
         self.media_player.errorOccurred.connect(self.handle_errors)
 
+    def media_file_filter(self):
+        patterns = ' '.join('*' + ext for ext in engine().MEDIA_EXTS)
+        return f"미디어 파일 ({patterns});;모든 파일 (*)"
+
     def open_file(self):
-        file_name, _ = QFileDialog.getOpenFileName(self, "비디오 열기", "", "Video Files (*.mp4 *.avi *.mkv)")
-        if file_name:
+        """새로 시작: 고른 파일들로 클립 목록을 채우고 첫 번째를 연다."""
+        if not self.maybe_save():
+            return
+        file_names, _ = QFileDialog.getOpenFileNames(self, "영상 열기", "", self.media_file_filter())
+        if file_names:
+            self.open_files(file_names)
+
+    def open_files(self, file_names):
+        self.stop_probe()
+        self.clips = []
+        self.clip_row = -1
+        self.project_path = None
+        self.add_clips(file_names)
+        self.bin_modified = False
+        self.update_edit_actions()
+
+    def choose_clips(self):
+        file_names, _ = QFileDialog.getOpenFileNames(self, "클립 추가", "", self.media_file_filter())
+        if file_names:
+            self.add_clips(file_names)
+
+    # ----- 끌어다 놓기 -----
+    def dropped_paths(self, event):
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        exts = engine().MEDIA_EXTS + (engine().PROJECT_EXT,)
+        return [p for p in paths if os.path.isfile(p) and os.path.splitext(p)[1].lower() in exts]
+
+    def dragEnterEvent(self, event: QDragEnterEvent):
+        if event.mimeData().hasUrls() and self.dropped_paths(event):
+            event.acceptProposedAction()
+
+    def dropEvent(self, event: QDropEvent):
+        paths = self.dropped_paths(event)
+        event.acceptProposedAction()
+        projects = [p for p in paths if p.lower().endswith(engine().PROJECT_EXT)]
+        if projects:
+            self.open_project(projects[0])
+        elif self.clips:
+            self.add_clips(paths)
+        elif self.maybe_save():
+            self.open_files(paths)
+
+    # ----- 클립 목록 -----
+    def add_clips(self, file_names):
+        """목록 끝에 추가. 편집 중인 파일이 없으면 첫 번째 추가분을 연다."""
+        first = len(self.clips)
+        self.clips += [{'file': os.path.abspath(f), 'info': None, 'edit': None} for f in file_names]
+        self.bin_modified = True
+        self.probe_clips()
+        self.refresh_clip_list()
+        if self.clip_row < 0:
+            self.select_clip(first)
+        else:
+            self.lbl_status.setText(f"클립 {len(file_names)}개 추가 (전체 {len(self.clips)}개)")
+        self.update_edit_actions()
+
+    def probe_clips(self):
+        """목록에 표시할 길이/형식과 이어붙이기 방식(무손실/재인코딩)을 알기 위해 백그라운드에서 확인"""
+        for clip in self.clips:
+            path = clip['file']
+            if clip['info'] is not None or clip.get('error') or path in self.clip_probes:
+                continue
+            worker = ProbeWorker(path, self)
+            worker.info_ready.connect(self.clip_probed)
+            worker.failed.connect(self.clip_probe_failed)
+            worker.finished.connect(lambda p=path: self.clip_probes.pop(p, None))
+            self.clip_probes[path] = worker
+            worker.start()
+
+    def clip_probed(self, file_name, info):
+        for clip in self.clips:
+            if clip['file'] == file_name:
+                clip['info'] = info
+        self.refresh_clip_list()
+
+    def clip_probe_failed(self, file_name, message):
+        for clip in self.clips:
+            if clip['file'] == file_name:
+                clip['error'] = message
+        self.refresh_clip_list()
+
+    def store_current_clip(self):
+        """편집 중인 클립의 구간/크롭을 목록에 반영"""
+        if 0 <= self.clip_row < len(self.clips) and self.clips[self.clip_row]['file'] == self.video_path:
+            clip = self.clips[self.clip_row]
+            clip['edit'] = self.edit_state()
+            if self.media_info is not None:
+                clip['info'] = self.media_info
+
+    def select_clip(self, row):
+        if row == self.clip_row or not 0 <= row < len(self.clips):
+            return
+        # 클립마다 편집 기록은 따로. 전환 전 편집은 저장 여부 판단에만 남김
+        self.store_current_clip()
+        self.bin_modified = self.bin_modified or self.history.is_modified()
+        self.clip_row = row
+        clip = self.clips[row]
+        self.load_source(clip['file'], clip['info'])
+        if clip['edit'] is not None:
+            self.apply_edit_state(clip['edit'])
+        self.history.reset(self.edit_state())
+        self.refresh_clip_list()
+        self.update_edit_actions()
+
+    def remove_clip(self):
+        row = self.clip_list.currentRow()
+        if len(self.clips) < 2 or not 0 <= row < len(self.clips):
+            return
+        del self.clips[row]
+        self.bin_modified = True
+        if row == self.clip_row:
+            self.clip_row = -1
+            self.select_clip(min(row, len(self.clips) - 1))
+        elif row < self.clip_row:
+            self.clip_row -= 1
+        self.refresh_clip_list()
+        self.update_edit_actions()
+
+    def move_clip(self, offset):
+        row = self.clip_list.currentRow()
+        target = row + offset
+        if 0 <= row < len(self.clips) and 0 <= target < len(self.clips):
+            self.clips[row], self.clips[target] = self.clips[target], self.clips[row]
+            if self.clip_row in (row, target):
+                self.clip_row = target if self.clip_row == row else row
+            self.bin_modified = True
+            self.refresh_clip_list()
+            self.update_edit_actions()
+
+    def describe_clip(self, clip):
+        edit = clip['edit'] or {}
+        if edit.get('segments'):
+            span = f"구간 {len(edit['segments'])}개"
+        elif edit.get('start') or edit.get('end'):
+            e_txt = self.format_time(int(edit['end'] * 1000)) if edit['end'] > 0 else "끝"
+            span = f"{self.format_time(int(edit['start'] * 1000))} ~ {e_txt}"
+        else:
+            span = "전체"
+        if edit.get('crop') or any(seg['crop'] for seg in edit.get('segments') or []):
+            span += " [크롭]"
+        info = clip['info']
+        if clip.get('error'):
+            detail = "열 수 없음"
+        elif info is None:
+            detail = "확인 중..."
+        else:
+            detail = self.format_time(int(info['duration'] * 1000))
+            if info['vcodec']:
+                detail += f" · {info['width']}x{info['height']} {info['fps']:g}fps {info['vcodec']}"
+            detail += f" · {info['acodec'] or '오디오 없음'}"
+        return f"{os.path.basename(clip['file'])}   {span}   ({detail})"
+
+    def refresh_clip_list(self):
+        self.clip_list.blockSignals(True)
+        self.clip_list.clear()
+        for i, clip in enumerate(self.clips, 1):
+            self.clip_list.addItem(f"{i}. {self.describe_clip(clip)}")
+        if self.clip_row >= 0:
+            self.clip_list.setCurrentRow(self.clip_row)
+        self.clip_list.blockSignals(False)
+        self.btn_clip_remove.setEnabled(len(self.clips) > 1)
+        self.btn_clip_up.setEnabled(len(self.clips) > 1)
+        self.btn_clip_down.setEnabled(len(self.clips) > 1)
+
+        # 모든 클립 정보가 모이면 저장 형식과 상관없이 재인코딩이 필요한지 미리 표시
+        # (무손실 여부는 저장 형식까지 알아야 하므로 저장 위치를 고른 뒤 export_clips에서 알려줌)
+        self.btn_concat.setEnabled(len(self.clips) > 1)
+        self.btn_concat.setText("이어붙여 저장")
+        self.btn_concat.setToolTip("클립들을 목록 순서대로 이어붙입니다. 구간 목록이 있는 클립은 그 구간들을,\n"
+                                   "없으면 시작~종료 구간을 씁니다.")
+        if len(self.clips) > 1 and all(clip['info'] for clip in self.clips):
+            clips, mode = self.concat_clips()
+            reason = self.concat_copy_blocker(clips, mode, None)
+            if reason:
+                self.btn_concat.setText("이어붙여 저장 (재인코딩)")
+                self.btn_concat.setToolTip(self.btn_concat.toolTip() + f"\n\n재인코딩 이유: {reason}")
+            else:
+                self.btn_concat.setToolTip(self.btn_concat.toolTip() + "\n\n클립 형식이 모두 같아서 저장 형식이 "
+                                           "코덱을 담을 수 있으면 재인코딩 없이 이어붙입니다.")
+
+    def concat_clips(self):
+        """클립 목록을 엔진 클립 목록으로 (구간 목록이 있으면 구간마다 하나). 비디오가 하나도 없으면 오디오 모드"""
+        result = []
+        for clip in self.clips:
+            edit = clip['edit'] or {}
+            if edit.get('segments'):
+                result += [engine().new_clip(clip['file'], seg['start'], seg['end'], seg['crop'])
+                           for seg in edit['segments']]
+            else:
+                result.append(engine().new_clip(clip['file'], edit.get('start', 0.0), edit.get('end', 0.0),
+                                                edit.get('crop')))
+        known = [clip['info'] for clip in self.clips if clip['info']]
+        has_video = not known or len(known) < len(self.clips) or any(info['vcodec'] for info in known)
+        return result, 'video' if has_video else 'audio'
+
+    def concat_copy_blocker(self, clips, mode, output_path):
+        """스트림 복사로 이어붙일 수 없는 이유 (엔진의 _export_clips와 같은 판단, output_path가 None이면 형식 검사 생략)"""
+        if self.combo_fast_trim.currentData() == 'off':
+            return "자르기 방식이 재인코딩"
+        if any(clip['crop'] for clip in clips):
+            return "크롭"
+        infos = {clip['file']: clip['info'] for clip in self.clips}
+        return engine().concat_mismatch([infos[clip['file']] for clip in clips], output_path, mode == 'audio')
+
+    def load_source(self, file_name, info=None):
+        """
+        원본을 열고 편집 상태를 비운다. 파일 확인(probe)은 백그라운드에서 하고 끝나면 source_ready()에서
+        플레이어/타임라인을 시작한다. info가 있으면 (프로젝트에 저장된 probe 결과) 바로 시작.
+        """
+        self.restoring = True
+        try:
             self.video_path = file_name
-            self.lbl_status.setText(f"파일: {os.path.basename(file_name)}")
-            
-            self.media_player.setSource(QUrl.fromLocalFile(file_name))
-            
-            self.btn_play.setEnabled(True)
-            self.btn_save_video.setEnabled(True)
-            self.btn_save_audio.setEnabled(True)
-            self.btn_crop_toggle.setEnabled(True) 
+            self.media_info = None
+            self.stop_probe()
+            self.stop_proxy()
+            self.stop_timeline()
+            self.stop_analysis()
+            self.media_player.setSource(QUrl())
+            for w in (self.btn_play, self.btn_save_video, self.btn_save_audio, self.btn_crop_toggle,
+                      self.btn_analyze):
+                w.setEnabled(False)
             self.btn_crop_toggle.setChecked(False)
             self.toggle_crop_mode()
-            
+
             self.start_trim = 0.0
             self.end_trim = 0.0
-            
-            self.media_player.play()
+            self.segments = []
+            self.set_frame_index(None)
+            self.timeline.clear()
+            self.proxy_path = None
+            self.pending_seek = None
+            self.video_container.set_source_size(None)
+            self.duration_changed(0)
+            self.refresh_segment_list()
+            self.update_trim_label()
+        finally:
+            self.restoring = False
+
+        if info is not None:
+            self.source_ready(file_name, info)
+            return
+        self.lbl_status.setText(f"파일 확인 중: {os.path.basename(file_name)}")
+        self.probe_worker = ProbeWorker(file_name, self)
+        self.probe_worker.info_ready.connect(self.source_probed)
+        self.probe_worker.failed.connect(self.source_failed)
+        self.probe_worker.start()
+
+    def stop_probe(self, wait=False):
+        if self.probe_worker is not None:
+            # probe는 중단할 수 없으므로 결과만 버리고, 스레드가 끝날 때까지 참조를 유지
+            worker = self.probe_worker
+            worker.info_ready.disconnect()
+            worker.failed.disconnect()
+            self.old_probe_workers.append(worker)
+            worker.finished.connect(lambda: self.old_probe_workers.remove(worker))
+            self.probe_worker = None
+        if wait:
+            for worker in list(self.old_probe_workers):
+                worker.wait()
+
+    def source_probed(self, file_name, info):
+        self.probe_worker = None
+        self.source_ready(file_name, info)
+
+    def source_failed(self, file_name, message):
+        self.probe_worker = None
+        for clip in self.clips:
+            if clip['file'] == file_name:
+                clip['error'] = message
+        self.refresh_clip_list()
+        self.video_path = ""
+        self.update_edit_actions()
+        self.lbl_status.setText(f"열 수 없는 파일: {os.path.basename(file_name)}")
+        QMessageBox.warning(self, "파일 열기", f"미디어 정보를 읽을 수 없습니다.\n{message}")
+
+    def source_ready(self, file_name, info):
+        """probe 결과로 내보내기 가능 여부를 정하고 (오디오가 없으면 오디오 추출 끄기 등) 재생을 시작한다."""
+        self.media_info = info
+        if 0 <= self.clip_row < len(self.clips) and self.clips[self.clip_row]['file'] == file_name:
+            self.clips[self.clip_row]['info'] = info
+            self.refresh_clip_list()
+        has_video, has_audio = info['vcodec'] is not None, info['acodec'] is not None
+        self.btn_play.setEnabled(True)
+        self.btn_analyze.setEnabled(True)
+        self.btn_save_video.setEnabled(has_video)
+        self.btn_crop_toggle.setEnabled(has_video)
+        self.btn_save_audio.setEnabled(has_audio)
+        self.btn_save_audio.setToolTip("" if has_audio else "오디오 트랙이 없습니다.")
+        self.btn_save_video.setToolTip("" if has_video else "비디오 트랙이 없습니다.")
+        # 회전된 (세로) 휴대폰 영상도 첫 프레임이 오기 전부터 크롭 좌표를 화면 방향 기준으로 맞춤
+        self.video_container.set_source_size(self.source_display_size())
+        self.duration_changed(int(info['duration'] * 1000))
+        self.lbl_status.setText(self.describe_media(file_name, info))
+
+        self.media_player.setSource(QUrl.fromLocalFile(file_name))
+        self.start_timeline(file_name)
+        if has_video and self.chk_proxy.isChecked():
+            self.start_proxy(file_name)
+        self.media_player.play()
+        self.media_player.pause()
+        self.update_edit_actions()
+
+    def source_display_size(self):
+        info = self.media_info
+        if not info or info['vcodec'] is None or not info['width']:
+            return None
+        return QSize(*engine().display_size(info))
+
+    @staticmethod
+    def describe_media(file_name, info):
+        parts = [os.path.basename(file_name)]
+        if info['vcodec']:
+            w, h = engine().display_size(info)
+            parts.append(f"{w}x{h} {info['fps']:g}fps {info['vcodec']}")
+            if info['rotation']:
+                parts.append(f"회전 {info['rotation']}° (크롭은 화면 방향 기준)")
+        else:
+            parts.append("비디오 없음")
+        parts.append(info['acodec'] or "오디오 없음")
+        return "파일: " + " · ".join(parts)
+
+    def start_timeline(self, file_name):
+        self.stop_timeline()
+        self.timeline.clear()
+        self.timeline.set_duration(self.duration)
+        self.timeline_worker = TimelineWorker(file_name, self)
+        self.timeline_worker.index_ready.connect(self.set_frame_index)
+        self.timeline_worker.thumbnail_ready.connect(self.timeline.add_thumbnail)
+        self.timeline_worker.waveform_ready.connect(self.timeline.set_peaks)
+        self.timeline_worker.start()
+
+        # 예전에 분석해 둔 결과가 있으면 바로 표시
+        self.stop_analysis()
+        result = engine().cached_analysis(file_name)
+        if result is not None:
+            self.timeline.set_analysis(result)
+        self.set_analysis_available(result is not None)
+
+    # ----- 장면/무음 분석 -----
+    def start_analysis(self):
+        if not self.video_path:
+            return
+        self.stop_analysis()
+        self.timeline.set_analysis({'scenes': [], 'silences': []})
+        self.set_analysis_available(False)
+        self.btn_analyze.setEnabled(False)
+        self.analysis_worker = AnalysisWorker(self.video_path, self)
+        self.analysis_worker.scene_found.connect(self.timeline.add_scene)
+        self.analysis_worker.silence_found.connect(self.timeline.add_silence)
+        self.analysis_worker.progress.connect(lambda p: self.lbl_status.setText(f"분석 중... {p}%"))
+        self.analysis_worker.analysis_ready.connect(self.analysis_finished)
+        self.analysis_worker.failed.connect(self.analysis_failed)
+        self.analysis_worker.start()
+
+    def stop_analysis(self):
+        if self.analysis_worker is not None:
+            self.analysis_worker.requestInterruption()
+            self.analysis_worker.wait()
+            self.analysis_worker = None
+        self.btn_analyze.setEnabled(bool(self.video_path))
+
+    def analysis_finished(self, result):
+        self.timeline.set_analysis(result)
+        self.set_analysis_available(True)
+        self.btn_analyze.setEnabled(True)
+        self.lbl_status.setText(f"분석 완료: 장면 전환 {len(result['scenes'])}곳, 무음 {len(result['silences'])}구간")
+
+    def analysis_failed(self, message):
+        self.btn_analyze.setEnabled(True)
+        self.lbl_status.setText(f"분석 실패: {message}")
+
+    def set_analysis_available(self, available):
+        self.btn_scene_segments.setEnabled(available)
+        self.btn_remove_silence.setEnabled(available)
+
+    def trim_range(self):
+        end = self.end_trim if self.end_trim > 0 else self.duration / 1000.0
+        return self.start_trim, end
+
+    def scenes_to_segments(self):
+        start, end = self.trim_range()
+        ranges = engine().ranges_between(self.timeline.scenes, start, end, min_len=0.1)
+        self.replace_segments(ranges, combine=False, label="장면 → 구간")
+        self.lbl_status.setText(f"장면 {len(ranges)}개를 구간 목록으로 만들었습니다.")
+
+    def remove_silences(self):
+        start, end = self.trim_range()
+        ranges = engine().ranges_without(self.timeline.silences, start, end)
+        self.replace_segments(ranges, combine=True, label="무음 제거")
+        removed = (end - start) - sum(b - a for a, b in ranges)
+        self.lbl_status.setText(f"무음 {removed:.1f}초를 뺀 {len(ranges)}개 구간 (하나로 합치기)")
+
+    def replace_segments(self, ranges, combine, label):
+        crop = self.video_container.get_crop_rect()
+        self.restoring = True  # 합치기 체크 변경까지 한 번의 편집으로 기록
+        try:
+            self.segments = [engine().new_segment(a, b, crop) for a, b in ranges]
+            self.chk_seg_combine.setChecked(combine)
+            self.refresh_segment_list()
+        finally:
+            self.restoring = False
+        self.record_edit(label)
+
+    # ----- 프록시 미리보기 -----
+    def start_proxy(self, file_name):
+        self.stop_proxy()
+        max_mb = int(self.settings.value("proxy_cache_mb", engine().PROXY_CACHE_BYTES // (1024 * 1024)))
+        self.proxy_worker = ProxyWorker(file_name, max_mb * 1024 * 1024, self.media_info, self)
+        self.proxy_worker.info_ready.connect(lambda info, f=file_name: self.remember_media_info(f, info))
+        self.proxy_worker.progress.connect(
+            lambda p: self.lbl_status.setText(f"프록시 생성 중... {p}% (원본으로 미리보기 중)"))
+        self.proxy_worker.ready.connect(lambda path, w, h, f=file_name: self.use_proxy(f, path, w, h))
+        self.proxy_worker.start()
+
+    def stop_proxy(self):
+        if self.proxy_worker is not None:
+            self.proxy_worker.requestInterruption()
+            self.proxy_worker.wait()
+            self.proxy_worker = None
+
+    def remember_media_info(self, file_name, info):
+        if file_name == self.video_path:
+            self.media_info = info
+
+    def use_proxy(self, file_name, proxy, width, height):
+        if file_name != self.video_path or not self.chk_proxy.isChecked():
+            return
+        self.proxy_path = proxy
+        self.video_container.set_source_size(QSize(width, height))
+        self.switch_player_source(proxy)
+        self.lbl_status.setText(f"파일: {os.path.basename(file_name)} (프록시로 미리보기)")
+
+    def toggle_proxy(self, checked):
+        self.settings.setValue("use_proxy", checked)
+        if not self.video_path:
+            return
+        if checked:
+            self.start_proxy(self.video_path)
+        else:
+            self.stop_proxy()
+            if self.proxy_path:
+                self.proxy_path = None
+                self.video_container.set_source_size(self.source_display_size())
+                self.switch_player_source(self.video_path)
+                self.lbl_status.setText(f"파일: {os.path.basename(self.video_path)}")
+
+    def switch_player_source(self, path):
+        """재생 위치와 상태를 유지한 채 원본 <-> 프록시 전환 (두 파일의 시각은 같음)"""
+        playing = self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+        self.pending_seek = (self.media_player.position(), playing)
+        self.media_player.setSource(QUrl.fromLocalFile(path))
+
+    def media_status_changed(self, status):
+        if self.pending_seek is None or status not in (QMediaPlayer.MediaStatus.LoadedMedia,
+                                                       QMediaPlayer.MediaStatus.BufferedMedia):
+            return
+        position, playing = self.pending_seek
+        self.pending_seek = None
+        self.media_player.setPosition(position)
+        self.media_player.play()
+        if not playing:
             self.media_player.pause()
 
+    def stop_timeline(self):
+        if self.timeline_worker is not None:
+            self.timeline_worker.requestInterruption()
+            self.timeline_worker.wait()
+            self.timeline_worker = None
+
     def toggle_crop_mode(self):
         is_on = self.btn_crop_toggle.isChecked()
         self.video_container.set_crop_mode(is_on)
@@ -392,6 +1833,21 @@ class SolCutter(QMainWindow):
             self.btn_crop_toggle.setText("✂️ 자르기 모드 (OFF)")
             self.lbl_status.setText("준비 완료")
 
+    def show_crop_preview(self, pixmap):
+        if pixmap.isNull():
+            self.lbl_crop_preview.clear()
+            return
+        self.lbl_crop_preview.setPixmap(pixmap.scaled(self.lbl_crop_preview.size(),
+                                                      Qt.AspectRatioMode.KeepAspectRatio,
+                                                      Qt.TransformationMode.SmoothTransformation))
+
+    def update_crop_size_label(self):
+        size = self.video_container.overlay.pixel_size()
+        if size and self.video_container.get_crop_rect():
+            self.lbl_crop_size.setText(f"{size[0]} x {size[1]} px")
+        else:
+            self.lbl_crop_size.setText("")
+
     def play_video(self):
         if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.media_player.pause()
@@ -407,16 +1863,51 @@ class SolCutter(QMainWindow):
     def position_changed(self, position):
         if not self.slider.isSliderDown():
             self.slider.setValue(position)
-        self.lbl_current_time.setText(self.format_time(position))
+        self.timeline.set_position(position)
+        self.lbl_current_time.setText(self.format_clock(position / 1000.0))
 
     def duration_changed(self, duration):
         self.slider.setRange(0, duration)
         self.duration = duration
-        self.lbl_total_time.setText(self.format_time(duration))
+        self.timeline.set_duration(duration)
+        self.lbl_total_time.setText(self.format_clock(duration / 1000.0))
 
     def set_position(self, position):
         self.media_player.setPosition(position)
 
+    # ----- 프레임 단위 이동 -----
+    def set_frame_index(self, index):
+        self.frame_index = index if index and index['frames'] else None
+        for btn in self.step_buttons:
+            btn.setEnabled(self.frame_index is not None)
+        self.lbl_current_time.setText(self.format_clock(self.media_player.position() / 1000.0))
+        self.lbl_total_time.setText(self.format_clock(self.duration / 1000.0))
+        self.update_trim_label()
+
+    def current_frame(self):
+        return engine().frame_at(self.frame_index, self.media_player.position() / 1000.0)
+
+    def seek_exact(self, seconds):
+        # 밀리초 반올림으로 앞 프레임에 걸리지 않도록 올림
+        self.media_player.setPosition(max(0, math.ceil(seconds * 1000 - 1e-6)))
+
+    def step(self, direction, keyframe=False):
+        if self.frame_index is None:
+            return
+        self.media_player.pause()
+        frames = self.frame_index['frames']
+        idx = self.current_frame()
+        if keyframe:
+            keys = self.frame_index['keyframes'] or frames[:1]
+            now = frames[idx]
+            if direction > 0:
+                target = next((k for k in keys if k > now + 1e-6), frames[-1])
+            else:
+                target = next((k for k in reversed(keys) if k < now - 1e-6), frames[0])
+        else:
+            target = frames[min(max(idx + direction, 0), len(frames) - 1)]
+        self.seek_exact(target)
+
     def handle_errors(self):
         self.btn_play.setEnabled(False)
         err_msg = self.media_player.errorString()
@@ -424,58 +1915,424 @@ class SolCutter(QMainWindow):
 
     def set_start_point(self):
         self.start_trim = self.media_player.position() / 1000.0
+        if self.frame_index is not None:
+            # 현재 보이는 프레임의 시작 시각으로 맞춤
+            self.start_trim = self.frame_index['frames'][self.current_frame()]
         self.update_trim_label()
+        self.record_edit("시작점 설정")
 
     def set_end_point(self):
         self.end_trim = self.media_player.position() / 1000.0
+        if self.frame_index is not None:
+            # 현재 보이는 프레임까지 포함 (다음 프레임 시작 직전에서 끊음)
+            frames = self.frame_index['frames']
+            idx = self.current_frame()
+            self.end_trim = frames[idx + 1] if idx + 1 < len(frames) else self.duration / 1000.0
         self.update_trim_label()
+        self.record_edit("종료점 설정")
 
     def reset_trim(self):
         self.start_trim = 0.0
         self.end_trim = 0.0
         self.update_trim_label()
+        self.record_edit("구간 초기화")
 
     def update_trim_label(self):
-        s_txt = self.format_time(int(self.start_trim * 1000))
-        e_txt = self.format_time(int(self.end_trim * 1000)) if self.end_trim > 0 else "끝"
+        s_txt = self.format_clock(self.start_trim)
+        e_txt = self.format_clock(self.end_trim) if self.end_trim > 0 else "끝"
         self.lbl_trim_info.setText(f"구간: {s_txt} ~ {e_txt}")
+        self.timeline.set_trim(self.start_trim, self.end_trim)
+
+    # ----- 구간 목록 -----
+    def add_segment(self):
+        if not self.video_path: return
+        end = self.end_trim if self.end_trim > 0 else self.duration / 1000.0
+        if end - self.start_trim <= 0.01:
+            self.lbl_status.setText("종료점이 시작점보다 뒤여야 합니다.")
+            return
+        self.segments.append(engine().new_segment(self.start_trim, end, self.video_container.get_crop_rect()))
+        self.refresh_segment_list()
+        self.segment_list.setCurrentRow(len(self.segments) - 1)
+        self.record_edit("구간 추가")
+
+    def remove_segment(self):
+        row = self.segment_list.currentRow()
+        if 0 <= row < len(self.segments):
+            del self.segments[row]
+            self.refresh_segment_list()
+            self.segment_list.setCurrentRow(min(row, len(self.segments) - 1))
+            self.record_edit("구간 삭제")
+
+    def move_segment(self, offset):
+        row = self.segment_list.currentRow()
+        target = row + offset
+        if 0 <= row < len(self.segments) and 0 <= target < len(self.segments):
+            self.segments[row], self.segments[target] = self.segments[target], self.segments[row]
+            self.refresh_segment_list()
+            self.segment_list.setCurrentRow(target)
+            self.record_edit("구간 순서 변경")
+
+    def refresh_segment_list(self):
+        self.segment_list.clear()
+        for i, seg in enumerate(self.segments, 1):
+            s_txt = self.format_time(int(seg['start'] * 1000))
+            e_txt = self.format_time(int(seg['end'] * 1000))
+            crop_txt = "  [크롭]" if seg['crop'] else ""
+            self.segment_list.addItem(f"{i}. {s_txt} ~ {e_txt}{crop_txt}")
+        self.btn_save_video.setText("영상 저장 (구간 목록)" if self.segments else "영상 저장 (Crop + Trim)")
+        self.timeline.set_segments(self.segments)
 
     def export_media(self, mode):
         if not self.video_path: return
-        
-        default_name = "output.mp4"
+        output_path = self.ask_output_path(mode, "output.mp4")
+        if not output_path: return
+
+        crop_rect = self.video_container.get_crop_rect()
+        # 구간 목록이 있으면 목록 전체를 작업 하나로 (원본은 한 번만 디코딩)
+        job = engine().new_export_job(self.video_path, output_path, self.start_trim, self.end_trim, crop_rect, mode,
+                             self.combo_fast_trim.currentData(),
+                             [dict(seg) for seg in self.segments], self.chk_seg_combine.isChecked(),
+                             self.current_encoder_settings(), self.spin_chunks.value())
+        self.export_queue.add_job(job)
+        self.lbl_status.setText(f"대기열에 추가: {os.path.basename(output_path)}")
+
+    def export_clips(self):
+        """클립 목록 전체를 이어붙이는 작업 하나. 형식이 모두 같으면 엔진이 재인코딩 없이 스트림 복사로 잇는다."""
+        if len(self.clips) < 2: return
+        self.store_current_clip()
+        clips, mode = self.concat_clips()
+        default_name = os.path.splitext(self.clips[0]['file'])[0] + "_concat.mp4"
+        output_path = self.ask_output_path(mode, default_name,
+                                           "MP4 Files (*.mp4);;MKV Files (*.mkv);;MOV Files (*.mov)")
+        if not output_path: return
+        job = engine().new_export_job(clips[0]['file'], output_path, 0.0, 0.0, None, mode,
+                                      self.combo_fast_trim.currentData(),
+                                      encoder=self.current_encoder_settings(), clips=clips)
+        self.export_queue.add_job(job)
+        how = ""
+        if all(clip['info'] for clip in self.clips):
+            # 실제 저장 형식으로 무손실 여부 판단
+            reason = self.concat_copy_blocker(clips, mode, output_path)
+            how = f", 재인코딩: {reason}" if reason else ", 무손실"
+        self.lbl_status.setText(f"대기열에 추가: {os.path.basename(output_path)} (클립 {len(clips)}개 이어붙이기{how})")
+
+    def ask_output_path(self, mode, default_name, ext_filter="MP4 Files (*.mp4)"):
+        selected_filter = ""
         if mode == 'audio':
+            ext = self.settings.value("audio_format", ".mp3")
+            if ext not in self.AUDIO_FILTERS:
+                ext = ".mp3"
             date_str = datetime.now().strftime("%Y%m%d")
-            default_name = f"{date_str}_1.mp3"
-            
-        ext_filter = "MP4 Files (*.mp4)" if mode == 'video' else "MP3 Files (*.mp3)"
-        
-        output_path, _ = QFileDialog.getSaveFileName(self, "저장", default_name, ext_filter)
+            default_name = self.next_numbered_name(date_str, ext)
+            ext_filter = ";;".join(self.AUDIO_FILTERS.values())
+            selected_filter = self.AUDIO_FILTERS[ext]
+
+        output_path, chosen_filter = QFileDialog.getSaveFileName(self, "저장", default_name, ext_filter, selected_filter)
         if not output_path: return
+        if mode == 'audio':
+            # 확장자를 안 적었으면 고른 형식의 확장자를 붙임
+            ext = next((e for e, f in self.AUDIO_FILTERS.items() if f == chosen_filter), ".mp3")
+            if os.path.splitext(output_path)[1].lower() not in self.AUDIO_FILTERS:
+                output_path += ext
+            self.settings.setValue("audio_format", os.path.splitext(output_path)[1].lower())
+        elif not os.path.splitext(output_path)[1] and '*.' in chosen_filter:
+            output_path += chosen_filter[chosen_filter.index('*.') + 1:].rstrip(')')
+        return output_path
 
-        self.set_ui_locked(True)
-        self.progress_bar.setValue(0)
+    AUDIO_FILTERS = {".mp3": "MP3 (*.mp3)", ".m4a": "M4A / AAC (*.m4a)", ".aac": "AAC (*.aac)",
+                     ".opus": "Opus (*.opus)", ".flac": "FLAC (*.flac)", ".wav": "WAV (*.wav)"}
 
-        crop_rect = self.video_container.get_crop_rect()
-        self.exporter = ExportThread(self.video_path, output_path, self.start_trim, self.end_trim, crop_rect, mode)
-        
-        self.exporter.status_msg.connect(self.lbl_status.setText)
-        self.exporter.progress_val.connect(self.progress_bar.setValue)
-        self.exporter.finished_signal.connect(self.export_finished)
-        self.exporter.start()
-
-    def export_finished(self):
-        self.set_ui_locked(False)
-        QMessageBox.information(self, "완료", "저장이 완료되었습니다!")
-        self.lbl_status.setText("준비 완료")
-        self.progress_bar.setValue(100)
-
-    def set_ui_locked(self, locked):
-        self.btn_open.setDisabled(locked)
-        self.btn_save_video.setDisabled(locked)
-        self.btn_save_audio.setDisabled(locked)
-        self.btn_crop_toggle.setDisabled(locked)
-        self.video_container.setDisabled(locked)
+    # ----- 인코딩 설정 -----
+    def custom_encoder_settings(self):
+        try:
+            saved = json.loads(self.settings.value("encoder_custom", "{}"))
+            return engine().encoder_settings('standard', **saved)
+        except (TypeError, ValueError):
+            return engine().encoder_settings()
+
+    def current_encoder_settings(self):
+        profile = self.combo_profile.currentData()
+        if profile == 'custom':
+            return self.custom_encoder_settings()
+        return engine().encoder_settings(profile)
+
+    def edit_encoder_settings(self):
+        dialog = EncoderSettingsDialog(self.current_encoder_settings(), self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.settings.setValue("encoder_custom", json.dumps(dialog.values()))
+            self.combo_profile.setCurrentIndex(self.combo_profile.findData('custom'))
+
+    def next_numbered_name(self, prefix, ext):
+        """YYYYMMDD_n 형식에서 디스크나 대기열에 아직 없는 n을 고른다."""
+        taken = {os.path.basename(j['output']) for j in self.export_queue.jobs}
+        n = 1
+        while f"{prefix}_{n}{ext}" in taken or os.path.exists(f"{prefix}_{n}{ext}"):
+            n += 1
+        return f"{prefix}_{n}{ext}"
+
+    def export_finished(self, job):
+        name = os.path.basename(job['output'])
+        if job['state'] == 'done':
+            self.lbl_status.setText(f"저장 완료: {name}")
+        elif job['state'] == 'error':
+            self.lbl_status.setText(f"{name} - {job['message']}")
+        self.update_total_progress()
+
+    # ----- 대기열 표시 -----
+    STATE_LABELS = {'pending': "대기", 'running': "진행", 'done': "완료",
+                    'error': "실패", 'canceled': "취소"}
+
+    def refresh_queue_table(self):
+        self.queue_table.setRowCount(len(self.export_queue.jobs))
+        for row in range(len(self.export_queue.jobs)):
+            self.update_queue_row(row)
+
+    def update_queue_row(self, row):
+        job = self.export_queue.jobs[row]
+        s_txt = self.format_time(int(job['start'] * 1000))
+        e_txt = self.format_time(int(job['end'] * 1000)) if job['end'] > 0 else "끝"
+        span = f"클립 {len(job['clips'])}개" if job.get('clips') else f"{s_txt} ~ {e_txt}"
+        state = self.STATE_LABELS.get(job['state'], job['state'])
+        if job['state'] == 'running':
+            state += f" {job['progress']}%"
+        message = job['message']
+        if job.get('stats') and job['state'] in ('running', 'done'):
+            message += f"  ({engine().format_stats(job['stats'])})"
+        cells = [os.path.basename(job['output']), span, state, message]
+        for col, text in enumerate(cells):
+            item = self.queue_table.item(row, col)
+            if item is None:
+                self.queue_table.setItem(row, col, QTableWidgetItem(text))
+            else:
+                item.setText(text)
+        self.update_total_progress()
+
+    def update_total_progress(self):
+        jobs = [j for j in self.export_queue.jobs if j['state'] != 'canceled']
+        if jobs:
+            self.progress_bar.setValue(sum(j['progress'] for j in jobs) // len(jobs))
+
+    def selected_queue_rows(self):
+        return sorted({index.row() for index in self.queue_table.selectionModel().selectedRows()})
+
+    def cancel_selected_jobs(self):
+        for row in self.selected_queue_rows():
+            self.export_queue.cancel(row)
+
+    def retry_selected_jobs(self):
+        for row in self.selected_queue_rows():
+            self.export_queue.retry(row)
+
+    # ----- 편집 기록 (실행 취소) -----
+    def edit_state(self):
+        crop = self.video_container.get_crop_rect()
+        return {'start': self.start_trim, 'end': self.end_trim, 'crop': list(crop) if crop else None,
+                'segments': [dict(seg) for seg in self.segments], 'combine': self.chk_seg_combine.isChecked()}
+
+    def apply_edit_state(self, state):
+        self.restoring = True
+        try:
+            self.start_trim, self.end_trim = state['start'], state['end']
+            self.segments = [dict(seg) for seg in state['segments']]
+            self.chk_seg_combine.setChecked(state['combine'])
+            if (state['crop'] is not None) != self.btn_crop_toggle.isChecked():
+                self.btn_crop_toggle.setChecked(state['crop'] is not None)
+                self.toggle_crop_mode()
+            if state['crop'] is not None:
+                self.video_container.set_crop_rect(state['crop'])
+            self.refresh_segment_list()
+            self.update_trim_label()
+        finally:
+            self.restoring = False
+
+    def record_edit(self, label):
+        if self.restoring or not self.video_path:
+            return
+        if self.history.record(self.edit_state(), label):
+            self.clip_edited()
+            self.update_edit_actions()
+
+    def clip_edited(self):
+        self.store_current_clip()
+        self.refresh_clip_list()
+
+    def crop_edited(self):
+        # 드래그 중에는 기록하지 않고 놓았을 때 한 번만
+        if not self.video_container.overlay.drawing:
+            self.record_edit("크롭")
+
+    def undo_edit(self):
+        label = self.history.undo_label()
+        state = self.history.undo()
+        if state is not None:
+            self.apply_edit_state(state)
+            self.clip_edited()
+            self.lbl_status.setText(f"실행 취소: {label}")
+        self.update_edit_actions()
+
+    def redo_edit(self):
+        state = self.history.redo()
+        if state is not None:
+            self.apply_edit_state(state)
+            self.clip_edited()
+            self.lbl_status.setText(f"다시 실행: {self.history.undo_label()}")
+        self.update_edit_actions()
+
+    def update_edit_actions(self):
+        self.act_undo.setEnabled(self.history.can_undo())
+        self.act_undo.setText(f"실행 취소: {self.history.undo_label()}" if self.history.can_undo() else "실행 취소")
+        self.act_redo.setEnabled(self.history.can_redo())
+        self.act_redo.setText(f"다시 실행: {self.history.redo_label()}" if self.history.can_redo() else "다시 실행")
+        self.act_save.setEnabled(bool(self.video_path))
+        self.act_save_as.setEnabled(bool(self.video_path))
+        if self.project_path:
+            name = os.path.basename(self.project_path)
+        else:
+            name = "제목 없음" if self.video_path else ""
+        modified = "*" if self.video_path and self.is_modified() else ""
+        self.setWindowTitle(f"{name}{modified} - SolCutter" if name else "SolCutter - Video Editor")
+
+    # ----- 프로젝트 파일 -----
+    RECENT_PROJECTS = 10
+
+    def is_modified(self):
+        return self.bin_modified or self.history.is_modified()
+
+    def maybe_save(self):
+        """저장하지 않은 편집이 있으면 물어본다. 계속 진행해도 되면 True"""
+        if not self.video_path or not self.is_modified():
+            return True
+        buttons = (QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard
+                   | QMessageBox.StandardButton.Cancel)
+        answer = QMessageBox.question(self, "저장", "저장하지 않은 편집 내용이 있습니다. 프로젝트로 저장할까요?", buttons)
+        if answer == QMessageBox.StandardButton.Save:
+            return self.save_project()
+        return answer == QMessageBox.StandardButton.Discard
+
+    def save_project(self, save_as=False):
+        if not self.video_path:
+            return False
+        path = self.project_path
+        if save_as or not path:
+            ext = engine().PROJECT_EXT
+            default = os.path.splitext(self.video_path)[0] + ext
+            path, _ = QFileDialog.getSaveFileName(self, "프로젝트 저장", default, f"SolCutter 프로젝트 (*{ext})")
+            if not path:
+                return False
+            if not path.lower().endswith(ext):
+                path += ext
+        self.store_current_clip()
+        try:
+            project = {
+                'source': engine().project_source(self.video_path, self.media_info),
+                'edit': self.edit_state(),
+                'export': {'fast_trim': self.combo_fast_trim.currentData(),
+                           'profile': self.combo_profile.currentData(),
+                           'encoder': self.current_encoder_settings(), 'chunk_workers': self.spin_chunks.value()},
+                'view': {'position': self.media_player.position(), 'aspect': self.combo_aspect.currentIndex(),
+                         'snap_even': self.chk_snap_even.isChecked()},
+            }
+            if len(self.clips) > 1:
+                # 클립 목록: 편집 중인 클립은 위의 source/edit와 같고, current로 위치를 남김
+                project['clips'] = [{'source': engine().project_source(clip['file'], clip['info']),
+                                     'edit': clip['edit']} for clip in self.clips]
+                project['current'] = self.clip_row
+            engine().save_project(path, project)
+        except (OSError, engine().FFmpegError) as e:
+            QMessageBox.warning(self, "프로젝트 저장", f"저장하지 못했습니다: {e}")
+            return False
+        self.media_info = project['source']['info']
+        for clip, saved in zip(self.clips, project.get('clips', [])):
+            clip['info'] = saved['source']['info']
+        self.project_path = path
+        self.bin_modified = False
+        self.history.mark_saved()
+        self.add_recent_project(path)
+        self.update_edit_actions()
+        self.lbl_status.setText(f"프로젝트 저장: {os.path.basename(path)}")
+        return True
+
+    def open_project(self, path=None):
+        if not self.maybe_save():
+            return
+        if path is None:
+            ext = engine().PROJECT_EXT
+            path, _ = QFileDialog.getOpenFileName(self, "프로젝트 열기", "", f"SolCutter 프로젝트 (*{ext})")
+            if not path:
+                return
+        try:
+            project = engine().load_project(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "프로젝트 열기", str(e))
+            return
+        source, export, view = project['source'], project['export'], project['view']
+        self.clips = [{'file': clip['source']['path'], 'info': clip['source'].get('info'), 'edit': clip.get('edit')}
+                      for clip in project['clips']]
+        self.clip_row = project.get('current', 0)
+        if not 0 <= self.clip_row < len(self.clips):
+            # 클립 목록 없이 저장된 (이전 버전) 프로젝트는 원본 하나짜리 목록
+            self.clips = [{'file': source['path'], 'info': source.get('info'), 'edit': None}]
+            self.clip_row = 0
+        self.probe_clips()
+        # 원본이 그대로면 저장해 둔 probe 결과를 쓰고, 타임라인/분석/프록시는 같은 캐시 키로 바로 불러옴
+        self.load_source(source['path'], source.get('info'))
+
+        idx = self.combo_fast_trim.findData(export.get('fast_trim'))
+        if idx >= 0:
+            self.combo_fast_trim.setCurrentIndex(idx)
+        if export.get('profile') == 'custom' and export.get('encoder'):
+            self.settings.setValue("encoder_custom", json.dumps(export['encoder']))
+        idx = self.combo_profile.findData(export.get('profile'))
+        if idx >= 0:
+            self.combo_profile.setCurrentIndex(idx)
+        self.spin_chunks.setValue(int(export.get('chunk_workers', 0)))
+        if 0 <= view.get('aspect', -1) < self.combo_aspect.count():
+            self.combo_aspect.setCurrentIndex(view['aspect'])
+        self.chk_snap_even.setChecked(view.get('snap_even', True))
+
+        edit = {'start': 0.0, 'end': 0.0, 'crop': None, 'segments': [], 'combine': False}
+        edit.update(project['edit'])
+        self.apply_edit_state(edit)
+        self.pending_seek = (int(view.get('position', 0)), False)
+
+        self.store_current_clip()
+        self.refresh_clip_list()
+        self.project_path = path
+        self.bin_modified = False
+        self.history.reset(self.edit_state())
+        self.history.mark_saved()
+        self.add_recent_project(path)
+        self.update_edit_actions()
+        self.lbl_status.setText(f"프로젝트: {os.path.basename(path)}")
+
+    def recent_projects(self):
+        try:
+            paths = json.loads(self.settings.value("recent_projects", "[]"))
+        except (TypeError, ValueError):
+            return []
+        return [p for p in paths if os.path.exists(p)]
+
+    def add_recent_project(self, path):
+        path = os.path.abspath(path)
+        paths = [path] + [p for p in self.recent_projects() if os.path.abspath(p) != path]
+        self.settings.setValue("recent_projects", json.dumps(paths[:self.RECENT_PROJECTS], ensure_ascii=False))
+
+    def refresh_recent_menu(self):
+        self.recent_menu.clear()
+        paths = self.recent_projects()
+        if not paths:
+            self.recent_menu.addAction("(없음)").setEnabled(False)
+            return
+        for path in paths:
+            act = self.recent_menu.addAction(os.path.basename(path))
+            act.setToolTip(path)
+            act.triggered.connect(lambda checked=False, p=path: self.open_project(p))
+
+    def format_clock(self, seconds):
+        """프레임 인덱스가 있으면 HH:MM:SS:FF 타임코드, 없으면 기존 표시"""
+        if self.frame_index is not None:
+            return engine().format_timecode(seconds, self.frame_index['fps'])
+        return self.format_time(int(seconds * 1000))
 
     @staticmethod
     def format_time(ms):
@@ -485,8 +2342,12 @@ class SolCutter(QMainWindow):
         if hours > 0: return f"{hours:02}:{minutes:02}:{seconds:02}"
         return f"{minutes:02}:{seconds:02}"
 
+# 실행 위치와 상관없이 스크립트(또는 패키징된 실행 파일) 옆의 source 폴더에서 찾음
+APP_DIR = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+
 def load_custom_font(app):
-    font_path = os.path.join("source", "Pretendard-SemiBold.otf")
+    font_path = os.path.join(APP_DIR, "source", "Pretendard-SemiBold.otf")
     if os.path.exists(font_path):
         font_id = QFontDatabase.addApplicationFont(font_path)
         if font_id != -1:
@@ -495,9 +2356,19 @@ def load_custom_font(app):
                 app.setFont(QFont(families[0], 10))
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
+    # 패키징된 실행 파일에서는 대기열 워커도 이 실행 파일로 뜨므로 창을 띄우지 않고 워커만 실행
+    if sys.argv[1:] == ['--export-worker']:
+        engine().export_worker_main()
+        sys.exit(0)
+    app = QApplication([arg for arg in sys.argv if arg != '--startup-timing'])
     app.setStyle('Fusion')
+    startup_mark("QApplication")
     load_custom_font(app)
+    startup_mark("폰트")
     window = SolCutter()
+    startup_mark("창 구성")
     window.show()
+    # 첫 이벤트 루프 차례 = 창이 실제로 그려진 뒤. 그때 엔진을 미리 불러 첫 내보내기를 빠르게
+    QTimer.singleShot(0, lambda: (startup_mark("첫 표시"),
+                                  threading.Thread(target=prewarm_engine, daemon=True).start()))
     sys.exit(app.exec())
\ No newline at end of file
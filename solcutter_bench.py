@@ -0,0 +1,277 @@
+"""
+SolCutter 내보내기 엔진 벤치마크 (디스플레이/GPU 없이 실행)
+
+    python solcutter_bench.py --quick                       # 작은 합성 영상 하나로 빠르게 확인
+    python solcutter_bench.py -o baseline.json              # 기본 매트릭스 측정 후 저장
+    python solcutter_bench.py --baseline baseline.json      # 저장된 기준과 비교 (느려지면 종료 코드 1)
+    python solcutter_bench.py --cases crop,trim_crop --repeat 3
+
+합성 영상은 ffmpeg lavfi(testsrc2 + sine)로 만들어 작업 폴더에 보관하고 다음 실행 때 재사용한다.
+측정 항목: 경과 시간, 실시간 대비 배속, CPU 사용량, 최대 메모리(RSS), 출력 크기.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+import multiprocessing
+
+try:
+    import resource  # 리눅스/맥 전용. 없으면 CPU/메모리 항목은 None
+except ImportError:
+    resource = None
+
+import solcutter_engine as engine
+
+# ==========================================
+# 1. 합성 미디어
+# ==========================================
+RESOLUTIONS = {'480p': (854, 480), '720p': (1280, 720), '1080p': (1920, 1080), '2160p': (3840, 2160)}
+SOURCE_ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+GOP_SECONDS = 2  # 녹화 프로그램과 비슷한 키프레임 간격
+
+# (코덱, 해상도, 길이(초), 오디오 여부)
+MATRICES = {
+    'quick': [('h264', '480p', 10, True)],
+    'default': [('h264', '720p', 30, True), ('h264', '1080p', 30, True),
+                ('h264', '1080p', 30, False), ('hevc', '1080p', 30, True)],
+    'full': [('h264', '720p', 30, True), ('h264', '1080p', 30, True), ('h264', '1080p', 120, True),
+             ('h264', '1080p', 30, False), ('hevc', '1080p', 30, True), ('h264', '2160p', 30, True),
+             ('hevc', '2160p', 30, True)],
+}
+
+
+def media_name(codec, resolution, duration, audio):
+    return f"{codec}_{resolution}_{duration}s_{'aac' if audio else 'noaudio'}.mp4"
+
+
+def make_media(work_dir, codec, resolution, duration, audio, fps=30):
+    """합성 영상 생성 (이미 있으면 그대로 사용)"""
+    path = os.path.join(work_dir, media_name(codec, resolution, duration, audio))
+    if os.path.exists(path):
+        return path
+    width, height = RESOLUTIONS[resolution]
+    args = [engine.get_ffmpeg_exe(), '-hide_banner', '-nostdin', '-y', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', f'testsrc2=size={width}x{height}:rate={fps}:duration={duration}']
+    if audio:
+        args += ['-f', 'lavfi', '-i', f'sine=frequency=440:sample_rate=48000:duration={duration}']
+    args += ['-c:v', SOURCE_ENCODERS[codec], '-preset', 'veryfast', '-g', str(fps * GOP_SECONDS),
+             '-pix_fmt', 'yuv420p']
+    if codec == 'hevc':
+        args += ['-tag:v', 'hvc1', '-x265-params', 'log-level=error']
+    if audio:
+        args += ['-c:a', 'aac', '-b:a', '128k']
+    tmp = path + '.part.mp4'
+    subprocess.run(args + [tmp], check=True)
+    os.replace(tmp, path)
+    return path
+
+# ==========================================
+# 2. 측정 케이스
+# ==========================================
+CROP = (0.25, 0.25, 0.5, 0.5)
+
+# 이름 -> (설명, 오디오 필요 여부, 작업 인자를 만드는 함수(길이) )
+CASES = {
+    'trim_copy': ("가운데 절반 자르기 (스트림 복사)", False,
+                  lambda d: dict(start=d * 0.25, end=d * 0.75, fast_trim='keyframe', ext='.mp4')),
+    'trim_reencode': ("가운데 절반 자르기 (재인코딩)", False,
+                      lambda d: dict(start=d * 0.25, end=d * 0.75, fast_trim='off', ext='.mp4')),
+    'crop': ("전체 길이 크롭", False,
+             lambda d: dict(start=0.0, end=0.0, crop=CROP, fast_trim='off', ext='.mp4')),
+    'trim_crop': ("가운데 절반 자르기 + 크롭", False,
+                  lambda d: dict(start=d * 0.25, end=d * 0.75, crop=CROP, fast_trim='off', ext='.mp4')),
+    'crop_chunked': ("전체 길이 크롭 (4개 조각 병렬)", False,
+                     lambda d: dict(start=0.0, end=0.0, crop=CROP, fast_trim='off', ext='.mp4', chunk_workers=4)),
+    'concat_copy': ("앞/뒤 절반 이어붙이기 (스트림 복사)", False,
+                    lambda d: dict(start=0.0, end=0.0, fast_trim='keyframe', ext='.mp4',
+                                   clips=[(0.0, d * 0.5), (d * 0.5, 0.0)])),
+    'concat_reencode': ("앞/뒤 절반 이어붙이기 (재인코딩)", False,
+                        lambda d: dict(start=0.0, end=0.0, fast_trim='off', ext='.mp4',
+                                       clips=[(0.0, d * 0.5), (d * 0.5, 0.0)])),
+    'audio_copy': ("오디오 추출 (AAC 복사 → m4a)", True,
+                   lambda d: dict(start=0.0, end=0.0, mode='audio', fast_trim='keyframe', ext='.m4a')),
+    'audio_mp3': ("오디오 추출 (mp3 인코딩)", True,
+                  lambda d: dict(start=0.0, end=0.0, mode='audio', fast_trim='off', ext='.mp3')),
+}
+
+
+def _rusage():
+    if resource is None:
+        return None
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own, children
+
+
+def _rss_mb(maxrss):
+    # ru_maxrss 단위: 리눅스는 KB, 맥은 바이트
+    return round(maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_case(src, output, params, profile):
+    """
+    새 프로세스 안에서 실행되어야 한다. RUSAGE_CHILDREN의 최대 RSS는 누적값이라
+    케이스마다 프로세스를 새로 띄워야 그 케이스의 ffmpeg 메모리만 잡힌다.
+    """
+    before = _rusage()
+    t0 = time.perf_counter()
+    engine.export(src, output, params['start'], params['end'], params.get('crop'), params.get('mode', 'video'),
+                  params['fast_trim'], encoder=engine.encoder_settings(profile),
+                  chunk_workers=params.get('chunk_workers', 0),
+                  clips=[engine.new_clip(src, start, end) for start, end in params.get('clips', [])])
+    wall = time.perf_counter() - t0
+    after = _rusage()
+
+    result = {'wall': round(wall, 3), 'output_bytes': os.path.getsize(output),
+              'cpu_seconds': None, 'cpu_util': None, 'peak_rss_mb': None, 'python_rss_mb': None}
+    if before and after:
+        cpu = sum(getattr(a, f) - getattr(b, f)
+                  for a, b in zip(after, before) for f in ('ru_utime', 'ru_stime'))
+        result.update(cpu_seconds=round(cpu, 2),
+                      cpu_util=round(cpu / max(wall, 1e-6), 2),  # 1.0 = 코어 하나를 꽉 채움
+                      peak_rss_mb=_rss_mb(after[1].ru_maxrss),
+                      python_rss_mb=_rss_mb(after[0].ru_maxrss))
+    return result
+
+
+def _run_isolated(ctx, *args):
+    with ctx.Pool(1) as pool:
+        return pool.apply(run_case, args)
+
+# ==========================================
+# 3. 보고서 / 기준 비교
+# ==========================================
+def host_info():
+    try:
+        version = subprocess.run([engine.get_ffmpeg_exe(), '-version'],
+                                 capture_output=True, text=True).stdout.split('\n', 1)[0]
+    except OSError:
+        version = None
+    return {'platform': platform.platform(), 'python': platform.python_version(),
+            'cpu_count': os.cpu_count(), 'ffmpeg': version}
+
+
+def run_benchmark(work_dir, matrix, cases, repeat=1, profile='standard', log=print):
+    ctx = multiprocessing.get_context('spawn')
+    out_dir = os.path.join(work_dir, 'out')
+    os.makedirs(out_dir, exist_ok=True)
+    results = []
+    for codec, resolution, duration, audio in matrix:
+        log(f"합성 영상 준비: {media_name(codec, resolution, duration, audio)}")
+        src = make_media(work_dir, codec, resolution, duration, audio)
+        for case in cases:
+            title, needs_audio, make_params = CASES[case]
+            if needs_audio and not audio:
+                continue
+            params = make_params(duration)
+            output = os.path.join(out_dir, f"{case}{params['ext']}")
+            runs = [_run_isolated(ctx, src, output, params, profile) for _ in range(repeat)]
+            # 여러 번 돌렸으면 경과 시간이 중앙값인 실행을 대표로
+            runs.sort(key=lambda r: r['wall'])
+            median = dict(runs[len(runs) // 2])
+            media_seconds = (params['end'] or duration) - params['start']
+            if params.get('clips'):
+                media_seconds = sum((end or duration) - start for start, end in params['clips'])
+            median.update(case=case, media=os.path.basename(src), codec=codec, resolution=resolution,
+                        audio=audio, media_seconds=media_seconds,
+                        realtime_factor=round(media_seconds / max(median['wall'], 1e-6), 2),
+                        walls=[r['wall'] for r in runs])
+            if repeat > 1:
+                median['wall_stdev'] = round(statistics.stdev(median['walls']), 3)
+            results.append(median)
+            log(f"  {case:14} {median['wall']:7.2f}s  x{median['realtime_factor']:<7} "
+                f"cpu {median['cpu_util']}  rss {median['peak_rss_mb']}MB  ({title})")
+    return {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'profile': profile, 'repeat': repeat,
+            'host': host_info(), 'results': results}
+
+
+def result_key(result):
+    return f"{result['media']}/{result['case']}"
+
+
+def compare(report, baseline, threshold=0.10):
+    """
+    기준 보고서와 경과 시간을 비교한다. (행 목록, 느려진 항목 수)
+    threshold 0.10 = 10% 넘게 느려지면 회귀로 본다.
+    """
+    base = {result_key(r): r for r in baseline.get('results', [])}
+    rows, regressions = [], 0
+    for result in report['results']:
+        old = base.get(result_key(result))
+        if old is None:
+            rows.append((result_key(result), None, result['wall'], None, "새 항목"))
+            continue
+        ratio = result['wall'] / max(old['wall'], 1e-6)
+        verdict = ""
+        if ratio > 1 + threshold:
+            verdict = "느려짐"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            verdict = "빨라짐"
+        rows.append((result_key(result), old['wall'], result['wall'], ratio, verdict))
+    return rows, regressions
+
+
+def print_comparison(rows):
+    print(f"{'항목':48} {'기준':>8} {'현재':>8} {'비율':>7}")
+    for key, old, new, ratio, verdict in rows:
+        old_txt = f"{old:.2f}s" if old is not None else "-"
+        ratio_txt = f"{ratio:.2f}" if ratio is not None else "-"
+        print(f"{key:48} {old_txt:>8} {new:>7.2f}s {ratio_txt:>7}  {verdict}")
+
+# ==========================================
+# 4. 명령줄
+# ==========================================
+def build_parser():
+    parser = argparse.ArgumentParser(prog="solcutter_bench", description="SolCutter 내보내기 벤치마크")
+    parser.add_argument('--matrix', choices=tuple(MATRICES), default='default', help="합성 영상 조합")
+    parser.add_argument('--quick', action='store_true', help="--matrix quick 와 같음")
+    parser.add_argument('--cases', default=','.join(CASES), help=f"쉼표로 구분 ({', '.join(CASES)})")
+    parser.add_argument('--repeat', type=int, default=1, help="케이스마다 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--profile', choices=tuple(engine.ENCODER_PROFILES), default='standard')
+    parser.add_argument('--work-dir', help="합성 영상/출력 보관 위치 (기본: 캐시 폴더/bench)")
+    parser.add_argument('-o', '--output', help="JSON 보고서 저장 경로")
+    parser.add_argument('--baseline', help="비교할 기준 보고서")
+    parser.add_argument('--threshold', type=float, default=0.10, help="회귀로 볼 느려짐 비율 (기본 0.10)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    cases = [c.strip() for c in args.cases.split(',') if c.strip()]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        print(f"알 수 없는 케이스: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    work_dir = args.work_dir or os.path.join(engine.cache_dir(), 'bench')
+    os.makedirs(work_dir, exist_ok=True)
+    # 벤치마크 실행이 사용자 내보내기 기록에 섞이지 않도록 (자식 프로세스에도 상속됨)
+    os.environ.setdefault('SOLCUTTER_EXPORT_LOG', os.path.join(work_dir, 'export_log.jsonl'))
+
+    matrix = MATRICES['quick' if args.quick else args.matrix]
+    report = run_benchmark(work_dir, matrix, cases, max(1, args.repeat), args.profile)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"보고서 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows, regressions = compare(report, baseline, args.threshold)
+        print()
+        print_comparison(rows)
+        if regressions:
+            print(f"\n{regressions}개 항목이 {args.threshold:.0%} 넘게 느려졌습니다.", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
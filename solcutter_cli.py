@@ -0,0 +1,207 @@
+"""
+SolCutter 명령줄 도구 (GUI 없이 실행)
+
+    python solcutter_cli.py export input.mp4 -o out.mp4 --start 1:30 --end 2:00 --crop 0.1,0.1,0.5,0.5
+    python solcutter_cli.py export input.mp4 -o out.mp3 --mode audio
+    python solcutter_cli.py export input.mp4 -o out.m4a --mode audio   # AAC 원본이면 재인코딩 없이 복사
+    python solcutter_cli.py export input.mp4 -o best.mp4 --segment 0:10-0:20 --segment 5:00-5:30 --combine
+    python solcutter_cli.py export long.mp4 -o out.mp4 --crop 0,0,0.5,1 --chunks 4   # 병렬 분할 인코딩, 이어서 가능
+    python solcutter_cli.py concat cam_001.mp4 cam_002.mp4 cam_003.mp4 -o all.mp4   # 형식이 같으면 재인코딩 없이
+    python solcutter_cli.py concat a.mp4@0:10-1:00 b.mov@5- -o joined.mp4           # 파일별 구간 (@시작-끝)
+    python solcutter_cli.py batch jobs.json --workers 4
+    python solcutter_cli.py watch rule.json            # 감시 폴더 자동 처리 (규칙 형식은 solcutter_watch.py 참고)
+"""
+import re
+import sys
+import argparse
+
+import solcutter_engine as engine
+
+
+def print_event(job, kind, value):
+    name = job['output']
+    if kind == 'status':
+        print(f"[{name}] {value}", flush=True)
+    elif kind == 'error':
+        print(f"[{name}] 에러: {value}", file=sys.stderr, flush=True)
+    elif kind == 'canceled':
+        print(f"[{name}] 취소됨", file=sys.stderr, flush=True)
+
+
+def parse_segment(text, crop=None):
+    """'0:10-0:25' 형식의 구간. 크롭은 --crop 값을 모든 구간에 적용"""
+    start, sep, end = text.partition('-')
+    if not sep:
+        raise ValueError(f"구간은 시작-끝 형식이어야 합니다: {text}")
+    return engine.new_segment(engine.parse_time(start), engine.parse_time(end), engine.parse_crop(crop))
+
+
+def parse_clip(text):
+    """'a.mp4' 또는 'a.mp4@0:10-1:00' (끝을 비우면 파일 끝까지). @ 뒤가 구간이 아니면 파일 이름의 일부로 봄"""
+    path, sep, span = text.rpartition('@')
+    if sep and re.fullmatch(r'[\d:.]*-[\d:.]*', span):
+        start, _, end = span.partition('-')
+        return engine.new_clip(path, engine.parse_time(start), engine.parse_time(end))
+    return engine.new_clip(text)
+
+
+def encoder_from_args(args):
+    return engine.encoder_settings(args.profile, vcodec=args.vcodec, preset=args.preset, crf=args.crf,
+                                   rate_mode='bitrate' if args.bitrate else None, bitrate=args.bitrate,
+                                   threads=args.threads, tune=args.tune,
+                                   audio_bitrate=args.audio_bitrate, max_height=args.max_height)
+
+
+def run_export(file_path, output, **kwargs):
+    """engine.export를 실행하면서 진행률을 출력한다. 종료 코드를 돌려줌"""
+    last = {'progress': -1, 'stats': None}
+
+    def progress(value):
+        # 10% 단위로만 출력
+        if value // 10 != last['progress'] // 10:
+            stats = f"  ({engine.format_stats(last['stats'])})" if last['stats'] else ''
+            print(f"  {value}%{stats}", flush=True)
+        last['progress'] = value
+
+    def remember_stats(snapshot):
+        last['stats'] = snapshot
+
+    try:
+        engine.export(file_path, output, progress_cb=progress, status_cb=lambda msg: print(msg, flush=True),
+                      stats_cb=remember_stats, **kwargs)
+    except KeyboardInterrupt:
+        # ffmpeg 종료와 만들다 만 파일 삭제는 엔진에서 처리됨
+        print("취소됨", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"에러: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_export(args):
+    try:
+        segments = [parse_segment(text, args.crop) for text in args.segment or []]
+        start, end = engine.parse_time(args.start), engine.parse_time(args.end)
+        crop = engine.parse_crop(args.crop)
+        encoder = encoder_from_args(args)
+    except ValueError as e:
+        print(f"에러: {e}", file=sys.stderr)
+        return 1
+    return run_export(args.input, args.output or engine.default_output_path(args.input, args.mode),
+                      start=start, end=end, crop=crop,
+                      mode=args.mode, fast_trim=args.fast_trim, segments=segments, combine=args.combine,
+                      encoder=encoder, chunk_workers=args.chunks)
+
+
+def cmd_concat(args):
+    try:
+        clips = [parse_clip(text) for text in args.inputs]
+        encoder = encoder_from_args(args)
+    except ValueError as e:
+        print(f"에러: {e}", file=sys.stderr)
+        return 1
+    return run_export(clips[0]['file'], args.output, mode=args.mode, fast_trim=args.fast_trim,
+                      encoder=encoder, clips=clips)
+
+
+def cmd_batch(args):
+    jobs = []
+    for manifest in args.manifest:
+        jobs += engine.load_manifest(manifest)
+    if not jobs:
+        print("처리할 작업이 없습니다.", file=sys.stderr)
+        return 1
+
+    print(f"{len(jobs)}개 작업 시작", flush=True)
+    engine.run_batch(jobs, args.workers, print_event)
+    failed = [j for j in jobs if j['state'] != 'done']
+    print(f"완료 {len(jobs) - len(failed)} / 실패 {len(failed)}")
+    return 1 if failed else 0
+
+
+def cmd_watch(args):
+    import solcutter_watch
+    try:
+        rule = solcutter_watch.load_rule(args.rule)
+        if args.workers:
+            rule['workers'] = max(1, args.workers)
+        watcher = solcutter_watch.FolderWatcher(rule)
+    except Exception as e:
+        print(f"에러: {e}", file=sys.stderr)
+        return 1
+    try:
+        watcher.run(once=args.once)
+    except KeyboardInterrupt:
+        print("감시 종료", file=sys.stderr)
+        return 130
+    return 0
+
+
+def add_encoder_args(parser):
+    enc = parser.add_argument_group("인코딩 설정 (재인코딩할 때만 적용)")
+    enc.add_argument('--profile', choices=tuple(engine.ENCODER_PROFILES), default='standard',
+                     help="draft = ultrafast + 540p 미리보기용")
+    enc.add_argument('--vcodec', choices=engine.VIDEO_ENCODERS)
+    enc.add_argument('--preset', choices=engine.X264_PRESETS)
+    enc.add_argument('--crf', type=int)
+    enc.add_argument('--bitrate', help="지정하면 CRF 대신 비트레이트 모드 (예: 8M)")
+    enc.add_argument('--threads', type=int, help="0 = 자동")
+    enc.add_argument('--tune', choices=[t for t in engine.X264_TUNES if t])
+    enc.add_argument('--audio-bitrate', help="mp3/m4a/aac/opus 비트레이트 (예: 192k)")
+    enc.add_argument('--max-height', type=int, help="이보다 크면 비율 유지하며 축소")
+    return enc
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="solcutter", description="SolCutter 명령줄 내보내기")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('export', help="파일 하나 자르기/크롭/오디오 추출")
+    p.add_argument('input')
+    p.add_argument('-o', '--output', help="출력 경로 (기본: <입력>_cut.mp4 / .mp3). "
+                                          "오디오는 확장자로 형식 선택: mp3, m4a, aac, opus, flac, wav")
+    p.add_argument('--start', default='0', help="시작 시각 (초 또는 HH:MM:SS)")
+    p.add_argument('--end', default='0', help="종료 시각 (0 = 끝까지)")
+    p.add_argument('--crop', help="정규화 크롭 영역 x,y,w,h (0~1)")
+    p.add_argument('--segment', action='append', metavar='START-END',
+                   help="여러 구간을 한 번의 디코딩으로 내보내기 (반복 지정, 예: --segment 0:10-0:20)")
+    p.add_argument('--combine', action='store_true', help="구간들을 파일 하나로 이어붙이기")
+    p.add_argument('--mode', choices=engine.EXPORT_MODES, default='video')
+    p.add_argument('--fast-trim', choices=engine.FAST_TRIM_MODES, default='keyframe',
+                   help="크롭이 없을 때 재인코딩 없이 자르는 방식 (off면 오디오도 항상 재인코딩)")
+    enc = add_encoder_args(p)
+    enc.add_argument('--chunks', type=int, default=0, metavar='N',
+                     help="키프레임 조각으로 나눠 N개씩 동시에 인코딩. 중단된 뒤 같은 명령을 다시 실행하면 "
+                          "끝난 조각은 건너뜀 (기본 0 = 나누지 않음)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser('concat', help="여러 파일(의 구간)을 순서대로 이어붙이기")
+    p.add_argument('inputs', nargs='+', metavar='INPUT[@START-END]')
+    p.add_argument('-o', '--output', required=True)
+    p.add_argument('--mode', choices=engine.EXPORT_MODES, default='video')
+    p.add_argument('--fast-trim', choices=engine.FAST_TRIM_MODES, default='keyframe',
+                   help="코덱/해상도/fps/오디오 형식이 모두 같으면 재인코딩 없이 이어붙임 (off면 항상 재인코딩)")
+    add_encoder_args(p)
+    p.set_defaults(func=cmd_concat)
+
+    p = sub.add_parser('batch', help="JSON/CSV 매니페스트의 작업을 병렬 처리")
+    p.add_argument('manifest', nargs='+')
+    p.add_argument('-j', '--workers', type=int, default=None, help="동시 작업 수 (기본: CPU 코어 수의 절반)")
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser('watch', help="감시 폴더에 들어오는 파일을 규칙대로 자동 처리")
+    p.add_argument('rule', help="규칙 JSON 파일")
+    p.add_argument('--once', action='store_true', help="지금 있는 파일만 처리하고 종료")
+    p.add_argument('-j', '--workers', type=int, default=None, help="동시 작업 수 (기본: 규칙의 workers)")
+    p.set_defaults(func=cmd_watch)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
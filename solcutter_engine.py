@@ -0,0 +1,2089 @@
+"""
+SolCutter 내보내기 엔진.
+PyQt6 없이 동작하므로 GUI, 명령줄(solcutter_cli.py), 다른 파이썬 코드 어디서든 쓸 수 있다.
+
+    from solcutter_engine import export
+    export("in.mp4", "out.mp4", start=10, end=25, crop=(0.1, 0.1, 0.5, 0.5))
+"""
+import os
+import re
+import sys
+import csv
+import json
+import hashlib
+import bisect
+import math
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import multiprocessing
+from array import array
+
+# ==========================================
+# 1. FFmpeg 헬퍼 (스트림 복사 / 키프레임)
+# ==========================================
+# 재인코딩 없이 그대로 담을 수 있는 컨테이너별 (비디오, 오디오) 코덱 목록. None = 제한 없음
+COPY_COMPATIBLE = {
+    '.mp4': ({'h264', 'hevc', 'mpeg4', 'av1'}, {'aac', 'mp3', 'alac', 'ac3', 'opus'}),
+    '.mov': ({'h264', 'hevc', 'mpeg4', 'prores', 'mjpeg'}, {'aac', 'mp3', 'alac', 'pcm_s16le'}),
+    '.mkv': (None, None),
+}
+# 스마트 컷에서 경계 GOP를 다시 만들 때 쓰는 인코더
+SMART_CUT_ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+
+# 윈도우에서 ffmpeg 실행 시 콘솔 창이 뜨지 않도록
+_POPEN_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+class FFmpegError(RuntimeError):
+    pass
+
+
+def get_ffmpeg_exe():
+    # imageio-ffmpeg가 설치되어 있으면 그 바이너리를 우선 사용하고, 없으면 PATH에서 찾음
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        exe = shutil.which("ffmpeg")
+        if exe is None:
+            raise FFmpegError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+        return exe
+
+
+def probe_media(path):
+    """ffmpeg -i 출력에서 길이/코덱/해상도/fps 정보를 읽어온다."""
+    proc = subprocess.run([get_ffmpeg_exe(), '-hide_banner', '-i', path],
+                          capture_output=True, text=True, errors='replace',
+                          creationflags=_POPEN_FLAGS)
+    out = proc.stderr
+    m = re.search(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)', out)
+    if not m:
+        raise FFmpegError(f"미디어 정보를 읽을 수 없습니다: {os.path.basename(path)}")
+
+    info = {
+        'duration': int(m.group(1)) * 3600 + int(m.group(2)) * 60 + float(m.group(3)),
+        'start': 0.0, 'vcodec': None, 'acodec': None, 'pix_fmt': None,
+        'width': 0, 'height': 0, 'fps': 0.0, 'sample_rate': 0, 'channels': None, 'rotation': 0,
+    }
+    m = re.search(r'start: (-?\d+(?:\.\d+)?)', out)
+    if m:
+        info['start'] = float(m.group(1))
+
+    for line in out.splitlines():
+        if info['vcodec'] is None and 'Video:' in line and 'attached pic' not in line:
+            m = re.search(r'Video: (\w+)[^,]*, (\w+)', line)
+            if m:
+                info['vcodec'], info['pix_fmt'] = m.group(1), m.group(2)
+            m = re.search(r', (\d{2,5})x(\d{2,5})', line)
+            if m:
+                info['width'], info['height'] = int(m.group(1)), int(m.group(2))
+            m = re.search(r'(\d+(?:\.\d+)?) fps', line)
+            if m:
+                info['fps'] = float(m.group(1))
+        elif info['acodec'] is None and 'Audio:' in line:
+            m = re.search(r'Audio: (\w+)', line)
+            if m:
+                info['acodec'] = m.group(1)
+            m = re.search(r'(\d+) Hz', line)
+            if m:
+                info['sample_rate'] = int(m.group(1))
+            m = re.search(r' Hz, ([^,]+)', line)
+            if m:
+                info['channels'] = m.group(1).strip()  # 'stereo', 'mono', '5.1(side)' ...
+        elif 'rotation of' in line:
+            m = re.search(r'rotation of (-?\d+(?:\.\d+)?) degrees', line)
+            if m:
+                info['rotation'] = int(round(float(m.group(1)))) % 360
+    return info
+
+
+def scan_frames(path):
+    """
+    디코딩 없이 패킷만 훑어서 첫 비디오 스트림의 프레임 표시 시각(초, 정렬됨)과
+    키프레임 시각 목록을 만든다. 결과는 frame_index()가 디스크에 캐시한다.
+    -copyts 없이 읽으므로 ffmpeg가 이미 파일 시작(start)을 0으로 맞춘 시각이고, -ss에 그대로 쓸 수 있다.
+    """
+    cmd = [get_ffmpeg_exe(), '-hide_banner', '-nostdin', '-i', path,
+           '-map', '0:v:0', '-c', 'copy', '-f', 'framecrc', '-']
+    proc = subprocess.run(cmd, capture_output=True, text=True, errors='replace',
+                          creationflags=_POPEN_FLAGS)
+    if proc.returncode != 0:
+        raise FFmpegError(f"키프레임 분석 실패: {proc.stderr.strip().splitlines()[-1:]}")
+
+    tb = 1.0
+    frames = []
+    keyframes = []
+    for line in proc.stdout.splitlines():
+        if line.startswith('#tb 0:'):
+            num, den = line.split(':', 1)[1].strip().split('/')
+            tb = int(num) / int(den)
+            continue
+        if line.startswith('#'):
+            continue
+        fields = [f.strip() for f in line.split(',')]
+        if len(fields) < 6:
+            continue
+        try:
+            t = int(fields[2]) * tb
+        except ValueError:
+            continue
+        frames.append(t)
+        # 키프레임이 아닌 패킷에만 'F=0x..' 플래그가 붙는다 (비트 0 = KEY)
+        flags = next((f for f in fields[6:] if f.startswith('F=')), None)
+        if flags is None or int(flags[2:], 16) & 1:
+            keyframes.append(t)
+    frames.sort()
+    keyframes.sort()
+    return frames, keyframes
+
+
+def list_keyframes(path):
+    return frame_index(path)['keyframes']
+
+
+def can_stream_copy(info, output_path):
+    video_ok, audio_ok = COPY_COMPATIBLE.get(os.path.splitext(output_path)[1].lower(), (set(), set()))
+    if info['vcodec'] is None:
+        return False
+    if video_ok is not None and info['vcodec'] not in video_ok:
+        return False
+    if info['acodec'] and audio_ok is not None and info['acodec'] not in audio_ok:
+        return False
+    return True
+
+
+def _parse_progress_block(block):
+    """-progress 한 블록을 {'frame', 'fps', 'speed', 'bytes', 'out_time'}로 (없는 값은 0)"""
+    def number(key, cast=float):
+        try:
+            return cast(block.get(key, '0').rstrip('x'))
+        except ValueError:
+            return cast(0)
+    # out_time_ms도 실제로는 마이크로초 단위 (ffmpeg 오래된 버그)
+    out_us = number('out_time_us', int) or number('out_time_ms', int)
+    return {'frame': number('frame', int), 'fps': number('fps'), 'speed': number('speed'),
+            'bytes': number('total_size', int), 'out_time': max(0.0, out_us / 1_000_000)}
+
+
+def _stop_process(proc, timeout=2.0):
+    """SIGTERM으로 먼저 정상 종료를 기다리고, 응답이 없으면 강제 종료"""
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    proc.wait()
+
+
+def run_ffmpeg(args, duration=0.0, progress_cb=None):
+    """
+    ffmpeg를 실행하고 -progress 출력을 읽어 progress_cb(0~99 퍼센트, 통계)로 전달한다.
+    통계는 이번 ffmpeg 실행 기준의 프레임 수/인코딩 fps/실시간 대비 속도/출력 바이트/출력 시각.
+    """
+    cmd = [get_ffmpeg_exe(), '-hide_banner', '-nostdin', '-y', '-loglevel', 'error',
+           '-progress', 'pipe:1', '-nostats'] + args
+    # stderr는 파이프가 가득 차서 멈추지 않도록 임시 파일로 받음
+    with tempfile.TemporaryFile() as err_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err_file,
+                                text=True, errors='replace', creationflags=_POPEN_FLAGS)
+        block = {}
+        try:
+            for line in proc.stdout:
+                key, _, value = line.strip().partition('=')
+                if key != 'progress':
+                    # N/A(아직 값 없음/마지막 블록)는 직전 값을 유지
+                    if value != 'N/A':
+                        block[key] = value
+                    continue
+                # progress=continue|end 줄이 한 블록의 끝
+                if progress_cb:
+                    stats = _parse_progress_block(block)
+                    percent = int(stats['out_time'] / duration * 100) if duration > 0 else 0
+                    progress_cb(max(0, min(99, percent)), stats)
+        except BaseException:
+            # 콜백이 취소 예외를 던지면 ffmpeg도 같이 정리
+            _stop_process(proc)
+            raise
+        proc.wait()
+        if proc.returncode != 0:
+            err_file.seek(0)
+            tail = err_file.read().decode(errors='replace').strip().splitlines()[-3:]
+            # 크래시 등으로 에러 출력 없이 죽으면 종료 코드라도 남김
+            raise FFmpegError("ffmpeg 실패: " + (" / ".join(tail) or f"종료 코드 {proc.returncode}"))
+
+
+def _scaled_progress(progress_cb, offset, span):
+    if progress_cb is None:
+        return None
+    return lambda p, stats=None: progress_cb(int(offset + p * span / 100), stats)
+
+
+def _concat_list_line(path):
+    return "file '" + path.replace("'", "'\\''") + "'\n"
+
+
+def _copy_frame_limit(frames, start, end):
+    """
+    스트림 복사의 -t는 디코딩 시각(dts) 기준이라 B프레임이 있으면 끝 뒤의 프레임이 몇 장 더 들어간다.
+    프레임 인덱스가 있으면 [start, end)에 보이는 프레임 수만큼만 복사하도록 -frames:v를 붙인다.
+    """
+    if not frames:
+        return []
+    lo = bisect.bisect_left(frames, start - 1e-3)
+    hi = bisect.bisect_left(frames, end - 1e-3)
+    return ['-frames:v', str(max(1, hi - lo))]
+
+
+def stream_copy_trim(src, dst, start, end, info, keyframes, mode='keyframe', progress_cb=None, frames=None):
+    """
+    재인코딩 없이 구간을 잘라낸다. 실제로 사용된 시작 시각을 반환한다.
+    - keyframe: 시작점을 직전 키프레임으로 당겨서 전부 스트림 복사
+    - smart: 시작점~다음 키프레임 구간(GOP)만 다시 인코딩하고 나머지는 복사
+    frames(프레임 인덱스의 시각 목록)를 주면 끝점도 프레임 단위로 정확히 자른다.
+    """
+    next_kf = next((k for k in keyframes if k >= start - 1e-3), None)
+    encoder = SMART_CUT_ENCODERS.get(info['vcodec'])
+    if mode == 'smart' and encoder and next_kf is not None and start + 1e-3 < next_kf < end:
+        _smart_cut(src, dst, start, end, next_kf, info, encoder, progress_cb, frames)
+        return start
+
+    # 시작점 이하의 마지막 키프레임으로 스냅
+    snapped = max((k for k in keyframes if k <= start + 1e-3), default=0.0)
+    snapped = max(0.0, snapped)
+    # 부동소수 오차로 이전 키프레임까지 밀려나지 않도록 살짝 뒤에서 탐색
+    run_ffmpeg(['-ss', f'{snapped + 0.001:.3f}', '-i', src, '-t', f'{end - snapped:.3f}',
+                '-map', '0:v:0', '-map', '0:a?', '-c', 'copy']
+               + _copy_frame_limit(frames, snapped, end) + ['-avoid_negative_ts', 'make_zero', dst],
+               end - snapped, progress_cb)
+    return snapped
+
+
+def _smart_cut(src, dst, start, end, next_kf, info, encoder, progress_cb, frames=None):
+    work_dir = tempfile.mkdtemp(prefix='solcutter_smartcut_')
+    try:
+        # 중간 파일은 MKV: 분할 인코딩 조각처럼 concat으로 그대로 이어붙일 수 있고,
+        # MPEG-TS 입력에서 죽는 ffmpeg 빌드가 있어 TS는 쓰지 않음
+        head = os.path.join(work_dir, 'head.mkv')
+        body = os.path.join(work_dir, 'body.mkv')
+        list_path = os.path.join(work_dir, 'list.txt')
+
+        # 1) 시작점 ~ 다음 키프레임: 원본과 같은 코덱/픽셀 포맷으로 재인코딩
+        head_args = ['-ss', f'{start:.3f}', '-i', src, '-t', f'{next_kf - start:.3f}',
+                     '-map', '0:v:0', '-an', '-c:v', encoder, '-crf', '16', '-preset', 'veryfast']
+        if info['pix_fmt']:
+            head_args += ['-pix_fmt', info['pix_fmt']]
+        run_ffmpeg(head_args + [head], next_kf - start,
+                   _scaled_progress(progress_cb, 0, 30))
+
+        # 2) 다음 키프레임 ~ 끝: 스트림 복사
+        run_ffmpeg(['-ss', f'{next_kf + 0.001:.3f}', '-i', src, '-t', f'{end - next_kf:.3f}',
+                    '-map', '0:v:0', '-an', '-c', 'copy'] + _copy_frame_limit(frames, next_kf, end)
+                   + [body],
+                   end - next_kf, _scaled_progress(progress_cb, 30, 40))
+
+        with open(list_path, 'w', encoding='utf-8') as f:
+            f.write(_concat_list_line(head))
+            f.write(_concat_list_line(body))
+
+        # 3) 비디오 이어붙이기 + 원본 오디오 구간을 복사해서 합치기
+        run_ffmpeg(['-f', 'concat', '-safe', '0', '-i', list_path,
+                    '-ss', f'{start:.3f}', '-t', f'{end - start:.3f}', '-i', src,
+                    '-map', '0:v:0', '-map', '1:a?', '-c', 'copy', dst],
+                   end - start, _scaled_progress(progress_cb, 70, 30))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+# ==========================================
+# 2. 인코더 설정 (프리셋 / CRF / 스레드)
+# ==========================================
+VIDEO_ENCODERS = ('libx264', 'libx265', 'libvpx-vp9', 'libaom-av1', 'libsvtav1')
+X264_PRESETS = ('ultrafast', 'superfast', 'veryfast', 'faster', 'fast',
+                'medium', 'slow', 'slower', 'veryslow')
+X264_TUNES = ('', 'film', 'animation', 'grain', 'stillimage', 'fastdecode', 'zerolatency')
+
+# 오디오 추출 확장자 -> (인코더, 비트레이트 사용 여부)
+AUDIO_FORMATS = {
+    '.mp3': ('libmp3lame', True),
+    '.m4a': ('aac', True),
+    '.aac': ('aac', True),
+    '.opus': ('libopus', True),
+    '.flac': ('flac', False),
+    '.wav': ('pcm_s16le', False),
+}
+# 재인코딩 없이 복사할 수 있는 원본 오디오 코덱 (예: AAC 녹화본 -> .m4a)
+AUDIO_COPY_COMPATIBLE = {
+    '.mp3': {'mp3'},
+    '.m4a': {'aac', 'alac'},
+    '.aac': {'aac'},
+    '.opus': {'opus'},
+    '.flac': {'flac'},
+    '.wav': {'pcm_s16le'},
+}
+
+# threads 0 = 인코더가 코어 수에 맞춰 자동 결정, max_height 0 = 원본 해상도 유지
+ENCODER_PROFILES = {
+    'standard': {'vcodec': 'libx264', 'preset': 'medium', 'rate_mode': 'crf', 'crf': 23,
+                 'bitrate': '8M', 'threads': 0, 'tune': '', 'audio_bitrate': '192k', 'max_height': 0},
+    # 미리보기/확인용: 화질보다 속도
+    'draft': {'vcodec': 'libx264', 'preset': 'ultrafast', 'rate_mode': 'crf', 'crf': 30,
+              'bitrate': '2M', 'threads': 0, 'tune': 'fastdecode', 'audio_bitrate': '96k', 'max_height': 540},
+}
+
+
+def encoder_settings(profile='standard', **overrides):
+    settings = dict(ENCODER_PROFILES['standard'])
+    settings.update(ENCODER_PROFILES.get(profile, {}))
+    settings.update({k: v for k, v in overrides.items() if v is not None})
+    if settings['vcodec'] not in VIDEO_ENCODERS:
+        raise ValueError(f"지원하지 않는 비디오 인코더: {settings['vcodec']}")
+    if settings['preset'] not in X264_PRESETS:
+        raise ValueError(f"알 수 없는 프리셋: {settings['preset']}")
+    return settings
+
+
+def video_codec_args(settings):
+    """x264 기준 프리셋 이름을 각 인코더의 속도 옵션으로 옮겨서 ffmpeg 인자로 만든다."""
+    codec = settings['vcodec']
+    speed = X264_PRESETS.index(settings['preset'])  # 0 = 가장 빠름
+    args = ['-c:v', codec]
+    if codec in ('libx264', 'libx265'):
+        args += ['-preset', settings['preset']]
+        if settings['tune']:
+            args += ['-tune', settings['tune']]
+    elif codec == 'libvpx-vp9':
+        args += ['-deadline', 'realtime' if speed <= 1 else 'good',
+                 '-cpu-used', str(max(0, 5 - speed // 2)), '-row-mt', '1']
+    elif codec == 'libaom-av1':
+        args += ['-cpu-used', str(8 - speed), '-row-mt', '1']
+    elif codec == 'libsvtav1':
+        args += ['-preset', str(12 - speed)]
+
+    if settings['rate_mode'] == 'bitrate':
+        args += ['-b:v', str(settings['bitrate'])]
+    else:
+        args += ['-crf', str(settings['crf'])]
+        if codec in ('libvpx-vp9', 'libaom-av1'):
+            args += ['-b:v', '0']  # 고정 화질 모드
+    if settings['threads']:
+        args += ['-threads', str(settings['threads'])]
+    return args + ['-pix_fmt', 'yuv420p']
+
+
+def audio_codec_args(output_path, settings):
+    """출력 확장자에 맞는 오디오 인코더 (영상 컨테이너는 AAC). 무손실/PCM은 비트레이트 없음"""
+    codec, lossy = AUDIO_FORMATS.get(os.path.splitext(output_path)[1].lower(), ('aac', True))
+    args = ['-c:a', codec]
+    if lossy:
+        args += ['-b:a', str(settings['audio_bitrate'])]
+    return args
+
+
+def can_copy_audio(info, output_path):
+    """원본 오디오 코덱을 변환 없이 그대로 담을 수 있는 확장자인지"""
+    return info['acodec'] in AUDIO_COPY_COMPATIBLE.get(os.path.splitext(output_path)[1].lower(), ())
+
+
+def limit_height(size, settings):
+    """max_height보다 크면 비율을 유지해 (짝수) 축소한 크기, 아니면 그대로"""
+    w, h = size
+    max_h = settings.get('max_height') or 0
+    if not max_h or h <= max_h:
+        return size
+    return max(2, int(w * max_h / h) & ~1), max_h & ~1
+
+# ==========================================
+# 3. 다중 구간 (원본을 한 번만 디코딩)
+# ==========================================
+def display_size(info):
+    """회전 메타데이터를 반영한 화면상 (가로, 세로). ffmpeg는 필터 전에 자동 회전한다."""
+    if info['rotation'] in (90, 270):
+        return info['height'], info['width']
+    return info['width'], info['height']
+
+
+def crop_to_pixels(rect, width, height):
+    """정규화 영역 (x, y, w, h)를 yuv420 인코딩이 가능하도록 짝수 픽셀 (x, y, w, h)로 변환"""
+    rx, ry, rw, rh = rect
+    x = min(int(rx * width), width - 2) & ~1
+    y = min(int(ry * height), height - 2) & ~1
+    w = max(2, min(int(rw * width), width - x) & ~1)
+    h = max(2, min(int(rh * height), height - y) & ~1)
+    return x, y, w, h
+
+
+def segment_output_paths(output_path, count):
+    stem, ext = os.path.splitext(output_path)
+    return [f"{stem}_{i}{ext}" for i in range(1, count + 1)]
+
+
+def _encoder_args(output_path, info, settings, audio_only=False):
+    audio = audio_codec_args(output_path, settings)
+    if audio_only:
+        return ['-vn'] + audio
+    # split/concat 뒤에는 프레임레이트 정보가 사라져 기본값(25)으로 바뀌므로 원본 값을 명시
+    rate = ['-r', f"{info['fps']:g}"] if info['fps'] else []
+    return video_codec_args(settings) + rate + audio
+
+
+# 구간 경계를 프레임 시각보다 살짝 앞으로 당겨서 ffmpeg에 넘긴다.
+# 시작 프레임은 반올림 오차가 있어도 포함되고, 끝 시각의 프레임(다음 구간 첫 프레임)은 빠진다.
+FRAME_EPS = 1e-4
+
+
+def _clamp_segments(segments, duration):
+    result = []
+    for seg in segments:
+        end = seg['end'] if seg['end'] > 0 else duration
+        end = min(end, duration)
+        if end - seg['start'] <= 0.01:
+            raise ValueError(f"잘못된 구간: {seg['start']:.2f} ~ {end:.2f}")
+        result.append({'start': max(0.0, seg['start'] - FRAME_EPS), 'end': end - FRAME_EPS,
+                       'crop': seg.get('crop')})
+    return result
+
+
+def _video_chain(seg, size, settings, target=None):
+    """구간 하나에 붙일 크롭(+합칠 때 크기 맞추기 / 해상도 제한) 필터 문자열"""
+    chain = ''
+    if seg['crop']:
+        x, y, w, h = crop_to_pixels(seg['crop'], *size)
+        chain += f",crop={w}:{h}:{x}:{y}"
+    if target is None:
+        seg_size = _segment_size(seg, size)
+        if limit_height(seg_size, settings) != seg_size:
+            chain += ",scale=%d:%d" % limit_height(seg_size, settings)
+    else:
+        tw, th = target
+        chain += (f",scale={tw}:{th}:force_original_aspect_ratio=decrease"
+                  f",pad={tw}:{th}:(ow-iw)/2:(oh-ih)/2")
+    return chain + ",setsar=1"
+
+
+def _segment_size(seg, size):
+    return crop_to_pixels(seg['crop'], *size)[2:] if seg['crop'] else size
+
+
+def render_range(src, dst, start, end, crop, info, settings, progress_cb=None, audio=True, keyframe_start=False):
+    """
+    구간 하나를 재인코딩. 크롭/축소는 ffmpeg 필터 그래프 안에서 처리하므로
+    디코딩된 프레임이 파이썬(numpy)을 거치지 않는다. audio=False면 비디오만 (분할 인코딩 조각).
+    keyframe_start면 start가 키프레임이므로 그 키프레임으로 바로 탐색한다 (앞 GOP를 디코딩하지 않음).
+    """
+    chain = _video_chain({'crop': crop}, display_size(info), settings).lstrip(',')
+    end -= FRAME_EPS
+    if keyframe_start:
+        # 키프레임 살짝 뒤로 탐색하면 그 키프레임에 도착하고, -noaccurate_seek라 키프레임도 버리지 않음
+        start += FRAME_EPS
+        args = ['-noaccurate_seek', '-ss', f'{start:.6f}']
+    else:
+        start = max(0.0, start - FRAME_EPS)
+        args = ['-ss', f'{start:.6f}']
+    args += ['-t', f'{end - start:.6f}', '-i', src, '-map', '0:v:0']
+    args += ['-map', '0:a:0?'] if audio else ['-an']
+    args += ['-vf', chain] + video_codec_args(settings)
+    run_ffmpeg(args + (audio_codec_args(dst, settings) if audio else []) + [dst], end - start, progress_cb)
+
+
+def extract_audio(src, dst, start, end, settings, copy=False, progress_cb=None):
+    """
+    오디오 스트림만 매핑해서 추출한다. 비디오는 디코딩하지 않으므로 긴 녹화본도 빠르고,
+    copy면 패킷을 그대로 옮겨서 실시간의 수백 배 속도로 끝난다.
+    """
+    args = ['-ss', f'{start:.6f}', '-t', f'{end - start:.6f}', '-i', src,
+            '-map', '0:a:0', '-vn', '-sn', '-dn']
+    args += ['-c:a', 'copy'] if copy else audio_codec_args(dst, settings)
+    run_ffmpeg(args + [dst], end - start, progress_cb)
+
+
+def render_segments_separately(src, segments, outputs, info, settings, audio_only=False, progress_cb=None):
+    """
+    원본을 [첫 구간 시작, 마지막 구간 끝] 범위로 한 번만 디코딩하고,
+    split/trim 필터로 프레임을 구간별 인코더에 나눠 보낸다.
+    """
+    t0 = min(seg['start'] for seg in segments)
+    t1 = max(seg['end'] for seg in segments)
+    n = len(segments)
+    size = display_size(info)
+    has_audio = info['acodec'] is not None
+    graph = []
+
+    # 진행률용 가지: 원본 위치를 그대로 null 출력으로 흘려서 out_time이 원본 기준이 되게 함
+    if not audio_only:
+        graph.append(f"[0:v:0]split={n + 1}" + ''.join(f"[vs{i}]" for i in range(n)) + "[prog]")
+        for i, seg in enumerate(segments):
+            graph.append(f"[vs{i}]trim=start={seg['start'] - t0:.6f}:end={seg['end'] - t0:.6f},"
+                         f"setpts=PTS-STARTPTS{_video_chain(seg, size, settings)}[v{i}]")
+    if has_audio:
+        extra = 1 if audio_only else 0
+        graph.append(f"[0:a:0]asplit={n + extra}" + ''.join(f"[as{i}]" for i in range(n))
+                     + ("[prog]" if audio_only else ''))
+        for i, seg in enumerate(segments):
+            graph.append(f"[as{i}]atrim=start={seg['start'] - t0:.6f}:end={seg['end'] - t0:.6f},"
+                         f"asetpts=PTS-STARTPTS[a{i}]")
+
+    args = ['-ss', f'{t0:.6f}', '-t', f'{t1 - t0:.6f}', '-i', src, '-filter_complex', ';'.join(graph)]
+    for i, out in enumerate(outputs):
+        if not audio_only:
+            args += ['-map', f'[v{i}]']
+        if has_audio:
+            args += ['-map', f'[a{i}]']
+        args += _encoder_args(out, info, settings, audio_only) + [out]
+    args += ['-map', '[prog]', '-f', 'null', '-']
+    run_ffmpeg(args, t1 - t0, progress_cb)
+
+
+def render_segments_combined(src, dst, segments, info, settings, audio_only=False, progress_cb=None):
+    """
+    구간들을 이어붙여 파일 하나로 만든다. 구간이 시간순이고 겹치지 않으면 입력을 한 번만 읽고,
+    순서가 바뀌었거나 겹치면 (프레임을 메모리에 쌓지 않도록) 구간마다 따로 탐색해서 읽는다.
+    """
+    n = len(segments)
+    size = display_size(info)
+    has_audio = info['acodec'] is not None
+    target = None if audio_only else limit_height(_segment_size(segments[0], size), settings)
+    total = sum(seg['end'] - seg['start'] for seg in segments)
+    in_order = all(segments[i]['start'] >= segments[i - 1]['end'] for i in range(1, n))
+    graph = []
+
+    if in_order:
+        t0, t1 = segments[0]['start'], segments[-1]['end']
+        args = ['-ss', f'{t0:.6f}', '-t', f'{t1 - t0:.6f}', '-i', src]
+        if not audio_only:
+            graph.append(f"[0:v:0]split={n}" + ''.join(f"[vs{i}]" for i in range(n)))
+        if has_audio:
+            graph.append(f"[0:a:0]asplit={n}" + ''.join(f"[as{i}]" for i in range(n)))
+        for i, seg in enumerate(segments):
+            a, b = seg['start'] - t0, seg['end'] - t0
+            if not audio_only:
+                graph.append(f"[vs{i}]trim=start={a:.6f}:end={b:.6f},setpts=PTS-STARTPTS"
+                             f"{_video_chain(seg, size, settings, target)}[v{i}]")
+            if has_audio:
+                graph.append(f"[as{i}]atrim=start={a:.6f}:end={b:.6f},asetpts=PTS-STARTPTS[a{i}]")
+    else:
+        args = []
+        for i, seg in enumerate(segments):
+            args += ['-ss', f"{seg['start']:.6f}", '-t', f"{seg['end'] - seg['start']:.6f}", '-i', src]
+            if not audio_only:
+                graph.append(f"[{i}:v:0]setpts=PTS-STARTPTS{_video_chain(seg, size, settings, target)}[v{i}]")
+            if has_audio:
+                graph.append(f"[{i}:a:0]asetpts=PTS-STARTPTS[a{i}]")
+
+    v, a = (0 if audio_only else 1), (1 if has_audio else 0)
+    inputs = ''.join((f"[v{i}]" if v else '') + (f"[a{i}]" if a else '') for i in range(n))
+    graph.append(f"{inputs}concat=n={n}:v={v}:a={a}" + ("[vout]" if v else '') + ("[aout]" if a else ''))
+
+    args += ['-filter_complex', ';'.join(graph)]
+    if v:
+        args += ['-map', '[vout]']
+    if a:
+        args += ['-map', '[aout]']
+    run_ffmpeg(args + _encoder_args(dst, info, settings, audio_only) + [dst], total, progress_cb)
+
+# ==========================================
+# 4. 내보내기 작업 (워커 프로세스에서 실행)
+# ==========================================
+EXPORT_MODES = ('video', 'audio')
+# off: 항상 재인코딩 / keyframe: 키프레임에 맞춰 스트림 복사 / smart: 첫 GOP만 재인코딩
+FAST_TRIM_MODES = ('off', 'keyframe', 'smart')
+
+
+class ExportCanceled(Exception):
+    pass
+
+
+def new_segment(start_t, end_t, crop_rect=None):
+    return {'start': start_t, 'end': end_t, 'crop': list(crop_rect) if crop_rect else None}
+
+
+def new_export_job(file_path, output_path, start_t, end_t, crop_rect, mode='video', fast_trim='off',
+                   segments=None, combine=False, encoder=None, chunk_workers=0, clips=None):
+    """
+    대기열에 넣을 작업 하나. 프로세스 간 전달과 QSettings 저장을 위해 순수 dict로 둔다.
+    segments가 있으면 start/end/crop 대신 구간 목록을 쓰고, combine이면 파일 하나로 이어붙인다.
+    encoder는 encoder_settings() 결과 (없으면 'standard' 프로필).
+    chunk_workers가 1 이상이면 재인코딩을 키프레임 조각으로 나눠 그 수만큼 동시에 인코딩한다 (중단 후 이어서 가능).
+    clips(new_clip 목록)가 있으면 여러 파일의 구간을 순서대로 이어붙인다 (file_path는 표시용으로 첫 클립).
+    """
+    return {
+        'id': uuid.uuid4().hex[:8],
+        'file': file_path,
+        'output': output_path,
+        'start': start_t,
+        'end': end_t,
+        'crop': list(crop_rect) if crop_rect else None,
+        'mode': mode,
+        'fast_trim': fast_trim,
+        'segments': segments or [],
+        'combine': combine,
+        'encoder': encoder or encoder_settings(),
+        'chunk_workers': chunk_workers,
+        'clips': clips or [],
+        'state': 'pending',  # pending | running | done | error | canceled
+        'progress': 0,
+        'message': '',
+    }
+
+
+def job_output_paths(job):
+    """작업이 만들어내는 파일 목록 (구간을 따로 내보내면 _1, _2 ... 파일들)"""
+    if job.get('segments') and not job.get('combine'):
+        return segment_output_paths(job['output'], len(job['segments']))
+    return [job['output']]
+
+
+def partial_output_path(path):
+    """작업 중에 쓰는 임시 파일 (확장자는 그대로 둬서 ffmpeg가 같은 형식으로 씀)"""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.part{ext}"
+
+
+def _working_job(job):
+    return dict(job, output=partial_output_path(job['output']))
+
+
+def remove_partial_outputs(job):
+    """
+    취소/실패로 중간에 끊긴 임시 파일 삭제. 출력 경로에는 완료된 뒤에만 rename하므로
+    원래 그 자리에 있던 파일은 건드리지 않는다.
+    """
+    for path in job_output_paths(_working_job(job)):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _same_file(a, b):
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
+
+
+def check_output_paths(job):
+    """출력이 원본(이나 이어붙일 클립)과 같은 파일이면 시작하기 전에 ValueError"""
+    sources = [clip['file'] for clip in job.get('clips') or []] or [job['file']]
+    for path in job_output_paths(job):
+        for src in sources:
+            if _same_file(path, src):
+                raise ValueError(f"출력 파일이 원본과 같습니다: {path}")
+
+
+def perform_export(job, progress_cb, status_cb):
+    """
+    progress_cb(퍼센트, 통계=None)로 진행 상황을 받는다. 통계는 ffmpeg 단계에서만 온다.
+    출력은 <이름>.part<확장자>에 쓰고 끝까지 성공했을 때만 출력 경로로 rename한다.
+    끝나지 못하면 (취소 포함) 임시 파일을 지우고 예외를 다시 던진다.
+    """
+    # 이전 버전에서 저장된 대기열 작업에는 없는 키 채우기
+    job.setdefault('segments', [])
+    job.setdefault('combine', False)
+    job.setdefault('encoder', encoder_settings())
+    job.setdefault('chunk_workers', 0)
+    job.setdefault('clips', [])
+    check_output_paths(job)
+    status_cb("데이터 준비 중...")
+    work = _working_job(job)
+    try:
+        if work['clips']:
+            _export_clips(work, progress_cb, status_cb)
+        elif work.get('segments'):
+            _export_segments(work, progress_cb, status_cb)
+        # 크롭 없이 구간만 자르는 경우엔 재인코딩 없이 스트림 복사 시도
+        elif work['mode'] == 'audio':
+            _export_audio(work, progress_cb, status_cb)
+        elif not (work['mode'] == 'video' and not work['crop']
+                  and work['fast_trim'] != 'off' and _export_fast_trim(work, progress_cb, status_cb)):
+            if work['chunk_workers']:
+                _export_chunked(work, progress_cb, status_cb)
+            else:
+                _export_reencode(work, progress_cb, status_cb)
+        for tmp, path in zip(job_output_paths(work), job_output_paths(job)):
+            os.replace(tmp, path)
+    except BaseException:
+        remove_partial_outputs(job)
+        raise
+    progress_cb(100)
+    status_cb("완료!")
+
+
+def _export_fast_trim(job, progress_cb, status_cb):
+    """스트림 복사로 처리했으면 True, 불가능해서 재인코딩으로 넘겨야 하면 False"""
+    try:
+        info = media_info(job['file'])
+        if not can_stream_copy(info, job['output']):
+            status_cb(f"스트림 복사 불가 ({info['vcodec']}/{info['acodec']}) → 재인코딩")
+            return False
+
+        end = job['end'] if job['end'] > 0 else info['duration']
+        end = min(end, info['duration'])
+        status_cb("키프레임 분석 중...")
+        index = frame_index(job['file'])
+
+        status_cb("무손실 자르기 중...")
+        actual_start = stream_copy_trim(job['file'], job['output'], job['start'], end, info, index['keyframes'],
+                                        job['fast_trim'], progress_cb, index['frames'])
+        if actual_start + 1e-3 < job['start']:
+            status_cb(f"시작점이 키프레임({actual_start:.2f}초)으로 조정되었습니다.")
+        return True
+    except FFmpegError as e:
+        status_cb(f"스트림 복사 실패 → 재인코딩 ({e})")
+        return False
+
+
+def _export_segments(job, progress_cb, status_cb):
+    info = media_info(job['file'])
+    segments = _clamp_segments(job['segments'], info['duration'])
+    audio_only = job['mode'] == 'audio'
+    if audio_only and info['acodec'] is None:
+        raise ValueError("오디오 트랙이 없습니다.")
+    if not audio_only and info['vcodec'] is None:
+        raise ValueError("비디오 트랙이 없습니다.")
+
+    if job['combine']:
+        status_cb(f"{len(segments)}개 구간 이어붙이는 중...")
+        render_segments_combined(job['file'], job['output'], segments, info, job['encoder'], audio_only, progress_cb)
+        return
+
+    outputs = segment_output_paths(job['output'], len(segments))
+    lossless = (not audio_only and job['fast_trim'] != 'off'
+                and not any(seg['crop'] for seg in segments) and can_stream_copy(info, job['output']))
+    if lossless:
+        # 재인코딩이 필요 없으면 디코딩 자체를 하지 않는 쪽이 더 빠름 (키프레임 분석은 한 번만)
+        status_cb("키프레임 분석 중...")
+        index = frame_index(job['file'])
+        for i, (seg, out) in enumerate(zip(segments, outputs)):
+            status_cb(f"무손실 자르기 중... ({i + 1}/{len(segments)})")
+            stream_copy_trim(job['file'], out, seg['start'], seg['end'], info, index['keyframes'], job['fast_trim'],
+                             _scaled_progress(progress_cb, i * 100 / len(segments), 100 / len(segments)),
+                             index['frames'])
+        return
+
+    status_cb(f"{len(segments)}개 구간 렌더링 중 (한 번에 디코딩)...")
+    render_segments_separately(job['file'], segments, outputs, info, job['encoder'], audio_only, progress_cb)
+
+
+def _export_reencode(job, progress_cb, status_cb):
+    info = media_info(job['file'])
+    if info['vcodec'] is None:
+        raise ValueError("비디오 트랙이 없습니다.")
+    end = job['end'] if job['end'] > 0 else info['duration']
+    end = min(end, info['duration'])
+    if job['crop']:
+        x, y, w, h = crop_to_pixels(job['crop'], *display_size(info))
+        status_cb(f"크롭 {w}x{h} (+{x},+{y}) 렌더링 중...")
+    else:
+        status_cb("렌더링 시작...")
+    render_range(job['file'], job['output'], job['start'], end, job['crop'], info, job['encoder'], progress_cb)
+
+
+def _export_audio(job, progress_cb, status_cb):
+    ext = os.path.splitext(job['output'])[1].lower()
+    if ext not in AUDIO_FORMATS:
+        raise ValueError(f"지원하지 않는 오디오 형식입니다: {ext or '(확장자 없음)'} "
+                         f"({', '.join(e.lstrip('.') for e in AUDIO_FORMATS)})")
+    info = media_info(job['file'])
+    if info['acodec'] is None:
+        raise ValueError("오디오 트랙이 없습니다.")
+    end = job['end'] if job['end'] > 0 else info['duration']
+    end = min(end, info['duration'])
+    if end - job['start'] <= 0:
+        raise ValueError("추출할 구간이 비어 있습니다.")
+
+    # 무손실 자르기를 끄지 않았고 코덱이 맞으면 변환 없이 복사
+    copy = job['fast_trim'] != 'off' and can_copy_audio(info, job['output'])
+    status_cb(f"오디오 복사 중 ({info['acodec']})..." if copy else "오디오 추출 중...")
+    extract_audio(job['file'], job['output'], job['start'], end, job['encoder'], copy, progress_cb)
+
+
+class ExportTelemetry:
+    """
+    작업 하나의 진행 통계. ffmpeg는 단계(스마트 컷의 앞/뒤 조각 등)마다 카운터가 0부터 다시 시작하므로
+    카운터가 줄어들면 이전 단계 값을 누적해 둔다. 경과/남은 시간은 전체 퍼센트 기준.
+    """
+    SAMPLE_INTERVAL = 1.0
+    MAX_SAMPLES = 600
+
+    def __init__(self):
+        self.started = time.time()
+        self._t0 = time.monotonic()
+        self.percent = 0
+        self.fps = 0.0
+        self.speed = 0.0
+        self._done = {'frame': 0, 'bytes': 0, 'out_time': 0.0}
+        self._phase = {'frame': 0, 'bytes': 0, 'out_time': 0.0}
+        self._next_sample = 0.0
+        self.samples = []  # [경과, 퍼센트, fps, 속도, 바이트]
+
+    def elapsed(self):
+        return time.monotonic() - self._t0
+
+    def update(self, percent, stats=None):
+        """새 샘플을 기록할 차례면 True (이벤트 전송/로그 간격 조절용)"""
+        self.percent = percent
+        # 단계 시작 직후 값이 아직 없는 블록(전부 0)은 건너뜀
+        if stats and (stats['out_time'] > 0 or stats['frame'] > 0):
+            if stats['out_time'] + 1e-3 < self._phase['out_time'] or stats['frame'] < self._phase['frame']:
+                for key in self._done:
+                    self._done[key] += self._phase[key]
+            self._phase = {key: stats[key] for key in self._done}
+            self.fps, self.speed = stats['fps'], stats['speed']
+        elapsed = self.elapsed()
+        if elapsed < self._next_sample and percent < 100:
+            return False
+        self._next_sample = elapsed + self.SAMPLE_INTERVAL
+        if len(self.samples) < self.MAX_SAMPLES:
+            snap = self.snapshot()
+            self.samples.append([round(elapsed, 2), percent, snap['fps'], snap['speed'], snap['bytes']])
+        return True
+
+    def snapshot(self):
+        elapsed = self.elapsed()
+        eta = elapsed * (100 - self.percent) / self.percent if 0 < self.percent < 100 else None
+        return {
+            'percent': self.percent,
+            'frames': self._done['frame'] + self._phase['frame'],
+            'fps': round(self.fps, 1),
+            'speed': round(self.speed, 2),
+            'bytes': self._done['bytes'] + self._phase['bytes'],
+            'media_time': round(self._done['out_time'] + self._phase['out_time'], 3),
+            'elapsed': round(elapsed, 2),
+            'eta': round(eta, 1) if eta is not None else None,
+        }
+
+    def record(self, job, state, message=''):
+        """내보내기 로그 한 줄. 바이트는 실제 출력 파일 크기를 우선한다."""
+        snap = self.snapshot()
+        # 실패했으면 출력 경로에 있는 건 원래 있던 파일이라 세지 않음
+        written = sum(os.path.getsize(p) for p in job_output_paths(job) if os.path.exists(p)) if state == 'done' else 0
+        elapsed = max(snap['elapsed'], 1e-6)
+        encoder = job.get('encoder') or {}
+        return {
+            'id': job['id'],
+            'file': job['file'],
+            'output': job['output'],
+            'mode': job['mode'],
+            'fast_trim': job['fast_trim'],
+            'segments': len(job.get('segments') or []),
+            'clips': len(job.get('clips') or []),
+            'vcodec': encoder.get('vcodec'),
+            'preset': encoder.get('preset'),
+            'state': state,
+            'message': message,
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'elapsed': snap['elapsed'],
+            'frames': snap['frames'],
+            'media_time': snap['media_time'],
+            'bytes': written or snap['bytes'],
+            'avg_fps': round(snap['frames'] / elapsed, 1),
+            'avg_speed': round(snap['media_time'] / elapsed, 2),
+            'samples': self.samples,
+        }
+
+
+def format_stats(snapshot):
+    """'312fps · 5.2x · 12.4MB · 경과 0:03 · 남음 0:14' 형태의 한 줄 요약"""
+    def clock(seconds):
+        seconds = int(seconds + 0.5)
+        return f"{seconds // 3600}:{seconds // 60 % 60:02}:{seconds % 60:02}" if seconds >= 3600 \
+            else f"{seconds // 60}:{seconds % 60:02}"
+    parts = []
+    if snapshot.get('fps'):
+        parts.append(f"{snapshot['fps']:.0f}fps")
+    if snapshot.get('speed'):
+        parts.append(f"{snapshot['speed']:.1f}x")
+    if snapshot.get('bytes'):
+        parts.append(f"{snapshot['bytes'] / 1e6:.1f}MB")
+    parts.append(f"경과 {clock(snapshot.get('elapsed', 0))}")
+    if snapshot.get('eta') is not None:
+        parts.append(f"남음 {clock(snapshot['eta'])}")
+    return " · ".join(parts)
+
+
+def export_log_path():
+    """작업마다 한 줄씩 쌓이는 JSON Lines 로그 (SOLCUTTER_EXPORT_LOG로 변경 가능)"""
+    return os.environ.get('SOLCUTTER_EXPORT_LOG') or os.path.join(cache_dir(), 'export_log.jsonl')
+
+
+def append_export_log(record):
+    # 여러 워커가 동시에 써도 줄이 섞이지 않도록 한 번의 write로 추가
+    line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+    try:
+        fd = os.open(export_log_path(), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # 로그 실패로 내보내기 결과를 바꾸지 않음
+
+
+def _export_with_telemetry(job, progress_cb, status_cb, stats_cb=None):
+    """perform_export + 통계 수집. 결과와 상관없이 로그를 한 줄 남긴다."""
+    telemetry = ExportTelemetry()
+
+    def progress(value, stats=None):
+        progress_cb(value)
+        if telemetry.update(value, stats) and stats_cb:
+            stats_cb(telemetry.snapshot())
+
+    try:
+        perform_export(job, progress, status_cb)
+    except (ExportCanceled, KeyboardInterrupt):
+        append_export_log(telemetry.record(job, 'canceled'))
+        raise
+    except BaseException as e:
+        append_export_log(telemetry.record(job, 'error', str(e) or type(e).__name__))
+        raise
+    append_export_log(telemetry.record(job, 'done'))
+    if stats_cb:
+        stats_cb(telemetry.snapshot())
+
+
+def run_export_job(job, event_queue, cancel_event):
+    """
+    워커 프로세스 진입점. 진행 상황은 (job_id, 종류, 값) 튜플로 event_queue에 보낸다.
+    종류: progress(퍼센트) / stats(ExportTelemetry.snapshot) / status / done / canceled / error
+    취소는 진행률 콜백에서 ExportCanceled를 던져서 ffmpeg 실행을 빠져나온다.
+    """
+    job_id = job['id']
+    last = {'progress': -1}
+
+    def progress(value):
+        if cancel_event.is_set():
+            raise ExportCanceled()
+        if value != last['progress']:
+            last['progress'] = value
+            event_queue.put((job_id, 'progress', value))
+
+    def stats(snapshot):
+        event_queue.put((job_id, 'stats', snapshot))
+
+    def status(msg):
+        event_queue.put((job_id, 'status', msg))
+
+    def terminated(signum, frame):
+        raise ExportCanceled()
+
+    # 대기열이 유예 시간 뒤 terminate()해도 ffmpeg를 남기지 않고 취소 경로로 정리
+    if os.name != 'nt':
+        try:
+            signal.signal(signal.SIGTERM, terminated)
+        except ValueError:
+            pass  # 메인 스레드가 아니면 설정 불가
+
+    try:
+        _export_with_telemetry(job, progress, status, stats)
+        event_queue.put((job_id, 'done', None))
+    except ExportCanceled:
+        event_queue.put((job_id, 'canceled', None))
+    except Exception as e:
+        event_queue.put((job_id, 'error', str(e)))
+
+
+class _LineEvents:
+    """run_export_job의 event_queue 대신 쓰는 것: 이벤트를 JSON 한 줄씩 스트림에 쓴다"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+
+    def put(self, event):
+        with self.lock:
+            self.stream.write(json.dumps(event) + "\n")
+            self.stream.flush()
+
+
+def export_worker_command():
+    """
+    GUI 대기열이 워커를 띄우는 명령. multiprocessing spawn은 자식마다 부모의 __main__(= PyQt6 GUI)을
+    다시 import하므로, Qt를 모르는 이 파일을 직접 실행한다.
+    """
+    if getattr(sys, 'frozen', False):
+        return [sys.executable, '--export-worker']  # 패키징된 실행 파일은 GUI 진입점에서 분기
+    return [sys.executable, os.path.abspath(__file__), '--export-worker']
+
+
+def export_worker_main():
+    """
+    export_worker_command()로 뜬 워커. 표준 입력 첫 줄의 작업(JSON)을 run_export_job으로 실행하고
+    이벤트는 [job_id, 종류, 값] JSON 한 줄씩 표준 출력으로 보낸다. 그 뒤 표준 입력에 cancel 줄이 오거나
+    입력이 닫히면 (부모가 죽은 경우 포함) 취소한다.
+    """
+    # 명령 파이프는 따로 들고, ffmpeg 등 자식 프로세스에는 빈 표준 입력을 물려줌
+    commands = os.fdopen(os.dup(0), 'r', encoding='utf-8')
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    job = json.loads(commands.readline())
+    cancel_event = threading.Event()
+
+    def read_commands():
+        for line in commands:
+            if line.strip() == 'cancel':
+                break
+        cancel_event.set()
+
+    threading.Thread(target=read_commands, daemon=True).start()
+    run_export_job(job, _LineEvents(sys.stdout), cancel_event)
+
+
+def export(file_path, output_path, start=0.0, end=0.0, crop=None, mode='video', fast_trim='keyframe',
+           progress_cb=None, status_cb=None, segments=None, combine=False, encoder=None, stats_cb=None,
+           chunk_workers=0, clips=None):
+    """
+    파이썬 코드에서 작업 하나를 바로 실행하는 진입점.
+    stats_cb는 약 1초 간격으로 ExportTelemetry.snapshot() dict를 받는다.
+    """
+    job = new_export_job(file_path, output_path, start, end, crop, mode, fast_trim, segments, combine, encoder,
+                         chunk_workers, clips)
+    _export_with_telemetry(job, progress_cb or (lambda p: None), status_cb or (lambda m: None), stats_cb)
+    return job
+
+# ==========================================
+# 5. 매니페스트 / 일괄 처리
+# ==========================================
+def parse_time(value):
+    """'90', '1:30', '00:01:30.5' 같은 값을 초 단위 float로 바꾼다. 빈 값은 0."""
+    if value is None or str(value).strip() == '':
+        return 0.0
+    seconds = 0.0
+    for part in str(value).strip().split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def parse_crop(value):
+    """'x,y,w,h' (0.0~1.0 정규화 좌표) 또는 리스트를 튜플로. 빈 값은 None."""
+    if value is None or value == '' or value == []:
+        return None
+    if isinstance(value, str):
+        value = [v for v in re.split(r'[,:;\s]+', value.strip()) if v]
+    rect = tuple(float(v) for v in value)
+    if len(rect) != 4 or any(v < 0 or v > 1 for v in rect) or rect[2] <= 0 or rect[3] <= 0:
+        raise ValueError(f"잘못된 크롭 영역: {value} (x,y,w,h 를 0~1 비율로 지정)")
+    return rect
+
+
+def default_output_path(file_path, mode):
+    stem = os.path.splitext(file_path)[0]
+    return f"{stem}_cut.mp3" if mode == 'audio' else f"{stem}_cut.mp4"
+
+
+def job_from_record(record, base_dir=''):
+    """
+    매니페스트 한 줄(dict)을 작업 dict로. 상대 경로는 매니페스트 위치 기준.
+    "segments": [{"start", "end", "crop"}, ...] 가 있으면 다중 구간 작업이 된다 (CSV에서는 지원 안 함).
+    "clips": [{"input", "start", "end", "crop"}, ...] 가 있으면 여러 파일을 이어붙인다 (input 생략 가능).
+    """
+    clips = []
+    for clip in record.get('clips') or []:
+        clip_path = clip.get('input') or clip.get('file')
+        if not clip_path:
+            raise ValueError(f"입력 파일이 지정되지 않은 클립: {clip}")
+        clips.append(new_clip(os.path.join(base_dir, clip_path), parse_time(clip.get('start')),
+                              parse_time(clip.get('end')), parse_crop(clip.get('crop'))))
+    file_path = record.get('input') or record.get('file')
+    if not file_path and not clips:
+        raise ValueError(f"입력 파일이 지정되지 않은 항목: {record}")
+    mode = record.get('mode') or 'video'
+    if mode not in EXPORT_MODES:
+        raise ValueError(f"알 수 없는 모드: {mode}")
+    fast_trim = record.get('fast_trim') or 'keyframe'
+    if fast_trim not in FAST_TRIM_MODES:
+        raise ValueError(f"알 수 없는 자르기 방식: {fast_trim} ({'/'.join(FAST_TRIM_MODES)})")
+    file_path = os.path.join(base_dir, file_path) if file_path else clips[0]['file']
+    output_path = record.get('output')
+    output_path = os.path.join(base_dir, output_path) if output_path else default_output_path(file_path, mode)
+    segments = [new_segment(parse_time(seg.get('start')), parse_time(seg.get('end')), parse_crop(seg.get('crop')))
+                for seg in record.get('segments') or []]
+    return new_export_job(file_path, output_path,
+                          parse_time(record.get('start')), parse_time(record.get('end')),
+                          parse_crop(record.get('crop')), mode, fast_trim,
+                          segments, _parse_bool(record.get('combine')),
+                          encoder_settings(record.get('profile') or 'standard', **(record.get('encoder') or {})),
+                          int(record.get('chunk_workers') or 0), clips)
+
+
+def _parse_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'y')
+    return bool(value)
+
+
+def load_manifest(path):
+    """
+    JSON(작업 객체의 리스트 또는 {"jobs": [...]}) 또는 CSV(헤더: input,output,start,end,crop,mode,fast_trim)
+    매니페스트를 읽어 작업 dict 목록을 만든다.
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    if path.lower().endswith('.csv'):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            records = list(csv.DictReader(f))
+    else:
+        with open(path, encoding='utf-8') as f:
+            records = json.load(f)
+        if isinstance(records, dict):
+            records = records.get('jobs', [])
+    return [job_from_record(r, base_dir) for r in records]
+
+
+def run_batch(jobs, workers=None, event_cb=None):
+    """
+    작업들을 워커 프로세스 풀에서 병렬로 실행한다.
+    event_cb(job, kind, value)로 진행 상황을 받고, 끝나면 각 작업의 state/message가 채워진다.
+    Ctrl+C 등으로 중단되면 실행 중인 작업을 취소하고 예외를 다시 던진다.
+    """
+    # 일괄 처리에서만 쓰므로 GUI/단일 내보내기 시작 속도를 위해 여기서 import
+    from concurrent.futures import ProcessPoolExecutor, wait
+
+    workers = workers or max(1, (os.cpu_count() or 2) // 2)
+    by_id = {job['id']: job for job in jobs}
+    ctx = multiprocessing.get_context('spawn')
+
+    def drain(events):
+        while not events.empty():
+            job_id, kind, value = events.get()
+            job = by_id[job_id]
+            if kind == 'progress':
+                job['progress'] = value
+            elif kind == 'stats':
+                job['stats'] = value
+            elif kind == 'status':
+                job['message'] = value
+            else:
+                job['state'] = kind
+                if kind == 'error':
+                    job['message'] = value
+            if event_cb:
+                event_cb(job, kind, value)
+
+    with ctx.Manager() as manager:
+        events = manager.Queue()
+        cancel_event = manager.Event()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            pending = {pool.submit(run_export_job, job, events, cancel_event) for job in jobs}
+            for job in jobs:
+                job['state'] = 'running'
+            try:
+                while pending:
+                    _, pending = wait(pending, timeout=0.2)
+                    drain(events)
+            except BaseException:
+                cancel_event.set()
+                raise
+        drain(events)
+    return jobs
+
+# ==========================================
+# 6. 미디어 캐시 (썸네일 / 파형)
+# ==========================================
+THUMB_HEIGHT = 54
+THUMB_COUNT = 120
+WAVEFORM_BUCKETS = 2000
+WAVEFORM_RATE = 4000  # 파형 표시용이라 낮은 샘플레이트로 충분
+
+
+def cache_dir():
+    """SOLCUTTER_CACHE_DIR > 플랫폼 기본 캐시 위치"""
+    path = os.environ.get('SOLCUTTER_CACHE_DIR')
+    if not path:
+        if os.name == 'nt':
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+            path = os.path.join(base, 'SolCutter', 'cache')
+        elif sys.platform == 'darwin':
+            path = os.path.expanduser('~/Library/Caches/SolCutter')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+            path = os.path.join(base, 'solcutter')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def media_cache_key(path):
+    """경로 + 크기 + 수정 시각. 파일이 바뀌면 키도 바뀌어 예전 캐시는 자연히 무시된다."""
+    st = os.stat(path)
+    raw = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+
+def media_cache_path(path, name):
+    folder = os.path.join(cache_dir(), media_cache_key(path))
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, name)
+
+
+def media_info(path):
+    """
+    probe_media 결과를 디스크에 캐시해서 돌려준다. 키에 크기/수정 시각이 들어가므로 파일이 바뀌면 다시 probe한다.
+    GUI가 열 때 한 번 probe해 두면 내보내기/썸네일/분석 (다른 프로세스 포함)은 ffmpeg를 다시 띄우지 않는다.
+    """
+    cache_path = media_cache_path(path, 'probe.json')
+    cached = _read_json(cache_path)
+    if cached is not None:
+        return cached
+    info = probe_media(path)
+    _write_atomic(cache_path, json.dumps(info).encode('utf-8'))
+    return info
+
+
+def _write_atomic(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _open_pipe(args):
+    cmd = [get_ffmpeg_exe(), '-hide_banner', '-nostdin', '-loglevel', 'error'] + args
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                            creationflags=_POPEN_FLAGS)
+
+
+def _split_jpegs(buffer):
+    """이어붙은 JPEG 바이트에서 완성된 이미지들과 남은 바이트를 돌려준다 (FFD8 ~ FFD9)"""
+    images = []
+    while True:
+        start = buffer.find(b'\xff\xd8')
+        end = buffer.find(b'\xff\xd9', start + 2) if start >= 0 else -1
+        if end < 0:
+            return images, buffer[start:] if start > 0 else buffer
+        images.append(buffer[start:end + 2])
+        buffer = buffer[end + 2:]
+
+
+def thumbnail_strip(path, height=THUMB_HEIGHT, count=THUMB_COUNT, on_thumb=None, should_stop=None):
+    """
+    타임라인용 썸네일 [(시각, JPEG 바이트), ...].
+    키프레임만 디코딩(-skip_frame nokey)하고 작은 크기로 줄여서 빠르게 만들며, 결과는 디스크에 캐시한다.
+    on_thumb(index, time, jpeg)로 하나씩 받을 수 있다 (캐시가 있으면 즉시 전부 전달).
+    """
+    name = f"thumbs_h{height}_n{count}"
+    index_path = media_cache_path(path, name + '.json')
+    data_path = media_cache_path(path, name + '.mjpeg')
+    index = _read_json(index_path)
+    if index is not None and os.path.exists(data_path):
+        with open(data_path, 'rb') as f:
+            images, _ = _split_jpegs(f.read())
+        thumbs = list(zip(index['times'], images))
+        if on_thumb:
+            for i, (t, jpeg) in enumerate(thumbs):
+                on_thumb(i, t, jpeg)
+        return thumbs
+
+    info = media_info(path)
+    if info['vcodec'] is None or info['duration'] <= 0:
+        return []
+    interval = max(info['duration'] / count, 0.5)
+    proc = _open_pipe(['-skip_frame', 'nokey', '-i', path, '-map', '0:v:0', '-an',
+                       '-vf', f"fps=1/{interval:.4f}:round=down,scale=-2:{height}",
+                       '-fps_mode', 'vfr', '-q:v', '5', '-f', 'image2pipe', '-c:v', 'mjpeg', '-'])
+    thumbs, buffer = [], b''
+    try:
+        while True:
+            chunk = proc.stdout.read(65536)
+            if not chunk:
+                break
+            images, buffer = _split_jpegs(buffer + chunk)
+            for jpeg in images:
+                t = len(thumbs) * interval
+                thumbs.append((t, jpeg))
+                if on_thumb:
+                    on_thumb(len(thumbs) - 1, t, jpeg)
+            if should_stop and should_stop():
+                proc.kill()
+                return thumbs
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+    if proc.returncode == 0 and thumbs:
+        _write_atomic(data_path, b''.join(jpeg for _, jpeg in thumbs))
+        _write_atomic(index_path, json.dumps({'times': [t for t, _ in thumbs]}).encode('utf-8'))
+    return thumbs
+
+
+def waveform_peaks(path, buckets=WAVEFORM_BUCKETS, on_progress=None, should_stop=None):
+    """
+    오디오를 낮은 샘플레이트 모노로 디코딩해서 구간별 최대 진폭(0~1) 목록을 만든다. 결과는 디스크에 캐시.
+    on_progress(peaks_so_far)가 일정 간격으로 호출된다. 오디오가 없으면 빈 리스트.
+    """
+    cache_path = media_cache_path(path, f"waveform_{buckets}.json")
+    cached = _read_json(cache_path)
+    if cached is not None:
+        if on_progress:
+            on_progress(cached)
+        return cached
+
+    info = media_info(path)
+    if info['acodec'] is None or info['duration'] <= 0:
+        return []
+    per_bucket = max(1, int(info['duration'] * WAVEFORM_RATE / buckets))
+    proc = _open_pipe(['-i', path, '-map', '0:a:0', '-vn', '-ac', '1', '-ar', str(WAVEFORM_RATE),
+                       '-f', 's16le', '-acodec', 'pcm_s16le', '-'])
+    peaks = []
+    step = max(1, buckets // 50)
+    try:
+        while True:
+            raw = proc.stdout.read(per_bucket * 2)
+            if len(raw) < 2:
+                break
+            samples = array('h')
+            samples.frombytes(raw[:len(raw) // 2 * 2])
+            if sys.byteorder == 'big':
+                samples.byteswap()
+            peaks.append(max(max(samples), -min(samples)) / 32768)
+            if on_progress and len(peaks) % step == 0:
+                on_progress(peaks)
+            if should_stop and should_stop():
+                proc.kill()
+                return peaks
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+    if proc.returncode == 0:
+        _write_atomic(cache_path, json.dumps([round(p, 4) for p in peaks]).encode('utf-8'))
+    if on_progress:
+        on_progress(peaks)
+    return peaks
+
+
+def frame_index(path):
+    """
+    프레임/키프레임 시각 인덱스 {'fps', 'frames', 'keyframes'} (초, 파일 시작 기준).
+    한 번 만들면 디스크에 캐시되어 탐색/프레임 단위 이동/스트림 복사가 재분석 없이 쓴다.
+    """
+    # v2: 예전 인덱스는 파일 시작 시각을 한 번 더 빼서 start가 0이 아닌 파일에서 어긋나 있었음
+    cache_path = media_cache_path(path, 'frame_index_v2.json')
+    cached = _read_json(cache_path)
+    if cached is not None:
+        return cached
+
+    frames, keyframes = scan_frames(path)
+    # 평균 대신 중앙값 간격으로 fps 추정 (가변 프레임레이트에서도 안정적)
+    gaps = sorted(b - a for a, b in zip(frames, frames[1:]) if b > a)
+    fps = 1.0 / gaps[len(gaps) // 2] if gaps else 0.0
+    index = {'fps': round(fps, 3),
+             'frames': [round(t, 6) for t in frames],
+             'keyframes': [round(t, 6) for t in keyframes]}
+    _write_atomic(cache_path, json.dumps(index).encode('utf-8'))
+    return index
+
+
+def frame_at(index, seconds):
+    """seconds 시점에 화면에 보이는 프레임 번호 (없으면 0)"""
+    return max(0, bisect.bisect_right(index['frames'], seconds + 0.0005) - 1)
+
+
+def format_timecode(seconds, fps):
+    """HH:MM:SS:FF (fps를 모르면 HH:MM:SS.mmm)"""
+    seconds = max(0.0, seconds)
+    whole = int(seconds + 1e-6)
+    hms = f"{whole // 3600:02}:{whole // 60 % 60:02}:{whole % 60:02}"
+    if fps <= 0:
+        return f"{hms}.{int((seconds - whole) * 1000):03}"
+    frame = min(int((seconds - whole) * fps + 0.5), max(0, math.ceil(fps) - 1))
+    return f"{hms}:{frame:02}"
+
+# ==========================================
+# 7. 프록시 (미리보기 전용 저해상도 사본)
+# ==========================================
+PROXY_HEIGHT = 540
+PROXY_GOP = 10  # 짧은 GOP: 어디로 탐색해도 디코딩할 프레임이 적어서 스크러빙이 부드러움
+PROXY_CACHE_BYTES = 10 * 1024 ** 3
+# 해상도와 상관없이 미리보기 디코딩이 무거운 코덱
+HEAVY_CODECS = {'hevc', 'vp9', 'av1', 'prores', 'dnxhd'}
+
+
+def proxy_dir():
+    path = os.path.join(cache_dir(), 'proxies')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def proxy_path(path):
+    return os.path.join(proxy_dir(), media_cache_key(path) + '.mp4')
+
+
+def needs_proxy(info, height=PROXY_HEIGHT):
+    """4K 같은 고해상도나 디코딩이 무거운 코덱이면 True"""
+    if info['vcodec'] is None:
+        return False
+    return min(display_size(info)) > height * 2 or info['vcodec'] in HEAVY_CODECS
+
+
+def find_proxy(path):
+    """만들어 둔 프록시 경로 (없으면 None). 사용 시각을 갱신해서 LRU 정리 대상에서 뒤로 보낸다."""
+    proxy = proxy_path(path)
+    if not os.path.exists(proxy):
+        return None
+    try:
+        os.utime(proxy)
+    except OSError:
+        pass
+    return proxy
+
+
+def build_proxy(path, info=None, progress_cb=None, height=PROXY_HEIGHT, max_cache_bytes=PROXY_CACHE_BYTES):
+    """
+    미리보기용 프록시를 만든다. 회전은 화면 방향으로 적용하고 짧은 변을 height로 줄이며,
+    프레임 시각은 그대로(passthrough) 두므로 프록시의 재생 위치 = 원본 시각이다.
+    크롭은 0~1 비율이라 해상도가 달라도 원본에 그대로 적용된다.
+    """
+    info = info or media_info(path)
+    if info['vcodec'] is None:
+        raise ValueError("비디오 트랙이 없습니다.")
+    dst = proxy_path(path)
+    tmp = f"{dst}.{os.getpid()}.part.mp4"
+    width, disp_height = display_size(info)
+    args = ['-i', path, '-map', '0:v:0', '-map', '0:a:0?']
+    if min(width, disp_height) > height:
+        args += ['-vf', f'scale=-2:{height}' if disp_height <= width else f'scale={height}:-2']
+    args += ['-c:v', 'libx264', '-preset', 'veryfast', '-tune', 'fastdecode', '-crf', '26',
+             '-g', str(PROXY_GOP), '-bf', '0', '-pix_fmt', 'yuv420p', '-fps_mode', 'passthrough',
+             '-c:a', 'aac', '-b:a', '96k', '-movflags', '+faststart', tmp]
+    try:
+        run_ffmpeg(args, info['duration'], progress_cb)
+        os.replace(tmp, dst)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+    if max_cache_bytes:
+        evict_proxies(max_cache_bytes, keep=dst)
+    return dst
+
+
+def evict_proxies(max_bytes, keep=None):
+    """프록시 폴더가 max_bytes를 넘으면 가장 오래 안 쓴 것부터 지운다. 지운 바이트 수를 반환."""
+    entries = []
+    for name in os.listdir(proxy_dir()):
+        full = os.path.join(proxy_dir(), name)
+        try:
+            st = os.stat(full)
+        except OSError:
+            continue
+        if '.part.' in name:
+            # 중간에 죽은 생성 작업의 찌꺼기 (하루 지난 것만)
+            if time.time() - st.st_mtime > 86400:
+                _remove_quietly(full)
+            continue
+        entries.append((st.st_mtime, st.st_size, full))
+
+    total = sum(size for _, size, _ in entries)
+    freed = 0
+    for _, size, full in sorted(entries):
+        if total <= max_bytes:
+            break
+        if keep and os.path.abspath(full) == os.path.abspath(keep):
+            continue
+        if _remove_quietly(full):
+            total -= size
+            freed += size
+    return freed
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+# ==========================================
+# 8. 장면 전환 / 무음 감지 (자를 위치 제안)
+# ==========================================
+ANALYSIS_SIZE = (64, 36)    # 장면 비교용으로 줄인 회색조 프레임 크기
+SCENE_THRESHOLD = 0.3       # 0~1, 히스토그램 차이와 픽셀 차이의 평균
+SCENE_MIN_GAP = 0.5         # 이보다 가까운 장면 전환은 첫 번째만
+SILENCE_DB = -40.0
+SILENCE_MIN_SEC = 0.6
+SILENCE_WINDOW = 0.05       # RMS 창 길이 (초)
+SILENCE_RATE = 8000
+ANALYSIS_CHUNK = 256        # 한 번에 numpy로 처리하는 프레임 수
+ANALYSIS_CACHE = 'analysis_v2.json'  # 장면 시각이 프레임 인덱스 기준이라 인덱스(v2)와 같이 바꿈
+
+
+def _numpy():
+    # 분석 기능에서만 쓰므로 필요할 때 import
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("장면/무음 분석에는 numpy가 필요합니다 (pip install numpy).") from None
+    return numpy
+
+
+def analysis_params(scene_threshold=SCENE_THRESHOLD, silence_db=SILENCE_DB, silence_min=SILENCE_MIN_SEC):
+    return {'scene_threshold': scene_threshold, 'silence_db': silence_db, 'silence_min': silence_min}
+
+
+def scene_scores(np, frames, previous=None):
+    """
+    (N, 픽셀) uint8 회색조 프레임들의 직전 프레임 대비 변화량 (N,) 0~1.
+    16단계 히스토그램 차이(조명/색 변화)와 평균 픽셀 차이(구도 변화)의 평균.
+    """
+    if previous is not None:
+        frames = np.vstack([previous[None, :], frames])
+    n, pixels = frames.shape
+    bins = (frames >> 4).astype(np.int64) + (np.arange(n, dtype=np.int64) * 16)[:, None]
+    hist = np.bincount(bins.ravel(), minlength=16 * n).reshape(n, 16) / pixels
+    hist_diff = 0.5 * np.abs(np.diff(hist, axis=0)).sum(axis=1)
+    pixel_diff = np.abs(np.diff(frames.astype(np.int16), axis=0)).mean(axis=1) / 255
+    scores = (hist_diff + pixel_diff) / 2
+    return scores if previous is not None else np.concatenate([[0.0], scores])
+
+
+def detect_scenes(path, index, threshold=SCENE_THRESHOLD, min_gap=SCENE_MIN_GAP,
+                  on_scene=None, on_progress=None, should_stop=None):
+    """
+    작게 줄인 회색조 프레임을 파이프로 받아 장면 전환 시각 목록을 만든다.
+    프레임 시각은 frame_index 기준이라 프레임 단위 이동/구간과 정확히 맞는다. 중단되면 None.
+    """
+    np = _numpy()
+    width, height = ANALYSIS_SIZE
+    frame_bytes = width * height
+    times = index['frames']
+    fps = index['fps'] or 30.0
+    proc = _open_pipe(['-i', path, '-map', '0:v:0', '-an', '-sn', '-dn',
+                       '-vf', f'scale={width}:{height}:flags=fast_bilinear,format=gray',
+                       '-fps_mode', 'passthrough', '-f', 'rawvideo', '-'])
+    scenes, previous, count = [], None, 0
+    try:
+        while True:
+            raw = proc.stdout.read(frame_bytes * ANALYSIS_CHUNK)
+            n = len(raw) // frame_bytes
+            if n == 0:
+                break
+            frames = np.frombuffer(raw[:n * frame_bytes], dtype=np.uint8).reshape(n, frame_bytes)
+            for i in np.nonzero(scene_scores(np, frames, previous) > threshold)[0]:
+                k = count + int(i)
+                if k == 0:
+                    continue
+                t = times[k] if k < len(times) else k / fps
+                if not scenes or t - scenes[-1] >= min_gap:
+                    scenes.append(round(t, 6))
+                    if on_scene:
+                        on_scene(scenes[-1])
+            previous = frames[-1]
+            count += n
+            if on_progress and times:
+                on_progress(min(100, count * 100 // len(times)))
+            if should_stop and should_stop():
+                proc.kill()
+                return None
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    return scenes
+
+
+def detect_silences(path, duration, threshold_db=SILENCE_DB, min_len=SILENCE_MIN_SEC,
+                    on_silence=None, on_progress=None, should_stop=None):
+    """창(SILENCE_WINDOW)별 RMS가 threshold_db 아래로 min_len 이상 이어진 구간 [(시작, 끝)]. 중단되면 None."""
+    np = _numpy()
+    window = int(SILENCE_RATE * SILENCE_WINDOW)
+    windows_per_read = 200
+    proc = _open_pipe(['-i', path, '-map', '0:a:0', '-vn', '-ac', '1', '-ar', str(SILENCE_RATE),
+                       '-f', 's16le', '-acodec', 'pcm_s16le', '-'])
+    silences, run_start, pos = [], None, 0  # pos: 지금까지 처리한 창 수
+
+    def close_run(end_window):
+        start, end = run_start * SILENCE_WINDOW, end_window * SILENCE_WINDOW
+        if end - start >= min_len:
+            silences.append((round(start, 3), round(end, 3)))
+            if on_silence:
+                on_silence(*silences[-1])
+
+    try:
+        while True:
+            raw = proc.stdout.read(window * 2 * windows_per_read)
+            n = len(raw) // (window * 2)
+            if n == 0:
+                break
+            samples = np.frombuffer(raw[:n * window * 2], dtype='<i2').astype(np.float32) / 32768
+            rms = np.sqrt((samples.reshape(n, window) ** 2).mean(axis=1))
+            quiet = 20 * np.log10(np.maximum(rms, 1e-9)) < threshold_db
+            # 조용함/소리 경계에서만 파이썬으로 처리
+            edges = np.nonzero(np.diff(np.concatenate([[run_start is not None], quiet]).astype(np.int8)))[0]
+            for e in edges:
+                if quiet[e]:
+                    run_start = pos + int(e)
+                else:
+                    close_run(pos + int(e))
+                    run_start = None
+            pos += n
+            if on_progress and duration > 0:
+                on_progress(min(100, int(pos * SILENCE_WINDOW * 100 / duration)))
+            if should_stop and should_stop():
+                proc.kill()
+                return None
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if run_start is not None:
+        close_run(pos)
+    return silences
+
+
+def cached_analysis(path, params=None):
+    cached = _read_json(media_cache_path(path, ANALYSIS_CACHE))
+    if cached is not None and cached.get('params') == (params or analysis_params()):
+        return cached
+    return None
+
+
+def analyze_media(path, params=None, on_scene=None, on_silence=None, on_progress=None, should_stop=None):
+    """
+    장면 전환 + 무음 구간 분석 {'params', 'scenes': [초], 'silences': [[시작, 끝]]}.
+    결과는 파일별로 캐시되어 같은 설정으로는 다시 분석하지 않는다. 중단되면 None.
+    """
+    params = params or analysis_params()
+    cached = cached_analysis(path, params)
+    if cached is not None:
+        return cached
+
+    info = media_info(path)
+    # 비디오 디코딩이 대부분이라 진행률은 장면 85%, 무음 15%로 나눔
+    video_share = 85 if info['vcodec'] and info['acodec'] else (100 if info['vcodec'] else 0)
+    scenes, silences = [], []
+    if info['vcodec']:
+        scenes = detect_scenes(path, frame_index(path), params['scene_threshold'],
+                               on_scene=on_scene, should_stop=should_stop,
+                               on_progress=on_progress and (lambda p: on_progress(p * video_share // 100)))
+    if scenes is not None and info['acodec']:
+        silences = detect_silences(path, info['duration'], params['silence_db'], params['silence_min'],
+                                   on_silence=on_silence, should_stop=should_stop,
+                                   on_progress=on_progress and (
+                                       lambda p: on_progress(video_share + p * (100 - video_share) // 100)))
+    if scenes is None or silences is None:
+        return None
+    result = {'params': params, 'scenes': scenes, 'silences': [list(s) for s in silences]}
+    _write_atomic(media_cache_path(path, ANALYSIS_CACHE), json.dumps(result).encode('utf-8'))
+    return result
+
+
+def ranges_between(points, start, end, min_len=0.0):
+    """[start, end] 안을 points(장면 전환 시각)로 나눈 구간들"""
+    cuts = [start] + [p for p in sorted(points) if start < p < end] + [end]
+    return [(a, b) for a, b in zip(cuts, cuts[1:]) if b - a > min_len]
+
+
+def ranges_without(silences, start, end, min_len=0.1):
+    """[start, end]에서 무음 구간을 뺀 나머지 (무음 자동 제거용)"""
+    ranges, cursor = [], start
+    for s, e in sorted(silences):
+        if e <= cursor or s >= end:
+            continue
+        if s - cursor > min_len:
+            ranges.append((cursor, s))
+        cursor = max(cursor, e)
+    if end - cursor > min_len:
+        ranges.append((cursor, end))
+    return ranges
+
+# ==========================================
+# 9. 분할 인코딩 (병렬 / 중단 후 이어서)
+# ==========================================
+CHUNK_SECONDS = 60.0      # 조각 최대 길이. 중단되면 잃는 작업량이 최대 이만큼
+CHUNK_MIN_SECONDS = 5.0
+CHUNK_EXT = '.mkv'        # VP9/AV1까지 모든 인코더를 담을 수 있고 concat으로 그대로 이어붙일 수 있음
+CHUNK_KEEP_SECONDS = 7 * 86400  # 이어서 하지 않고 버려진 조각 폴더는 일주일 뒤 정리
+
+
+def chunk_ranges(start, end, keyframes):
+    """
+    [start, end)를 키프레임에서 나눈 조각 [(시작, 끝)]. 조각마다 키프레임부터 디코딩하므로 버리는 프레임이 없다.
+    짧은 영상도 여러 워커가 나눠 갖도록 약 32조각을 목표로 하고, 마지막 조각이 너무 짧으면 앞 조각에 붙인다.
+    조각 경계는 워커 수와 상관없으므로 동시 작업 수를 바꿔 다시 실행해도 끝난 조각을 그대로 쓴다.
+    """
+    length = min(CHUNK_SECONDS, max(CHUNK_MIN_SECONDS, (end - start) / 32))
+    bounds = [start]
+    for kf in keyframes:
+        if kf - bounds[-1] >= length and end - kf >= length / 2:
+            bounds.append(kf)
+    bounds.append(end)
+    return list(zip(bounds, bounds[1:]))
+
+
+def chunk_dir():
+    path = os.path.join(cache_dir(), 'chunks')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def chunk_work_dir(job, start, end):
+    """원본/출력/구간/크롭/인코딩 설정이 같으면 같은 폴더 → 다시 실행하면 끝난 조각을 재사용"""
+    params = {'output': os.path.abspath(job['output']), 'start': round(start, 6), 'end': round(end, 6),
+              'crop': job['crop'], 'encoder': job['encoder']}
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(chunk_dir(), f"{media_cache_key(job['file'])}_{digest}")
+
+
+def evict_stale_chunks(max_age=CHUNK_KEEP_SECONDS, keep=None):
+    for name in os.listdir(chunk_dir()):
+        full = os.path.join(chunk_dir(), name)
+        try:
+            stale = time.time() - os.stat(full).st_mtime > max_age
+        except OSError:
+            continue
+        if stale and full != keep:
+            shutil.rmtree(full, ignore_errors=True)
+
+
+def _export_chunked(job, progress_cb, status_cb):
+    """
+    구간을 키프레임 조각으로 나눠 ffmpeg 여러 개로 동시에 (비디오만) 인코딩하고, 끝난 조각은 매니페스트에 기록한다.
+    모든 조각이 끝나면 스트림 복사로 이어붙이면서 오디오를 한 번에 인코딩하고 (조각마다 AAC를 나누면 경계에서
+    틱 소리가 남). 출력 경로로의 rename은 perform_export가 한다. 취소/실패 시 조각 폴더는 남겨서 다음 실행이 이어서 한다.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+    info = media_info(job['file'])
+    if info['vcodec'] is None:
+        raise ValueError("비디오 트랙이 없습니다.")
+    start = job['start']
+    end = job['end'] if job['end'] > 0 else info['duration']
+    end = min(end, info['duration'])
+    if end - start <= 0:
+        raise ValueError("내보낼 구간이 비어 있습니다.")
+
+    status_cb("키프레임 분석 중...")
+    ranges = chunk_ranges(start, end, list_keyframes(job['file']))
+    work_dir = chunk_work_dir(job, start, end)
+    evict_stale_chunks(keep=work_dir)
+    os.makedirs(work_dir, exist_ok=True)
+    manifest_path = os.path.join(work_dir, 'manifest.json')
+    files = [os.path.join(work_dir, f"chunk_{i:04d}{CHUNK_EXT}") for i in range(len(ranges))]
+    manifest = _read_json(manifest_path) or {}
+    if manifest.get('ranges') != [list(r) for r in ranges]:
+        manifest = {'file': job['file'], 'output': job['output'], 'ranges': [list(r) for r in ranges], 'done': []}
+    done = {i for i in manifest['done'] if i < len(files) and os.path.exists(files[i])}
+    todo = [i for i in range(len(ranges)) if i not in done]
+
+    total = end - start
+    workers = max(1, min(job['chunk_workers'], len(todo) or 1))
+    settings = dict(job['encoder'])
+    if workers > 1 and not settings['threads']:
+        # 인코더마다 코어 수만큼 스레드를 만들면 서로 뺏어가기만 하므로 나눠 줌
+        settings['threads'] = max(1, (os.cpu_count() or 1) // workers)
+
+    lock = threading.Lock()
+    state = {'stop': False, 'resumed': sum(ranges[i][1] - ranges[i][0] for i in done),
+             'finished': {'frame': 0, 'bytes': 0, 'out_time': 0.0}, 'current': {}}
+
+    def report():
+        # 이번 실행에서 인코딩한 양의 합 (텔레메트리가 단계별 누적을 하지 않도록 단조 증가)
+        current = state['current'].values()
+        stats = {key: state['finished'][key] + sum(c[key] for c in current) for key in state['finished']}
+        stats['fps'] = sum(c['fps'] for c in current)
+        stats['speed'] = sum(c['speed'] for c in current)
+        percent = int((state['resumed'] + stats['out_time']) / total * 95)
+        progress_cb(max(0, min(95, percent)), stats)
+
+    def chunk_progress(i):
+        def progress(_percent, stats=None):
+            if state['stop']:
+                raise ExportCanceled()
+            with lock:
+                if stats:
+                    state['current'][i] = stats
+                report()
+        return progress
+
+    def encode(i):
+        tmp = f"{files[i]}.part{CHUNK_EXT}"
+        try:
+            # 첫 조각만 사용자가 정한 시작점, 나머지는 키프레임에서 시작
+            render_range(job['file'], tmp, ranges[i][0], ranges[i][1], job['crop'], info, settings,
+                         chunk_progress(i), audio=False, keyframe_start=i > 0)
+            os.replace(tmp, files[i])
+        except BaseException:
+            _remove_quietly(tmp)
+            raise
+        with lock:
+            last = state['current'].pop(i, None)
+            for key in state['finished']:
+                state['finished'][key] += last[key] if last else 0
+            done.add(i)
+            manifest['done'] = sorted(done)
+            _write_atomic(manifest_path, json.dumps(manifest).encode('utf-8'))
+
+    if todo:
+        resumed = f", {len(done)}개는 이전 실행에서 완료" if done else ""
+        status_cb(f"{len(ranges)}개 조각 인코딩 중 (동시 {workers}개{resumed})...")
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            pending = {pool.submit(encode, i) for i in todo}
+            while pending:
+                # 시간 제한을 둬야 메인 스레드가 취소 시그널(SIGTERM/Ctrl+C)을 바로 받는다
+                finished, pending = wait(pending, timeout=0.5, return_when=FIRST_EXCEPTION)
+                for future in finished:
+                    future.result()
+        except BaseException:
+            # 나머지 조각은 다음 진행률 콜백에서 ffmpeg를 멈추고 빠져나옴
+            state['stop'] = True
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown()
+    else:
+        status_cb(f"{len(ranges)}개 조각 모두 이전 실행에서 완료")
+
+    status_cb("조각 이어붙이는 중...")
+    list_path = os.path.join(work_dir, 'list.txt')
+    with open(list_path, 'w', encoding='utf-8') as f:
+        f.writelines(_concat_list_line(path) for path in files)
+    args = ['-f', 'concat', '-safe', '0', '-i', list_path]
+    if info['acodec']:
+        # 오디오는 render_range와 같은 경계로 원본에서 바로 읽음
+        a = max(0.0, start - FRAME_EPS)
+        args += ['-ss', f'{a:.6f}', '-t', f'{end - FRAME_EPS - a:.6f}', '-i', job['file'],
+                 '-map', '0:v:0', '-map', '1:a:0'] + audio_codec_args(job['output'], job['encoder'])
+    else:
+        args += ['-map', '0:v:0']
+    args += ['-c:v', 'copy']
+    # job['output']은 perform_export의 임시 경로라 실패해도 출력 경로에는 깨진 파일이 남지 않음
+    run_ffmpeg(args + [job['output']], total, _scaled_progress(progress_cb, 95, 5))
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+# ==========================================
+# 10. 프로젝트 파일 (편집 상태 저장 / 다시 열기)
+# ==========================================
+PROJECT_EXT = '.solcut'
+PROJECT_VERSION = 1
+
+
+def project_source(path, info=None):
+    """
+    프로젝트에 남길 원본 정보. 캐시 키와 probe 결과를 같이 저장해 두면, 다시 열 때 파일이 그대로인 한
+    probe를 다시 하지 않고 썸네일/파형/프레임 인덱스/분석/프록시 캐시도 같은 키로 그대로 찾는다.
+    """
+    return {'path': os.path.abspath(path), 'key': media_cache_key(path), 'info': info or media_info(path)}
+
+
+def _with_relpath(source, base_dir):
+    source = dict(source)
+    try:
+        source['relpath'] = os.path.relpath(source['path'], base_dir)
+    except ValueError:
+        source['relpath'] = None  # 윈도우에서 드라이브가 다르면 상대 경로 없음
+    return source
+
+
+def _resolve_source(source, base_dir):
+    candidates = [source.get('path')]
+    if source.get('relpath'):
+        candidates.append(os.path.join(base_dir, source['relpath']))
+    found = next((p for p in candidates if p and os.path.isfile(p)), None)
+    if found is None:
+        raise ValueError(f"원본 파일을 찾을 수 없습니다: {source.get('path')}")
+    source['path'] = os.path.abspath(found)
+    if media_cache_key(found) != source.get('key'):
+        source['key'], source['info'] = media_cache_key(found), None
+
+
+def save_project(path, project):
+    """
+    project dict를 JSON으로 저장. 원본 경로는 프로젝트 파일 기준 상대 경로도 같이 남겨 폴더째 옮겨도 열린다.
+    'clips'([{'source', 'edit'}, ...])가 있으면 클립 목록의 원본들도 같은 방식으로 저장한다.
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    project = dict(project, version=PROJECT_VERSION, saved=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    project['source'] = _with_relpath(project['source'], base_dir)
+    if project.get('clips'):
+        project['clips'] = [dict(clip, source=_with_relpath(clip['source'], base_dir)) for clip in project['clips']]
+    _write_atomic(path, json.dumps(project, ensure_ascii=False, indent=1).encode('utf-8'))
+
+
+def load_project(path):
+    """
+    프로젝트를 읽고 원본 위치를 찾는다 (절대 경로 → 프로젝트 기준 상대 경로).
+    원본이 저장 이후 바뀌었으면 source['info']를 None으로 비워서 다시 probe하게 한다.
+    """
+    project = _read_json(path)
+    if not isinstance(project, dict) or 'source' not in project:
+        raise ValueError(f"프로젝트 파일을 읽을 수 없습니다: {os.path.basename(path)}")
+    if project.get('version', 0) > PROJECT_VERSION:
+        raise ValueError("더 새로운 버전에서 저장된 프로젝트입니다.")
+    base_dir = os.path.dirname(os.path.abspath(path))
+    _resolve_source(project['source'], base_dir)
+    for clip in project.get('clips') or []:
+        _resolve_source(clip['source'], base_dir)
+    project.setdefault('clips', [])
+    project.setdefault('edit', {})
+    project.setdefault('export', {})
+    project.setdefault('view', {})
+    return project
+
+# ==========================================
+# 11. 여러 파일 이어붙이기
+# ==========================================
+# 열기 대화상자/끌어다 놓기에서 받는 확장자 (ffmpeg가 읽을 수 있으면 그 밖의 형식도 동작은 함)
+MEDIA_EXTS = ('.mp4', '.mov', '.m4v', '.mkv', '.webm', '.avi', '.wmv', '.flv', '.mpg', '.mpeg',
+              '.ts', '.mts', '.m2ts', '.3gp', '.mp3', '.m4a', '.aac', '.wav', '.flac', '.ogg', '.opus')
+# 스트림 복사로 이어붙이려면 모든 클립에서 같아야 하는 값
+CONCAT_VIDEO_KEYS = ('vcodec', 'pix_fmt', 'width', 'height', 'fps', 'rotation')
+CONCAT_AUDIO_KEYS = ('acodec', 'sample_rate', 'channels')
+
+
+def new_clip(file_path, start_t=0.0, end_t=0.0, crop_rect=None):
+    """이어붙일 파일 하나의 구간 (end 0 = 끝까지)"""
+    return dict(new_segment(start_t, end_t, crop_rect), file=file_path)
+
+
+def concat_mismatch(infos, output_path, audio_only=False):
+    """
+    스트림 복사로 이어붙일 수 없는 이유 (가능하면 None). concat은 패킷을 그대로 잇기만 하므로
+    코덱/해상도/픽셀 포맷/fps/오디오 형식이 모든 클립에서 같고, 출력 컨테이너에 담을 수 있어야 한다.
+    output_path가 None이면 (저장 위치를 아직 모름) 컨테이너 검사는 건너뛴다.
+    """
+    ext = os.path.splitext(output_path or '')[1].lower() or '(확장자 없음)'
+    keys = CONCAT_AUDIO_KEYS if audio_only else CONCAT_VIDEO_KEYS + CONCAT_AUDIO_KEYS
+    if output_path is not None:
+        if audio_only and not all(can_copy_audio(info, output_path) for info in infos):
+            return f"{ext}에 담을 수 없는 오디오 코덱"
+        if not audio_only and not all(can_stream_copy(info, output_path) for info in infos):
+            return f"{ext}에 담을 수 없는 코덱"
+    for i, info in enumerate(infos[1:], 2):
+        diff = [key for key in keys if info.get(key) != infos[0].get(key)]
+        if diff:
+            return f"{i}번 클립의 {'/'.join(diff)}이(가) 첫 클립과 다름"
+    return None
+
+
+def _clip_ranges(clips, infos, audio_only):
+    """클립마다 실제 (시작, 끝). 없는 트랙을 내보내려 하거나 구간이 비어 있으면 ValueError"""
+    ranges = []
+    for clip, info in zip(clips, infos):
+        name = os.path.basename(clip['file'])
+        if audio_only and info['acodec'] is None:
+            raise ValueError(f"오디오 트랙이 없습니다: {name}")
+        if not audio_only and info['vcodec'] is None:
+            raise ValueError(f"비디오 트랙이 없습니다: {name}")
+        end = clip['end'] if clip['end'] > 0 else info['duration']
+        end = min(end, info['duration'])
+        if end - clip['start'] <= 0.01:
+            raise ValueError(f"잘못된 구간: {name} {clip['start']:.2f} ~ {end:.2f}")
+        ranges.append((max(0.0, clip['start']), end))
+    return ranges
+
+
+def render_clips_combined(clips, ranges, infos, dst, settings, audio_only=False, progress_cb=None):
+    """
+    여러 파일을 디코딩해서 한 번의 인코딩으로 이어붙인다. 해상도가 다르면 첫 클립 크기에 맞춰 레터박스,
+    오디오는 첫 클립의 샘플레이트/스테레오로 맞추고, 오디오가 없는 클립은 그 길이만큼 무음으로 채운다.
+    """
+    first = infos[0]
+    target = None if audio_only else limit_height(_segment_size(clips[0], display_size(first)), settings)
+    has_audio = any(info['acodec'] for info in infos)
+    rate = next((info['sample_rate'] for info in infos if info['acodec'] and info['sample_rate']), 48000)
+    args, graph, inputs = [], [], ''
+    total = 0.0
+    for i, (clip, (start, end), info) in enumerate(zip(clips, ranges, infos)):
+        start = max(0.0, start - FRAME_EPS)
+        end -= FRAME_EPS
+        total += end - start
+        args += ['-ss', f'{start:.6f}', '-t', f'{end - start:.6f}', '-i', clip['file']]
+        if not audio_only:
+            graph.append(f"[{i}:v:0]setpts=PTS-STARTPTS"
+                         f"{_video_chain(clip, display_size(info), settings, target)}[v{i}]")
+            inputs += f"[v{i}]"
+        if has_audio:
+            if info['acodec']:
+                graph.append(f"[{i}:a:0]asetpts=PTS-STARTPTS,"
+                             f"aformat=sample_rates={rate}:channel_layouts=stereo[a{i}]")
+            else:
+                graph.append(f"aevalsrc=0:c=stereo:s={rate}:d={end - start:.6f}[a{i}]")
+            inputs += f"[a{i}]"
+
+    v, a = (0 if audio_only else 1), (1 if has_audio else 0)
+    graph.append(f"{inputs}concat=n={len(clips)}:v={v}:a={a}" + ("[vout]" if v else '') + ("[aout]" if a else ''))
+    args += ['-filter_complex', ';'.join(graph)]
+    if v:
+        args += ['-map', '[vout]']
+    if a:
+        args += ['-map', '[aout]']
+    run_ffmpeg(args + _encoder_args(dst, first, settings, audio_only) + [dst], total, progress_cb)
+
+
+def _concat_copy(job, ranges, infos, progress_cb, status_cb):
+    """
+    재인코딩 없이 이어붙이기. 통째로 쓰는 클립은 원본을 concat 목록에 바로 넣고, 잘라 쓰는 클립만
+    키프레임 기준 스트림 복사로 임시 조각을 만든다 (오디오만이면 오디오 스트림만 복사).
+    조각은 원본과 같은 컨테이너로 써서 목록 안의 타임스탬프 정밀도/시작 시각 처리가 섞이지 않게 한다.
+    """
+    clips = job['clips']
+    audio_only = job['mode'] == 'audio'
+    total = sum(end - start for start, end in ranges)
+    trimmed = [i for i, (clip, (start, end), info) in enumerate(zip(clips, ranges, infos))
+               if audio_only or start > 0 or end < info['duration']]
+    work_dir = tempfile.mkdtemp(prefix='solcutter_concat_')
+    try:
+        parts = [clip['file'] for clip in clips]
+        # 잘라내기는 디스크 복사라 금방 끝나므로 진행률 앞 20%만 할당
+        span = 20 if trimmed else 0
+        for n, i in enumerate(trimmed):
+            start, end = ranges[i]
+            status_cb(f"클립 잘라내는 중 (스트림 복사)... ({n + 1}/{len(trimmed)})")
+            progress = _scaled_progress(progress_cb, n * span / len(trimmed), span / len(trimmed))
+            if audio_only:
+                # 오디오만이면 모든 클립이 조각이 되므로 한 가지 중간 형식으로 통일
+                parts[i] = os.path.join(work_dir, f"part_{i:04d}{CHUNK_EXT}")
+                extract_audio(clips[i]['file'], parts[i], start, end, job['encoder'], True, progress)
+            else:
+                parts[i] = os.path.join(work_dir, f"part_{i:04d}{os.path.splitext(clips[i]['file'])[1]}")
+                index = frame_index(clips[i]['file'])
+                actual = stream_copy_trim(clips[i]['file'], parts[i], start, end, infos[i], index['keyframes'],
+                                          job['fast_trim'], progress, index['frames'])
+                total += start - actual
+
+        status_cb(f"{len(clips)}개 클립 이어붙이는 중 (스트림 복사)...")
+        list_path = os.path.join(work_dir, 'list.txt')
+        with open(list_path, 'w', encoding='utf-8') as f:
+            f.writelines(_concat_list_line(os.path.abspath(path)) for path in parts)
+        args = ['-f', 'concat', '-safe', '0', '-i', list_path]
+        args += ['-map', '0:a:0'] if audio_only else ['-map', '0:v:0', '-map', '0:a:0?']
+        run_ffmpeg(args + ['-c', 'copy', job['output']], total, _scaled_progress(progress_cb, span, 100 - span))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _export_clips(job, progress_cb, status_cb):
+    clips = job['clips']
+    audio_only = job['mode'] == 'audio'
+    status_cb("클립 정보 확인 중...")
+    infos = [media_info(clip['file']) for clip in clips]
+    ranges = _clip_ranges(clips, infos, audio_only)
+
+    reason = "재인코딩 모드" if job['fast_trim'] == 'off' else None
+    if reason is None and any(clip['crop'] for clip in clips):
+        reason = "크롭"
+    if reason is None:
+        reason = concat_mismatch(infos, job['output'], audio_only)
+    if reason is None:
+        try:
+            _concat_copy(job, ranges, infos, progress_cb, status_cb)
+            return
+        except FFmpegError as e:
+            # 스마트 컷 등 복사 경로가 실패하면 단일 파일 내보내기처럼 재인코딩으로 넘어감
+            reason = f"스트림 복사 실패: {e}"
+    status_cb(f"스트림 복사 불가 ({reason}) → {len(clips)}개 클립을 한 번에 재인코딩")
+    render_clips_combined(clips, ranges, infos, job['output'], job['encoder'], audio_only, progress_cb)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--export-worker']:
+        export_worker_main()
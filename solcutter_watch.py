@@ -0,0 +1,312 @@
+"""
+감시 폴더 자동 처리 (GUI 없이 계속 실행)
+
+    python solcutter_cli.py watch rule.json            # Ctrl+C로 종료
+    python solcutter_cli.py watch rule.json --once     # 지금 있는 파일만 처리하고 종료
+
+규칙 파일 (JSON):
+
+    {
+      "watch": "D:/녹화",              감시할 폴더
+      "output_dir": "D:/녹화/out",     출력 폴더 (기본: 감시 폴더/out)
+      "patterns": ["*.mp4", "*.mkv"],
+      "mode": "audio",                 video | audio
+      "crop": "0.1,0.1,0.5,0.5",       video 모드 크롭 (선택)
+      "trim_head": 5, "trim_tail": "0:03",
+      "fast_trim": "keyframe",         off | keyframe | smart
+      "profile": "standard", "encoder": {"crf": 20},
+      "naming": "{date}_{n}",          {date}=YYYYMMDD, {n}=번호, {stem}=원본 이름
+      "ext": ".mp3",                   (기본: video .mp4 / audio .mp3)
+      "workers": 2,
+      "settle_seconds": 10             크기/수정 시각이 이만큼 그대로여야 다 써진 것으로 봄
+    }
+
+처리 결과는 SQLite(state_db, 기본: 캐시 폴더/watch_state.sqlite)에 경로+크기+수정 시각 기준으로 남아서
+다시 시작해도 이미 끝난 파일은 건너뛴다. 실패한 파일은 잠시 뒤 몇 번 더 시도하고 (파일이 바뀌면 새 파일로 봄),
+감시를 다시 시작하면 다시 시도한다.
+"""
+import os
+import time
+import json
+import fnmatch
+import sqlite3
+import signal
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import solcutter_engine as engine
+
+POLL_SECONDS = 2.0
+SETTLE_SECONDS = 10.0
+PROBE_ATTEMPTS = 5  # 크기가 멈춘 뒤에도 열리지 않으면 (녹화 중 일시정지 등) 이만큼 더 기다려 봄
+ERROR_RETRIES = 3     # 실패한 파일을 (파일이 그대로여도) 다시 시도하는 횟수. 감시를 다시 시작하면 새로 셈
+RETRY_SECONDS = 60.0  # 실패 후 다시 시도하기까지 기다리는 시간
+
+# ==========================================
+# 1. 규칙
+# ==========================================
+def load_rule(path):
+    with open(path, encoding='utf-8') as f:
+        record = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    return rule_from_record(record, base_dir)
+
+
+def rule_from_record(record, base_dir=''):
+    """규칙 dict를 검증하고 기본값을 채운다. 상대 경로는 규칙 파일 위치 기준."""
+    if not record.get('watch'):
+        raise ValueError("감시할 폴더(watch)가 지정되지 않았습니다.")
+    mode = record.get('mode') or 'video'
+    if mode not in engine.EXPORT_MODES:
+        raise ValueError(f"알 수 없는 모드: {mode}")
+    fast_trim = record.get('fast_trim') or 'keyframe'
+    if fast_trim not in engine.FAST_TRIM_MODES:
+        raise ValueError(f"알 수 없는 자르기 방식: {fast_trim} ({'/'.join(engine.FAST_TRIM_MODES)})")
+    watch_dir = os.path.abspath(os.path.join(base_dir, record['watch']))
+    output_dir = os.path.abspath(os.path.join(base_dir, record.get('output_dir') or os.path.join(watch_dir, 'out')))
+    ext = record.get('ext') or ('.mp3' if mode == 'audio' else '.mp4')
+    if not ext.startswith('.'):
+        ext = '.' + ext
+    if mode == 'audio' and ext.lower() not in engine.AUDIO_FORMATS:
+        raise ValueError(f"지원하지 않는 오디오 형식입니다: {ext}")
+    return {
+        'watch': watch_dir,
+        'output_dir': output_dir,
+        'patterns': record.get('patterns') or ['*.mp4', '*.mkv', '*.mov'],
+        'mode': mode,
+        'crop': engine.parse_crop(record.get('crop')) if mode == 'video' else None,
+        'trim_head': engine.parse_time(record.get('trim_head')),
+        'trim_tail': engine.parse_time(record.get('trim_tail')),
+        'fast_trim': fast_trim,
+        'encoder': engine.encoder_settings(record.get('profile') or 'standard', **(record.get('encoder') or {})),
+        'naming': record.get('naming') or '{date}_{n}',
+        'ext': ext,
+        'workers': max(1, int(record.get('workers') or 1)),
+        'settle_seconds': float(record.get('settle_seconds', SETTLE_SECONDS)),
+        'state_db': record.get('state_db') and os.path.abspath(os.path.join(base_dir, record['state_db'])),
+    }
+
+
+def numbered_output_path(rule, source, taken=()):
+    """naming 패턴에서 출력 폴더와 taken(처리 중인 작업의 출력)에 없는 첫 번호를 고른다."""
+    stem = os.path.splitext(os.path.basename(source))[0]
+    date = datetime.now().strftime("%Y%m%d")
+    n = 1
+    while True:
+        name = rule['naming'].format(date=date, n=n, stem=stem) + rule['ext']
+        path = os.path.join(rule['output_dir'], name)
+        if path not in taken and not os.path.exists(path):
+            return path
+        if '{n}' not in rule['naming']:
+            raise ValueError(f"출력 파일이 이미 있습니다: {path} (naming에 {{n}}을 넣으세요)")
+        n += 1
+
+# ==========================================
+# 2. 처리 기록 (SQLite)
+# ==========================================
+class WatchState:
+    """
+    파일별 처리 상태. 같은 경로라도 크기/수정 시각이 다르면 새 파일로 본다.
+    running으로 남은 행은 지난 실행이 도중에 죽은 것이므로 다시 처리한다.
+    error는 attempts가 ERROR_RETRIES에 닿을 때까지 RETRY_SECONDS 간격으로 다시 시도한다.
+    """
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute("""CREATE TABLE IF NOT EXISTS processed (
+                               path TEXT, size INTEGER, mtime_ns INTEGER,
+                               output TEXT, state TEXT, message TEXT, updated TEXT,
+                               attempts INTEGER NOT NULL DEFAULT 0,
+                               PRIMARY KEY (path, size, mtime_ns))""")
+        # attempts가 없던 예전 기록 파일
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(processed)")]
+        if 'attempts' not in columns:
+            self.db.execute("ALTER TABLE processed ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+        self.db.commit()
+
+    @staticmethod
+    def file_key(path):
+        st = os.stat(path)
+        return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+    def should_skip(self, key):
+        """이미 끝났거나 처리 중이거나, 실패했는데 아직 다시 시도할 때가 아니면 True"""
+        row = self.db.execute("SELECT state, attempts, updated FROM processed WHERE path=? AND size=? AND mtime_ns=?",
+                              key).fetchone()
+        if row is None:
+            return False
+        state, attempts, updated = row
+        if state != 'error':
+            return True
+        waited = (datetime.now() - datetime.fromisoformat(updated)).total_seconds()
+        # attempts 0 = 감시를 다시 시작하면서 초기화된 것이므로 바로 다시 시도
+        return attempts >= ERROR_RETRIES or (attempts > 0 and waited < RETRY_SECONDS)
+
+    def is_output(self, path):
+        """우리가 만든 출력이거나, 처리 중인 작업이 쓰고 있는 임시 출력(.part)이면 True"""
+        path = os.path.abspath(path)
+        paths = [path]
+        stem, ext = os.path.splitext(path)
+        if stem.endswith('.part'):
+            # running 행에 출력 경로를 먼저 남기고 워커를 띄우므로 처리 중인 출력도 여기서 걸림
+            paths.append(stem[:-len('.part')] + ext)
+        return any(self.db.execute("SELECT 1 FROM processed WHERE output=?", (p,)).fetchone() for p in paths)
+
+    def mark(self, key, state, output=None, message=''):
+        """상태 기록. error면 시도 횟수를 하나 올린다."""
+        row = self.db.execute("SELECT attempts FROM processed WHERE path=? AND size=? AND mtime_ns=?", key).fetchone()
+        attempts = (row[0] if row else 0) + (state == 'error')
+        self.db.execute("INSERT OR REPLACE INTO processed VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        key + (output and os.path.abspath(output), state, message,
+                               datetime.now().isoformat(timespec='seconds'), attempts))
+        self.db.commit()
+
+    def recover_interrupted(self):
+        """지난 실행에서 끝나지 못한 작업: 만들다 만 임시 출력은 지우고 다시 처리 대상으로"""
+        rows = self.db.execute("SELECT path, size, mtime_ns, output FROM processed WHERE state='running'").fetchall()
+        for path, size, mtime_ns, output in rows:
+            # 출력 경로 자체는 완료 뒤에만 생기므로 건드리지 않음
+            partial = engine.partial_output_path(output) if output else None
+            if partial and os.path.exists(partial):
+                os.remove(partial)
+            self.db.execute("DELETE FROM processed WHERE path=? AND size=? AND mtime_ns=?", (path, size, mtime_ns))
+        # 규칙을 고치고 다시 시작했을 수도 있으므로 실패했던 파일도 처음부터 다시 시도
+        self.db.execute("UPDATE processed SET attempts=0 WHERE state='error'")
+        self.db.commit()
+        return len(rows)
+
+    def close(self):
+        self.db.close()
+
+# ==========================================
+# 3. 감시 루프
+# ==========================================
+def _ignore_interrupt():
+    # 쉬고 있는 워커는 Ctrl+C에 조용히 남아 있다가 풀 종료와 함께 끝남
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def process_file(source, output, rule, start, end):
+    """워커 프로세스에서 실행. 실패하면 예외가 그대로 부모로 전달된다."""
+    # 작업 중에는 Ctrl+C로 ffmpeg를 멈추고 만들다 만 파일을 지움 (엔진에서 처리)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        engine.export(source, output, start, end, rule['crop'], rule['mode'], rule['fast_trim'],
+                      encoder=rule['encoder'])
+    finally:
+        _ignore_interrupt()
+    return output
+
+
+class FolderWatcher:
+    def __init__(self, rule, log=print):
+        self.rule = rule
+        self.log = log
+        os.makedirs(rule['output_dir'], exist_ok=True)
+        self.state = WatchState(rule['state_db'] or os.path.join(engine.cache_dir(), 'watch_state.sqlite'))
+        self.seen = {}     # 경로 -> (크기, 수정 시각, 처음 그 상태로 본 시각, 열기 실패 횟수)
+        self.running = {}  # future -> (파일 키, 출력 경로)
+
+    def candidates(self):
+        try:
+            names = sorted(os.listdir(self.rule['watch']))
+        except OSError as e:
+            self.log(f"감시 폴더를 읽을 수 없습니다: {e}")
+            return []
+        paths = []
+        for name in names:
+            path = os.path.join(self.rule['watch'], name)
+            if (os.path.isfile(path) and any(fnmatch.fnmatch(name.lower(), p.lower()) for p in self.rule['patterns'])
+                    and not self.state.is_output(path)):
+                paths.append(path)
+        return paths
+
+    def ready_files(self, now, wait_settle=True, skip=()):
+        """다 써진 것으로 보이는 새 파일들 [(파일 키, 경로, 미디어 정보)]. skip은 이미 대기/처리 중인 경로."""
+        ready = []
+        for path in self.candidates():
+            try:
+                key = WatchState.file_key(path)
+            except OSError:
+                continue
+            if key[0] in skip or self.state.should_skip(key):
+                continue
+            size, mtime = key[1], key[2]
+            prev = self.seen.get(path)
+            if prev is None or prev[:2] != (size, mtime):
+                self.seen[path] = (size, mtime, now, 0)
+                if wait_settle:
+                    continue
+                prev = self.seen[path]
+            if wait_settle and now - prev[2] < self.rule['settle_seconds']:
+                continue
+            try:
+                info = engine.probe_media(path)
+                if info['duration'] <= 0:
+                    raise engine.FFmpegError("길이를 알 수 없음")
+            except Exception as e:
+                # 아직 moov가 없는 mp4 등: 몇 번 더 기다렸다가 포기
+                attempts = prev[3] + 1
+                self.seen[path] = (size, mtime, now, attempts)
+                if attempts >= PROBE_ATTEMPTS or not wait_settle:
+                    self.state.mark(key, 'error', message=f"열 수 없는 파일: {e}")
+                    self.log(f"건너뜀: {os.path.basename(path)} ({e})")
+                continue
+            self.seen.pop(path, None)
+            ready.append((key, path, info))
+        return ready
+
+    def submit(self, pool, key, path, info):
+        start = self.rule['trim_head']
+        end = info['duration'] - self.rule['trim_tail']
+        if end - start <= 0.1:
+            self.state.mark(key, 'error', message="앞/뒤를 자르고 나면 남는 구간이 없습니다.")
+            self.log(f"건너뜀: {os.path.basename(path)} (남는 구간 없음)")
+            return
+        output = numbered_output_path(self.rule, path, {out for _, out in self.running.values()})
+        self.state.mark(key, 'running', output)
+        self.running[pool.submit(process_file, path, output, self.rule, start, end)] = (key, output)
+        self.log(f"처리 시작: {os.path.basename(path)} -> {os.path.basename(output)}")
+
+    def collect(self, done):
+        for future in done:
+            key, output = self.running.pop(future)
+            try:
+                future.result()
+            except Exception as e:
+                self.state.mark(key, 'error', output, str(e))
+                self.log(f"실패: {os.path.basename(key[0])} ({e})")
+            else:
+                self.state.mark(key, 'done', output)
+                self.log(f"완료: {os.path.basename(output)}")
+
+    def run(self, once=False):
+        """once면 지금 폴더에 있는 파일만 (다 써졌는지 기다리지 않고) 처리하고 끝낸다."""
+        recovered = self.state.recover_interrupted()
+        if recovered:
+            self.log(f"지난 실행에서 중단된 {recovered}개 작업을 다시 처리합니다.")
+        self.log(f"감시 시작: {self.rule['watch']} -> {self.rule['output_dir']} "
+                 f"({self.rule['mode']}, 동시 {self.rule['workers']}개)")
+        backlog = []  # 다 써졌지만 워커가 모자라 기다리는 파일
+        pool = ProcessPoolExecutor(max_workers=self.rule['workers'], mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_ignore_interrupt)
+        try:
+            while True:
+                skip = {path for _, path, _ in backlog} | {key[0] for key, _ in self.running.values()}
+                backlog += self.ready_files(time.monotonic(), wait_settle=not once, skip=skip)
+                while backlog and len(self.running) < self.rule['workers']:
+                    self.submit(pool, *backlog.pop(0))
+                if once and not backlog and not self.running:
+                    break
+                if self.running:
+                    done, _ = wait(self.running, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+                    self.collect(done)
+                else:
+                    time.sleep(POLL_SECONDS)
+        except KeyboardInterrupt:
+            # 워커도 같은 Ctrl+C를 받아 만들다 만 파일을 지운다. DB의 running 행은 다음 실행 때 다시 처리
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            pool.shutdown(wait=True)
+            self.state.close()
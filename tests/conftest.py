@@ -0,0 +1,60 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import solcutter_engine as engine  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """테스트마다 빈 캐시 폴더 (probe/프레임 인덱스/조각 캐시가 다른 테스트와 섞이지 않게)"""
+    path = tmp_path / 'cache'
+    monkeypatch.setenv('SOLCUTTER_CACHE_DIR', str(path))
+    return path
+
+
+def _ffmpeg():
+    try:
+        return engine.get_ffmpeg_exe()
+    except engine.FFmpegError:
+        pytest.skip("ffmpeg 없음")
+
+
+def _generate(path, args):
+    subprocess.run([_ffmpeg(), '-hide_banner', '-loglevel', 'error', '-y'] + args + [str(path)], check=True)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def media_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp('media')
+
+
+@pytest.fixture(scope='session')
+def video(media_dir):
+    """12초, 30fps, 1초마다 키프레임, B프레임 있음 (x264 기본값) + AAC 오디오"""
+    return _generate(media_dir / 'video.mp4',
+                     ['-f', 'lavfi', '-i', 'testsrc2=size=320x240:rate=30',
+                      '-f', 'lavfi', '-i', 'sine=frequency=440:sample_rate=48000',
+                      '-t', '12', '-c:v', 'libx264', '-preset', 'ultrafast', '-g', '30', '-bf', '2',
+                      '-pix_fmt', 'yuv420p', '-c:a', 'aac'])
+
+
+@pytest.fixture(scope='session')
+def audio(media_dir):
+    return _generate(media_dir / 'audio.m4a',
+                     ['-f', 'lavfi', '-i', 'sine=frequency=440:sample_rate=48000', '-t', '2', '-c:a', 'aac'])
+
+
+@pytest.fixture(scope='session')
+def offset_video(media_dir):
+    """8초, 컨테이너 시작 시각 2초 (캠코더 TS/MTS처럼 start가 0이 아닌 파일), 키프레임은 0 / 2.5 / 5초"""
+    return _generate(media_dir / 'offset.mkv',
+                     ['-f', 'lavfi', '-i', 'testsrc2=size=320x240:rate=30', '-t', '8',
+                      '-c:v', 'libx264', '-preset', 'ultrafast', '-bf', '2', '-pix_fmt', 'yuv420p',
+                      '-g', '1000', '-sc_threshold', '0', '-force_key_frames', '0,2.5,5',
+                      '-output_ts_offset', '2'])
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+import solcutter_engine as engine
+
+
+def test_chunk_ranges_split_on_keyframes():
+    keyframes = [float(t) for t in range(300)]
+    ranges = engine.chunk_ranges(0.0, 300.0, keyframes)
+    assert ranges[0][0] == 0.0 and ranges[-1][1] == 300.0
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(start in keyframes for start, _ in ranges[1:])
+    assert 16 <= len(ranges) <= 40
+
+
+def test_chunk_ranges_merges_short_tail_and_respects_minimum():
+    ranges = engine.chunk_ranges(0.0, 12.0, [float(t) for t in range(12)])
+    assert ranges == [(0.0, 5.0), (5.0, 12.0)]
+    assert engine.chunk_ranges(3.0, 4.0, [0.0, 2.0]) == [(3.0, 4.0)]
+
+
+def test_chunk_ranges_long_media_capped():
+    ranges = engine.chunk_ranges(0.0, 3600.0, [float(t) for t in range(0, 3600, 2)])
+    assert max(b - a for a, b in ranges) <= engine.CHUNK_SECONDS + 2
+
+
+def test_chunked_export_resumes_from_manifest(video, tmp_path, monkeypatch):
+    output = str(tmp_path / 'out.mkv')
+    job = engine.new_export_job(video, output, 0.0, 0.0, None, 'video', 'off',
+                                encoder=engine.encoder_settings('draft'), chunk_workers=1)
+    real_render = engine.render_range
+    calls = []
+
+    def render_then_stop(src, dst, start, end, *args, **kwargs):
+        calls.append((start, end))
+        if len(calls) > 1:
+            raise engine.ExportCanceled()
+        real_render(src, dst, start, end, *args, **kwargs)
+
+    monkeypatch.setattr(engine, 'render_range', render_then_stop)
+    with pytest.raises(engine.ExportCanceled):
+        engine.perform_export(dict(job), lambda p, s=None: None, lambda m: None)
+    assert not os.path.exists(output)
+    work_dir = engine.chunk_work_dir(dict(job, output=engine.partial_output_path(output)), 0.0, 12.0)
+    manifest = engine._read_json(os.path.join(work_dir, 'manifest.json'))
+    assert manifest['ranges'] == [[0.0, 5.0], [5.0, 12.0]]
+    assert manifest['done'] == [0]
+
+    calls.clear()
+    monkeypatch.setattr(engine, 'render_range', lambda *a, **k: (calls.append(a[2:4]), real_render(*a, **k)))
+    engine.perform_export(dict(job), lambda p, s=None: None, lambda m: None)
+    assert calls == [(5.0, 12.0)]
+    assert len(engine.frame_index(output)['frames']) == 360
+    assert not os.path.exists(work_dir)
@@ -0,0 +1,47 @@
+import pytest
+
+import solcutter_engine as engine
+
+
+def frame_count(path):
+    return len(engine.frame_index(path)['frames'])
+
+
+def export_clips(clips, output):
+    status = []
+    job = engine.new_export_job(clips[0]['file'], output, 0.0, 0.0, None, 'video', 'keyframe', clips=clips)
+    engine.perform_export(job, lambda p, s=None: None, status.append)
+    return status
+
+
+def test_concat_mismatch(video):
+    info = engine.media_info(video)
+    assert engine.concat_mismatch([info, dict(info)], 'out.mp4') is None
+    assert '2번 클립의 fps' in engine.concat_mismatch([info, dict(info, fps=25.0)], 'out.mp4')
+    assert '3번 클립의 acodec' in engine.concat_mismatch([info, info, dict(info, acodec='mp3')], 'out.mkv')
+    assert '.mp3' in engine.concat_mismatch([info, info], 'out.mp3')
+    # 저장 위치를 모르면 컨테이너 검사는 건너뜀
+    assert engine.concat_mismatch([info, info], None) is None
+
+
+def test_concat_mismatch_audio_only(audio):
+    info = engine.media_info(audio)
+    assert engine.concat_mismatch([info, info], 'out.m4a', audio_only=True) is None
+    assert '.mp3에 담을 수 없는' in engine.concat_mismatch([info, info], 'out.mp3', audio_only=True)
+    assert engine.concat_mismatch([info, dict(info, sample_rate=44100)], 'out.m4a', audio_only=True)
+
+
+def test_concat_matching_clips_is_stream_copy(video, tmp_path):
+    output = str(tmp_path / 'joined.mp4')
+    status = export_clips([engine.new_clip(video), engine.new_clip(video, 1.0, 4.0)], output)
+    assert not any("스트림 복사 불가" in s for s in status)
+    assert frame_count(output) == 360 + 90
+
+
+@pytest.mark.parametrize('crop', [None, (0.0, 0.0, 0.5, 0.5)])
+def test_concat_reencodes_only_when_needed(video, offset_video, tmp_path, crop):
+    # offset_video는 오디오가 없어서 형식이 다르고, 크롭도 재인코딩 이유가 됨
+    output = str(tmp_path / 'joined.mp4')
+    status = export_clips([engine.new_clip(video, 1.0, 4.0, crop), engine.new_clip(offset_video, 0.0, 2.0)], output)
+    assert any("스트림 복사 불가" in s for s in status)
+    assert frame_count(output) == 90 + 60
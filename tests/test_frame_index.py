@@ -0,0 +1,34 @@
+import solcutter_engine as engine
+
+
+def test_frame_index(video):
+    index = engine.frame_index(video)
+    assert index['fps'] == 30.0
+    assert len(index['frames']) == 360
+    assert index['frames'][:2] == [0.0, 0.033333]
+    assert index['keyframes'] == [float(t) for t in range(12)]
+
+
+def test_frame_index_is_relative_to_container_start(offset_video):
+    # ffmpeg는 -copyts 없이 읽은 시각을 이미 start 기준 0으로 맞추므로 start를 다시 빼면 안 됨
+    assert engine.media_info(offset_video)['start'] == 2.0
+    index = engine.frame_index(offset_video)
+    assert index['frames'][0] == 0.0
+    assert len(index['frames']) == 240
+    assert index['keyframes'] == [0.0, 2.5, 5.0]
+
+
+def test_copy_trim_on_offset_source(offset_video, tmp_path):
+    info = engine.media_info(offset_video)
+    index = engine.frame_index(offset_video)
+    dst = str(tmp_path / 'trim.mkv')
+    actual = engine.stream_copy_trim(offset_video, dst, 3.5, 6.0, info, index['keyframes'],
+                                     frames=index['frames'])
+    assert actual == 2.5
+    assert len(engine.frame_index(dst)['frames']) == 105  # 2.5 ~ 6.0초
+
+
+def test_chunk_ranges_on_offset_source(offset_video):
+    ranges = engine.chunk_ranges(0.0, 8.0, engine.list_keyframes(offset_video))
+    assert ranges == [(0.0, 5.0), (5.0, 8.0)]
+    assert all(start in (0.0, 2.5, 5.0) for start, _ in ranges)
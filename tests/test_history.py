@@ -0,0 +1,86 @@
+import pytest
+
+# EditHistory는 GUI 모듈에 있으므로 PyQt6(QtMultimedia 포함)가 없는 환경에서는 건너뜀
+solcutter = pytest.importorskip("solcutter", exc_type=ImportError)
+
+
+def state(start, end=0.0):
+    return {'start': start, 'end': end, 'crop': None, 'segments': []}
+
+
+def test_undo_redo():
+    history = solcutter.EditHistory()
+    history.reset(state(0.0))
+    assert history.record(state(1.0), "시작점") and history.record(state(1.0, 5.0), "종료점")
+    assert history.undo_label() == "종료점"
+    assert history.undo() == state(1.0)
+    assert history.undo() == state(0.0)
+    assert history.undo() is None and not history.can_undo()
+    assert history.redo_label() == "시작점"
+    assert history.redo() == state(1.0)
+    assert history.redo() == state(1.0, 5.0)
+    assert history.redo() is None
+
+
+def test_record_ignores_unchanged_state_and_drops_redo():
+    history = solcutter.EditHistory()
+    history.reset(state(0.0))
+    assert not history.record(state(0.0), "같음")
+    history.record(state(1.0), "a")
+    history.record(state(2.0), "b")
+    history.undo()
+    history.record(state(3.0), "c")
+    assert not history.can_redo()
+    assert history.undo() == state(1.0)
+
+
+def test_recorded_state_is_copied():
+    history = solcutter.EditHistory()
+    history.reset(state(0.0))
+    current = state(1.0)
+    history.record(current, "a")
+    current['segments'].append({'start': 0.0, 'end': 1.0, 'crop': None})
+    history.record(state(2.0), "b")
+    assert history.undo() == state(1.0)
+
+
+def test_modified_tracks_saved_position():
+    history = solcutter.EditHistory()
+    history.reset(state(0.0))
+    assert not history.is_modified()
+    history.record(state(1.0), "a")
+    assert history.is_modified()
+    history.mark_saved()
+    history.undo()
+    assert history.is_modified()
+    history.redo()
+    assert not history.is_modified()
+    # 저장한 상태를 되돌린 뒤 새로 편집하면 저장 상태로는 다시 돌아갈 수 없음
+    history.undo()
+    history.record(state(5.0), "b")
+    history.undo()
+    history.redo()
+    assert history.is_modified()
+
+
+def test_history_limit():
+    history = solcutter.EditHistory()
+    history.reset(state(0.0))
+    for i in range(1, solcutter.EditHistory.LIMIT + 50):
+        history.record(state(float(i)), "편집")
+    assert len(history.entries) == solcutter.EditHistory.LIMIT
+    while history.can_undo():
+        history.undo()
+    assert history.entries[history.pos][1] == state(50.0)
+
+
+def test_returned_state_is_copied_and_reset_clears():
+    history = solcutter.EditHistory()
+    history.reset(state(0.0))
+    history.record(state(1.0), "a")
+    restored = history.undo()
+    restored['segments'].append({'start': 0.0, 'end': 1.0, 'crop': None})
+    assert history.redo() == state(1.0)
+    assert history.undo() == state(0.0)
+    history.reset(state(9.0))
+    assert not history.can_undo() and not history.can_redo() and not history.is_modified()
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+import solcutter_engine as engine
+
+
+def frame_count(path):
+    return len(engine.frame_index(path)['frames'])
+
+
+def test_failed_export_keeps_existing_output(audio, tmp_path):
+    output = tmp_path / 'precious.mp4'
+    output.write_bytes(b'precious')
+    job = engine.new_export_job(audio, str(output), 0.0, 0.0, None, 'video', 'keyframe')
+    with pytest.raises(ValueError):
+        engine.perform_export(job, lambda p, s=None: None, lambda m: None)
+    assert output.read_bytes() == b'precious'
+    assert not os.path.exists(engine.partial_output_path(str(output)))
+
+
+def test_output_equal_to_input_is_rejected(video, tmp_path):
+    src = tmp_path / 'same.mp4'
+    src.write_bytes(open(video, 'rb').read())
+    before = src.stat()
+    job = engine.new_export_job(str(src), str(src), 1.0, 5.0, None, 'video', 'keyframe')
+    with pytest.raises(ValueError, match="원본과 같습니다"):
+        engine.perform_export(job, lambda p, s=None: None, lambda m: None)
+    assert (src.stat().st_size, src.stat().st_mtime_ns) == (before.st_size, before.st_mtime_ns)
+
+    clips = [engine.new_clip(video), engine.new_clip(str(src))]
+    job = engine.new_export_job(video, str(src), 0.0, 0.0, None, 'video', 'keyframe', clips=clips)
+    with pytest.raises(ValueError, match="원본과 같습니다"):
+        engine.check_output_paths(job)
+
+
+def test_canceled_export_keeps_existing_output(video, tmp_path):
+    output = tmp_path / 'out.mp4'
+    output.write_bytes(b'old')
+
+    def progress(percent, stats=None):
+        raise engine.ExportCanceled()
+
+    job = engine.new_export_job(video, str(output), 0.0, 0.0, None, 'video', 'off')
+    with pytest.raises(engine.ExportCanceled):
+        engine.perform_export(job, progress, lambda m: None)
+    assert output.read_bytes() == b'old'
+    assert not os.path.exists(engine.partial_output_path(str(output)))
+
+
+def test_successful_export_replaces_output(video, tmp_path):
+    output = tmp_path / 'out.mp4'
+    output.write_bytes(b'old')
+    job = engine.new_export_job(video, str(output), 1.0, 4.0, None, 'video', 'keyframe')
+    engine.perform_export(job, lambda p, s=None: None, lambda m: None)
+    assert frame_count(str(output)) == 90
+    assert not os.path.exists(engine.partial_output_path(str(output)))
@@ -0,0 +1,98 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import solcutter_engine as engine
+
+INFO = {'duration': 12.0, 'vcodec': 'h264', 'acodec': 'aac'}
+
+
+def make_project(folder):
+    media = folder / 'media'
+    media.mkdir(parents=True)
+    for name in ('a.mp4', 'b.mp4'):
+        (media / name).write_bytes(b'data ' + name.encode())
+    source = engine.project_source(str(media / 'a.mp4'), INFO)
+    return {
+        'source': source,
+        'edit': {'start': 1.5, 'end': 9.0, 'crop': [0.1, 0.1, 0.5, 0.5],
+                 'segments': [engine.new_segment(2.0, 3.0)], 'combine': False},
+        'export': {'fast_trim': 'keyframe'},
+        'view': {'position': 2.0},
+        'clips': [{'source': source, 'edit': {'start': 1.5, 'end': 9.0}},
+                  {'source': engine.project_source(str(media / 'b.mp4'), INFO), 'edit': {'start': 0.0, 'end': 0.0}}],
+        'current': 0,
+    }
+
+
+def test_project_round_trip(tmp_path):
+    project = make_project(tmp_path / 'proj')
+    path = str(tmp_path / 'proj' / 'edit.solcut')
+    engine.save_project(path, project)
+    loaded = engine.load_project(path)
+    for key in ('edit', 'export', 'view', 'current'):
+        assert loaded[key] == project[key]
+    assert loaded['source']['path'] == project['source']['path']
+    assert loaded['source']['info'] == INFO
+    assert [clip['source']['path'] for clip in loaded['clips']] == [c['source']['path'] for c in project['clips']]
+    assert [clip['edit'] for clip in loaded['clips']] == [c['edit'] for c in project['clips']]
+
+
+def test_project_moved_folder_uses_relative_paths(tmp_path):
+    engine.save_project(str(tmp_path / 'proj' / 'edit.solcut'), make_project(tmp_path / 'proj'))
+    shutil.move(str(tmp_path / 'proj'), str(tmp_path / 'moved'))
+    loaded = engine.load_project(str(tmp_path / 'moved' / 'edit.solcut'))
+    assert loaded['source']['path'] == os.path.abspath(tmp_path / 'moved' / 'media' / 'a.mp4')
+    assert loaded['clips'][1]['source']['path'] == os.path.abspath(tmp_path / 'moved' / 'media' / 'b.mp4')
+    # 캐시 키에 경로가 들어가므로 옮긴 원본은 다시 probe
+    assert loaded['source']['info'] is None
+
+
+def test_project_changed_source_drops_cached_info(tmp_path):
+    path = str(tmp_path / 'proj' / 'edit.solcut')
+    engine.save_project(path, make_project(tmp_path / 'proj'))
+    with open(tmp_path / 'proj' / 'media' / 'a.mp4', 'ab') as f:
+        f.write(b'more')
+    loaded = engine.load_project(path)
+    assert loaded['source']['info'] is None
+    assert loaded['clips'][1]['source']['info'] == INFO
+
+
+def test_project_missing_source(tmp_path):
+    path = str(tmp_path / 'proj' / 'edit.solcut')
+    engine.save_project(path, make_project(tmp_path / 'proj'))
+    os.remove(tmp_path / 'proj' / 'media' / 'b.mp4')
+    with pytest.raises(ValueError, match="원본 파일을 찾을 수 없습니다"):
+        engine.load_project(path)
+
+
+def test_reopen_does_not_reprobe_or_rescan(video, tmp_path, monkeypatch):
+    src = tmp_path / 'proj' / 'rec.mp4'
+    src.parent.mkdir()
+    shutil.copy(video, src)
+    index = engine.frame_index(str(src))
+    path = str(tmp_path / 'proj' / 'edit.solcut')
+    engine.save_project(path, {'source': engine.project_source(str(src)), 'edit': {'start': 1.0, 'end': 4.0}})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("다시 열 때 ffmpeg를 띄움")
+
+    monkeypatch.setattr(engine, 'probe_media', fail)
+    monkeypatch.setattr(engine, 'scan_frames', fail)
+    loaded = engine.load_project(path)
+    assert loaded['source']['info'] == engine.media_info(str(src))
+    assert loaded['source']['key'] == engine.media_cache_key(str(src))
+    assert engine.frame_index(loaded['source']['path']) == index
+
+
+def test_newer_project_version_is_rejected(tmp_path):
+    path = str(tmp_path / 'proj' / 'edit.solcut')
+    engine.save_project(path, make_project(tmp_path / 'proj'))
+    project = engine._read_json(path)
+    project['version'] = engine.PROJECT_VERSION + 1
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(project, f)
+    with pytest.raises(ValueError, match="새로운 버전"):
+        engine.load_project(path)
@@ -0,0 +1,54 @@
+import subprocess
+
+import solcutter_engine as engine
+
+
+def frame_count(path):
+    return len(engine.frame_index(path)['frames'])
+
+
+def packet_hashes(path):
+    """비디오 패킷별 MD5 (디코딩 없이 -c copy로 계산하므로 다시 인코딩된 패킷만 달라짐)"""
+    out = subprocess.run([engine.get_ffmpeg_exe(), '-v', 'error', '-i', path, '-map', '0:v:0',
+                          '-c', 'copy', '-f', 'framemd5', '-'], capture_output=True, text=True, check=True).stdout
+    return [line.rsplit(',', 1)[1].strip() for line in out.splitlines() if line and not line.startswith('#')]
+
+
+def test_stream_copy_trim_snaps_to_previous_keyframe(video, tmp_path):
+    info = engine.media_info(video)
+    index = engine.frame_index(video)
+    assert index['keyframes'][:3] == [0.0, 1.0, 2.0]
+    dst = str(tmp_path / 'trim.mp4')
+    actual = engine.stream_copy_trim(video, dst, 2.5, 5.0, info, index['keyframes'], 'keyframe',
+                                     frames=index['frames'])
+    assert actual == 2.0
+    assert frame_count(dst) == 90  # 2.0 ~ 5.0초
+
+
+def test_stream_copy_trim_keyframe_boundaries_do_not_overlap(video, tmp_path):
+    info = engine.media_info(video)
+    index = engine.frame_index(video)
+    parts = [str(tmp_path / 'a.mp4'), str(tmp_path / 'b.mp4')]
+    engine.stream_copy_trim(video, parts[0], 0.0, 6.0, info, index['keyframes'], frames=index['frames'])
+    engine.stream_copy_trim(video, parts[1], 6.0, 12.0, info, index['keyframes'], frames=index['frames'])
+    assert [frame_count(p) for p in parts] == [180, 180]
+
+
+def test_smart_trim_reencodes_only_head(video, tmp_path):
+    info = engine.media_info(video)
+    index = engine.frame_index(video)
+    dst = str(tmp_path / 'smart.mp4')
+    actual = engine.stream_copy_trim(video, dst, 2.5, 5.0, info, index['keyframes'], 'smart',
+                                     frames=index['frames'])
+    assert actual == 2.5
+    out = engine.frame_index(dst)
+    assert len(out['frames']) == 75  # 2.5 ~ 5.0초
+    # 머리 15프레임(2.5 ~ 3.0초)만 재인코딩, 3.0초 키프레임부터는 원본 패킷 그대로
+    assert out['keyframes'][:2] == [0.0, 0.5]
+    source = set(packet_hashes(video))
+    packets = packet_hashes(dst)
+    head, body = packets[:15], packets[15:]
+    assert not any(h in source for h in head)
+    # 키프레임은 컨테이너를 옮기며 SPS/PPS가 패킷 안에 붙으므로 나머지 패킷만 비교
+    keys = {round(k * 30) - 15 for k in out['keyframes'] if k >= 0.5}
+    assert all(h in source for i, h in enumerate(body) if i not in keys)
@@ -0,0 +1,74 @@
+import shutil
+
+import pytest
+
+import solcutter_engine as engine
+import solcutter_watch
+
+
+def make_rule(tmp_path, **record):
+    record = dict({'watch': 'in', 'state_db': 'state.sqlite', 'patterns': ['*.mp4', '*.mkv'],
+                   'naming': '{stem}_out', 'ext': '.mkv', 'profile': 'draft'}, **record)
+    (tmp_path / 'in').mkdir()
+    return solcutter_watch.rule_from_record(record, str(tmp_path))
+
+
+def run_once(rule):
+    logs = []
+    solcutter_watch.FolderWatcher(rule, log=logs.append).run(once=True)
+    return logs
+
+
+def rows(rule):
+    state = solcutter_watch.WatchState(rule['state_db'])
+    try:
+        return state.db.execute("SELECT path, output, state, message FROM processed ORDER BY path").fetchall()
+    finally:
+        state.close()
+
+
+def test_output_folder_is_watch_folder(video, tmp_path, monkeypatch):
+    # 처리 중에도 폴더를 자주 다시 훑어서 만들고 있는 .part 출력이 보이는 동안 검사되게 함
+    monkeypatch.setattr(solcutter_watch, 'POLL_SECONDS', 0.05)
+    rule = make_rule(tmp_path, output_dir='in', fast_trim='off', trim_head=1)
+    shutil.copy(video, tmp_path / 'in' / 'rec.mp4')
+    logs = run_once(rule)
+    assert [(state, output) for _, output, state, _ in rows(rule)] == [('done', str(tmp_path / 'in' / 'rec_out.mkv'))]
+    assert sum(line.startswith("처리 시작") for line in logs) == 1
+    assert sorted(p.name for p in (tmp_path / 'in').iterdir()) == ['rec.mp4', 'rec_out.mkv']
+    assert len(engine.frame_index(str(tmp_path / 'in' / 'rec_out.mkv'))['frames']) == 330
+
+    # 다시 돌려도 원본과 출력 모두 건너뜀
+    assert not any(line.startswith("처리 시작") for line in run_once(rule))
+
+
+def test_rule_validation(tmp_path):
+    with pytest.raises(ValueError, match="자르기 방식"):
+        make_rule(tmp_path, fast_trim='fast')
+    with pytest.raises(ValueError, match="모드"):
+        solcutter_watch.rule_from_record({'watch': 'in', 'mode': 'gif'}, str(tmp_path))
+    rule = solcutter_watch.rule_from_record({'watch': 'in', 'mode': 'audio'}, str(tmp_path))
+    assert (rule['ext'], rule['output_dir']) == ('.mp3', str(tmp_path / 'in' / 'out'))
+
+
+def test_failed_file_is_retried(tmp_path, monkeypatch):
+    rule = make_rule(tmp_path)
+    (tmp_path / 'in' / 'broken.mp4').write_bytes(b'not a video')
+    key = solcutter_watch.WatchState.file_key(str(tmp_path / 'in' / 'broken.mp4'))
+    run_once(rule)
+    assert [state for _, _, state, _ in rows(rule)] == ['error']
+
+    state = solcutter_watch.WatchState(rule['state_db'])
+    try:
+        # 방금 실패했으면 기다리고, 기다린 뒤에는 ERROR_RETRIES번까지만 다시 시도
+        assert state.should_skip(key)
+        monkeypatch.setattr(solcutter_watch, 'RETRY_SECONDS', 0.0)
+        assert not state.should_skip(key)
+        for _ in range(solcutter_watch.ERROR_RETRIES - 1):
+            state.mark(key, 'error', message="실패")
+        assert state.should_skip(key)
+        # 감시를 다시 시작하면 처음부터 다시 시도
+        state.recover_interrupted()
+        assert not state.should_skip(key)
+    finally:
+        state.close()